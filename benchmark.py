@@ -0,0 +1,323 @@
+"""Offline load test: starts app.py on a local Streamlit server and drives it
+through every sidebar page with N concurrent headless websocket sessions,
+reporting rerun latency percentiles, memory per session and throughput.
+
+    python benchmark.py --sessions 50 --reruns 20
+
+With --startup it instead measures cold starts: time until the server is
+ready, time to first paint of a new session, and import times from
+python -X importtime.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.httpclient import HTTPRequest
+from tornado.websocket import websocket_connect
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(APP_DIR, "app.py")
+PAGES = ["Home", "Understand", "Housing Allocation", "Question", "Influence"]
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    k = (len(values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (k - lower)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, env, stderr=subprocess.DEVNULL):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.headless", "true", "--server.address", "127.0.0.1",
+         "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=APP_DIR, env=env, stdout=subprocess.DEVNULL, stderr=stderr,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Streamlit server did not become healthy")
+
+
+def rss_bytes(pid):
+    # Resident memory of the server process; Linux only
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+class Session:
+    # Minimal stand-in for the browser: sends rerun requests that click a
+    # sidebar navigation button and waits for the script to finish.
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.conn = None
+        self.navigation_ids = {}
+        self.first_paint = None
+
+    async def connect(self):
+        url = self.base_url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.conn = await websocket_connect(HTTPRequest(url, headers={"Origin": self.base_url}),
+                                            max_message_size=200 * 1024 * 1024)
+
+    async def rerun(self, page=None):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        if page is not None:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.navigation_ids[page]
+            widget.trigger_value = True
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+
+        received = 0
+        while True:
+            data = await self.conn.read_message()
+            if data is None:
+                raise RuntimeError("Server closed the connection")
+            received += len(data)
+            fwd = ForwardMsg()
+            fwd.ParseFromString(data)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                if element.WhichOneof("type") == "button" and element.button.label in PAGES:
+                    self.navigation_ids[element.button.label] = element.button.id
+                elif element.WhichOneof("type") == "markdown" and self.first_paint is None:
+                    self.first_paint = time.perf_counter()
+                elif element.WhichOneof("type") == "exception":
+                    raise RuntimeError(element.exception.message)
+            elif kind == "script_finished":
+                if fwd.script_finished == ForwardMsg.FINISHED_SUCCESSFULLY:
+                    return received
+
+    def close(self):
+        self.conn.close()
+
+
+async def drive(session, reruns, offset, latencies, payloads, errors):
+    for i in range(reruns):
+        page = PAGES[(offset + i) % len(PAGES)]
+        start = time.perf_counter()
+        try:
+            received = await session.rerun(page)
+        except Exception as exc:
+            errors.append(f"{page}: {exc}")
+            continue
+        latencies.setdefault(page, []).append(time.perf_counter() - start)
+        payloads.setdefault(page, []).append(received)
+
+
+async def run(base_url, sessions, reruns, server_pid=None):
+    rss_before = rss_bytes(server_pid) if server_pid else None
+    clients = [Session(base_url) for _ in range(sessions)]
+    for client in clients:
+        await client.connect()
+    await asyncio.gather(*(client.rerun() for client in clients))
+    rss_after = rss_bytes(server_pid) if server_pid else None
+
+    latencies, payloads, errors = {}, {}, []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        drive(client, reruns, i, latencies, payloads, errors) for i, client in enumerate(clients)
+    ))
+    wall = time.perf_counter() - start
+    for client in clients:
+        client.close()
+
+    def summary(values, sizes):
+        return {
+            "reruns": len(values),
+            "mean_ms": 1000 * statistics.fmean(values) if values else 0.0,
+            "p50_ms": 1000 * percentile(values, 50),
+            "p95_ms": 1000 * percentile(values, 95),
+            "p99_ms": 1000 * percentile(values, 99),
+            "mean_kib_received": statistics.fmean(sizes) / 1024 if sizes else 0.0,
+        }
+
+    everything = [value for values in latencies.values() for value in values]
+    sizes = [size for values in payloads.values() for size in values]
+    memory = None
+    if rss_before is not None and rss_after is not None:
+        memory = (rss_after - rss_before) / sessions / 1024
+    return {
+        "sessions": sessions,
+        "reruns_per_session": reruns,
+        "wall_seconds": wall,
+        "throughput_reruns_per_second": len(everything) / wall,
+        "memory_per_session_kib": memory,
+        "overall": summary(everything, sizes),
+        "pages": {page: summary(latencies[page], payloads[page]) for page in PAGES if page in latencies},
+        "errors": errors,
+    }
+
+
+def print_report(report):
+    print(f"{report['sessions']} sessions x {report['reruns_per_session']} reruns "
+          f"in {report['wall_seconds']:.2f}s")
+    print(f"throughput: {report['throughput_reruns_per_second']:.1f} reruns/s")
+    if report["memory_per_session_kib"] is not None:
+        print(f"memory per session: {report['memory_per_session_kib']:.1f} KiB (server RSS)")
+    print()
+    print(f"{'page':<20}{'reruns':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'KiB/rerun':>11}")
+    rows = list(report["pages"].items()) + [("overall", report["overall"])]
+    for page, stats in rows:
+        print(f"{page:<20}{stats['reruns']:>8}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+              f"{stats['p99_ms']:>10.1f}{stats['mean_kib_received']:>11.1f}")
+    for error in report["errors"]:
+        print(f"error: {error}", file=sys.stderr)
+
+
+def parse_importtime(lines):
+    # Cumulative milliseconds of each top-level import in -X importtime
+    # output; nested imports are indented below the one that caused them
+    imports = {}
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.rstrip("\n")[1:]
+        if name.startswith(" ") or not cumulative.strip().isdigit():
+            continue
+        imports[name] = imports.get(name, 0) + int(cumulative) / 1000
+    return imports
+
+
+async def first_run(session):
+    await session.connect()
+    await session.rerun()
+    session.close()
+
+
+def startup(runs):
+    app_modules = {name[:-3] for name in os.listdir(APP_DIR) if name.endswith(".py")}
+    app_modules |= {name for name in os.listdir(APP_DIR) if os.path.isdir(os.path.join(APP_DIR, name))}
+    results = []
+    for _ in range(runs):
+        env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1")
+        env.setdefault("AIANDME_DATA_DIR", tempfile.mkdtemp(prefix="aiandme-bench-"))
+        port = free_port()
+        with tempfile.TemporaryFile("w+") as log:
+            launched = time.perf_counter()
+            server = start_server(port, env, stderr=log)
+            ready = time.perf_counter()
+            try:
+                session = Session(f"http://127.0.0.1:{port}")
+                asyncio.run(first_run(session))
+                finished = time.perf_counter()
+            finally:
+                server.terminate()
+                server.wait()
+            log.seek(0)
+            imports = parse_importtime(log)
+        results.append({
+            "ready_ms": 1000 * (ready - launched),
+            "first_paint_ms": 1000 * (session.first_paint - launched),
+            "first_run_ms": 1000 * (finished - launched),
+            "import_ms": sum(imports.values()),
+            "app_import_ms": sum(ms for name, ms in imports.items() if name.split(".")[0] in app_modules),
+            "imports": imports,
+        })
+
+    def median(key):
+        return statistics.median(result[key] for result in results)
+
+    names = {name for result in results for name in result["imports"]}
+    imports = {name: statistics.median(result["imports"].get(name, 0) for result in results) for name in names}
+    return {
+        "runs": runs,
+        **{key: median(key) for key in ("ready_ms", "first_paint_ms", "first_run_ms", "import_ms", "app_import_ms")},
+        "slowest_imports": dict(sorted(imports.items(), key=lambda item: -item[1])[:15]),
+    }
+
+
+def print_startup_report(report):
+    print(f"cold start, median of {report['runs']} runs (ms since the server process was launched)")
+    print(f"{'server ready':<24}{report['ready_ms']:>10.0f}")
+    print(f"{'first paint':<24}{report['first_paint_ms']:>10.0f}")
+    print(f"{'first run finished':<24}{report['first_run_ms']:>10.0f}")
+    print()
+    print(f"{'imports (total)':<24}{report['import_ms']:>10.0f}")
+    print(f"{'imports (app modules)':<24}{report['app_import_ms']:>10.0f}")
+    print()
+    print(f"{'slowest imports':<44}{'ms':>10}")
+    for name, ms in report["slowest_imports"].items():
+        print(f"{name:<44}{ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent simulated sessions")
+    parser.add_argument("--reruns", type=int, default=10, help="page switches per session")
+    parser.add_argument("--url", help="benchmark an already running server instead of starting one")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--startup", type=int, nargs="?", const=3, metavar="RUNS",
+                        help="measure cold starts instead, over RUNS fresh servers (default 3)")
+    args = parser.parse_args()
+
+    if args.startup:
+        if args.url:
+            parser.error("--startup starts its own servers and can't be combined with --url")
+        report = startup(args.startup)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_startup_report(report)
+        return 0
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        # Keep benchmark submissions out of the real database
+        env = dict(os.environ)
+        env.setdefault("AIANDME_DATA_DIR", tempfile.mkdtemp(prefix="aiandme-bench-"))
+        port = free_port()
+        server = start_server(port, env)
+        base_url = f"http://127.0.0.1:{port}"
+    try:
+        report = asyncio.run(run(base_url.rstrip("/"), args.sessions, args.reruns,
+                                 server.pid if server else None))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
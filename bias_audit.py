@@ -0,0 +1,255 @@
+"""Bias audit of housing allocation outcomes. Group fairness metrics
+(disparate impact, equal opportunity and calibration) are computed over
+allocation records read in chunks, with vectorized pandas aggregation per
+chunk, so millions of records are audited in flat memory. Results are cached
+per audit run, in memory and on disk.
+
+    python bias_audit.py --records 5000000
+    python bias_audit.py --csv allocations.csv
+
+A CSV export needs the columns group, in_need (0/1), score (0-1) and
+offered (0/1), one row per anonymized application.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from db import DATA_DIR
+
+AUDIT_DIR = os.path.join(DATA_DIR, "bias_audits")
+
+# Bump when the metrics change, so cached results are recomputed
+METHOD_VERSION = 1
+
+CHUNK_SIZE = 250000
+DEFAULT_RECORDS = 2000000
+DEFAULT_SEED = 2023
+COLUMNS = ["group", "in_need", "score", "offered"]
+
+# Household types audited, with their share of applications in the
+# synthetic data
+GROUPS = {
+    "Single adult": 0.38,
+    "Couple": 0.17,
+    "Couple with children": 0.2,
+    "Single parent": 0.13,
+    "Senior (65+)": 0.12,
+}
+
+# Synthetic data: how often each group is in urgent need, and the offset the
+# simulated model adds to its score (in log-odds). The offset for single
+# parents reproduces the residual bias the 2023 external audit looked at.
+NEED_RATES = {
+    "Single adult": 0.24,
+    "Couple": 0.22,
+    "Couple with children": 0.28,
+    "Single parent": 0.32,
+    "Senior (65+)": 0.26,
+}
+SCORE_OFFSETS = {"Single parent": -0.6}
+# The model sees need as a noisy signal: +SIGNAL or -SIGNAL plus normal noise
+SIGNAL = 1.2
+NOISE = 1.3
+OFFER_THRESHOLD = 0.5
+
+# Four-fifths rule for disparate impact; the other two are absolute
+# differences in rate
+DISPARATE_IMPACT_THRESHOLD = 0.8
+EQUAL_OPPORTUNITY_TOLERANCE = 0.05
+CALIBRATION_TOLERANCE = 0.05
+CALIBRATION_BINS = 10
+FLAGS = ["below_four_fifths", "opportunity_gap", "miscalibrated"]
+
+
+def synthetic_chunks(records=DEFAULT_RECORDS, seed=DEFAULT_SEED, chunk_size=CHUNK_SIZE):
+    # Each chunk has its own generator seeded from (seed, chunk), so the
+    # records of a run are the same every time it is generated
+    groups = list(GROUPS)
+    shares = np.array(list(GROUPS.values()))
+    need_rates = np.array([NEED_RATES[group] for group in groups])
+    offsets = np.array([SCORE_OFFSETS.get(group, 0.0) for group in groups])
+    for index, start in enumerate(range(0, records, chunk_size)):
+        size = min(chunk_size, records - start)
+        rng = np.random.default_rng([seed, index])
+        codes = rng.choice(len(groups), size, p=shares / shares.sum())
+        in_need = rng.random(size) < need_rates[codes]
+        # An unbiased model scores the probability of need given the signal and
+        # the group's need rate; the offsets make it biased
+        signal = np.where(in_need, SIGNAL, -SIGNAL) + rng.normal(0, NOISE, size)
+        prior = np.log(need_rates / (1 - need_rates))[codes]
+        logit = prior + 2 * SIGNAL * signal / NOISE ** 2 + offsets[codes]
+        score = (1 / (1 + np.exp(-logit))).astype(np.float32)
+        yield pd.DataFrame({
+            "group": pd.Categorical.from_codes(codes, groups),
+            "in_need": in_need,
+            "score": score,
+            "offered": score >= OFFER_THRESHOLD,
+        })
+
+
+def csv_chunks(path, chunk_size=CHUNK_SIZE):
+    return pd.read_csv(path, usecols=COLUMNS, chunksize=chunk_size,
+                       dtype={"group": "category", "in_need": bool, "score": np.float32, "offered": bool})
+
+
+def aggregate(chunk):
+    # Counts per group and per (group, score bin); these add up across
+    # chunks, so no chunk is kept after it is aggregated
+    offered = chunk["offered"].astype(bool)
+    in_need = chunk["in_need"].astype(bool)
+    frame = pd.DataFrame({
+        "group": chunk["group"].astype(str),
+        "records": 1,
+        "offered": offered,
+        "in_need": in_need,
+        "offered_in_need": offered & in_need,
+        "bin": np.minimum((chunk["score"] * CALIBRATION_BINS).astype(int), CALIBRATION_BINS - 1),
+        "score": chunk["score"].astype(float),
+    })
+    groups = frame.groupby("group")[["records", "offered", "in_need", "offered_in_need"]].sum()
+    bins = frame.groupby(["group", "bin"])[["records", "in_need", "score"]].sum()
+    return groups, bins
+
+
+def metrics(groups, bins):
+    # Group totals -> one row per group. The reference group is the one
+    # selected most often, as in the four-fifths rule.
+    rows = groups.assign(
+        selection_rate=groups["offered"] / groups["records"],
+        true_positive_rate=groups["offered_in_need"] / groups["in_need"].where(groups["in_need"] > 0),
+        need_rate=groups["in_need"] / groups["records"],
+    )
+    reference = rows["selection_rate"].idxmax()
+    rows["disparate_impact"] = rows["selection_rate"] / rows.at[reference, "selection_rate"]
+    rows["equal_opportunity_gap"] = rows["true_positive_rate"] - rows.at[reference, "true_positive_rate"]
+    # Expected calibration error: the record-weighted gap between the mean
+    # score and the observed need rate of each score bin
+    gap = (bins["score"] - bins["in_need"]).abs()
+    rows["calibration_error"] = gap.groupby(level="group").sum() / rows["records"]
+    rows["below_four_fifths"] = rows["disparate_impact"] < DISPARATE_IMPACT_THRESHOLD
+    rows["opportunity_gap"] = rows["equal_opportunity_gap"].abs() > EQUAL_OPPORTUNITY_TOLERANCE
+    rows["miscalibrated"] = rows["calibration_error"] > CALIBRATION_TOLERANCE
+    rows["flagged"] = rows[FLAGS].any(axis=1)
+    return rows, reference
+
+
+def audit(chunks):
+    started = time.perf_counter()
+    group_parts, bin_parts = [], []
+    for chunk in chunks:
+        groups, bins = aggregate(chunk)
+        group_parts.append(groups)
+        bin_parts.append(bins)
+    if not group_parts:
+        raise ValueError("No allocation records to audit")
+    groups = pd.concat(group_parts).groupby(level="group").sum()
+    bins = pd.concat(bin_parts).groupby(level=["group", "bin"]).sum()
+    rows, reference = metrics(groups, bins)
+    order = {group: i for i, group in enumerate(GROUPS)}
+    rows = rows.sort_index(key=lambda index: index.map(lambda group: order.get(group, len(order))))
+    return {
+        "records": int(groups["records"].sum()),
+        "reference": reference,
+        "seconds": round(time.perf_counter() - started, 3),
+        # Plain Python values, with None for a rate the group has no records for
+        "groups": rows.astype(object).where(rows.notna(), None).reset_index().to_dict("records"),
+    }
+
+
+class BiasAudits:
+    # Audit results by run. A run is identified by its source and parameters
+    # (and the file's size and modification time for CSV exports), so asking
+    # for the same run again reads the cached result instead of recomputing.
+    # Concurrent requests for one run wait for a single computation.
+
+    def __init__(self, directory=AUDIT_DIR):
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._run_locks = {}
+        self._results = {}
+
+    @staticmethod
+    def run_key(source=None, records=DEFAULT_RECORDS, seed=DEFAULT_SEED, chunk_size=CHUNK_SIZE):
+        if source:
+            stat = os.stat(source)
+            params = {"csv": os.path.abspath(source), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+        else:
+            params = {"records": records, "seed": seed, "chunk_size": chunk_size}
+        params["version"] = METHOD_VERSION
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+
+    def _path(self, key):
+        return os.path.join(self._directory, f"{key}.json")
+
+    def cached(self, key):
+        if key in self._results:
+            return self._results[key]
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._results[key] = result
+        return result
+
+    def run(self, source=None, records=DEFAULT_RECORDS, seed=DEFAULT_SEED, chunk_size=CHUNK_SIZE, refresh=False):
+        key = self.run_key(source, records, seed, chunk_size)
+        with self._lock:
+            run_lock = self._run_locks.setdefault(key, threading.Lock())
+        with run_lock:
+            result = None if refresh else self.cached(key)
+            if result is not None:
+                return result
+            chunks = csv_chunks(source, chunk_size) if source else synthetic_chunks(records, seed, chunk_size)
+            result = dict(audit(chunks), run=key, source=source or "synthetic", audited_at=time.time())
+            # Written to a temporary file first, so a reader never sees half a result
+            os.makedirs(self._directory, exist_ok=True)
+            temporary = f"{self._path(key)}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            os.replace(temporary, self._path(key))
+            self._results[key] = result
+            return result
+
+
+def print_report(result):
+    print(f"Audit run {result['run']}: {result['records']:,} records ({result['source']}) "
+          f"in {result['seconds']:.2f} s, {result['records'] / max(result['seconds'], 1e-9):,.0f} records/s")
+    print(f"Reference group: {result['reference']}\n")
+    print(f"{'group':<22}{'records':>11}{'selected':>10}{'DI':>7}{'EO gap':>9}{'ECE':>8}")
+    for row in result["groups"]:
+        gap = row["equal_opportunity_gap"]
+        flags = ", ".join(flag for flag in FLAGS if row[flag])
+        print(f"{row['group']:<22}{row['records']:>11,}{row['selection_rate']:>10.1%}"
+              f"{row['disparate_impact']:>7.2f}{'n/a' if gap is None else f'{gap:+.3f}':>9}"
+              f"{row['calibration_error']:>8.3f}{'  ' + flags if flags else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--csv", help="audit an export of allocation records instead of synthetic data")
+    parser.add_argument("--records", type=int, default=DEFAULT_RECORDS, help="synthetic records to audit")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed of the synthetic records")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="records per chunk")
+    parser.add_argument("--refresh", action="store_true", help="recompute even if the run is cached")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args()
+
+    result = BiasAudits().run(args.csv, args.records, args.seed, args.chunk_size, args.refresh)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
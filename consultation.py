@@ -0,0 +1,166 @@
+import time
+from collections import namedtuple
+
+from db import LocalConnection
+
+# Comments are stored as a materialized path: the zero-padded ids of a
+# comment's ancestors and its own id, so "0000000012.0000000345" is a reply
+# to comment 12. Ordering by (paragraph, path) lists every thread of a
+# document in reading order straight from the index.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS consultation_comments (
+    id INTEGER PRIMARY KEY,
+    document TEXT NOT NULL,
+    paragraph INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    author TEXT,
+    body TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS consultation_comments_thread
+    ON consultation_comments(document, paragraph, path);
+CREATE TABLE IF NOT EXISTS consultation_counts (
+    document TEXT NOT NULL,
+    paragraph INTEGER NOT NULL,
+    comments INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (document, paragraph)
+) WITHOUT ROWID;
+"""
+
+PATH_DIGITS = 10
+MAX_DEPTH = 4
+
+Document = namedtuple("Document", "title closes summary paragraphs")
+Comment = namedtuple("Comment", "id paragraph path depth author body created_at")
+
+DOCUMENTS = {
+    "ethics-framework": Document(
+        "Draft AI Ethics Framework",
+        "July 15, 2023",
+        "Review and comment on the proposed ethical guidelines for all AI systems used by the city.",
+        [
+            "1. Purpose. This framework sets out the principles every algorithmic system used by the City of "
+            "Amsterdam must meet, from procurement to decommissioning.",
+            "2. Scope. It applies to all systems that make or support decisions about residents, including "
+            "systems run by contractors on the city's behalf.",
+            "3. Human dignity. Systems serve residents. No system may make a final decision about a resident's "
+            "rights, benefits or obligations without meaningful human review.",
+            "4. Fairness. Before use and at least once a year, each system is tested for unequal outcomes "
+            "between groups, including household type, age, gender, disability and migration background.",
+            "5. When a test finds unequal outcomes that cannot be justified, the system is adjusted or taken "
+            "out of use, and the findings are published.",
+            "6. Transparency. Every system is listed in the public algorithm register with its purpose, the "
+            "data it uses, its risk level and the department responsible.",
+            "7. Explanations. Residents affected by a decision can ask how the system contributed to it and "
+            "receive an answer in plain language within 30 days.",
+            "8. Data protection. Systems use no more personal data than their purpose needs, and data is "
+            "deleted as soon as it is no longer needed.",
+            "9. Oversight. An independent audit of each high-risk system takes place at least every two "
+            "years, and its results are published in full.",
+            "10. Participation. Residents and civil society are consulted before a high-risk system is "
+            "introduced, and again before major changes.",
+            "11. Objection. Residents can object to a decision supported by a system, and the objection is "
+            "handled by people who were not involved in the original decision.",
+            "12. Review. This framework is reviewed every two years, taking into account the comments "
+            "received in this consultation.",
+        ],
+    ),
+}
+
+# Comments that were sent in by email before the consultation moved online:
+# (document, paragraph, author, body, replies). Paragraphs count from 0, so
+# paragraph 2 is "3. Human dignity".
+SEED_COMMENTS = [
+    ("ethics-framework", 2, "Ingrid", "What counts as 'meaningful' review? A civil servant clicking approve "
+     "on hundreds of cases a day isn't meaningful.", [
+         ("City of Amsterdam", "Good point. We're adding a minimum time per case and a requirement that "
+          "reviewers can see the underlying data, not just the system's score."),
+     ]),
+    ("ethics-framework", 3, "Youssef", "Please include single-parent households explicitly. The housing "
+     "audit showed exactly this group was disadvantaged.", []),
+    ("ethics-framework", 6, None, "30 days is too long when the decision is about housing or benefits.", []),
+]
+
+
+def _segment(comment_id):
+    return str(comment_id).zfill(PATH_DIGITS)
+
+
+class ConsultationStore:
+    # Paragraph-anchored comments. Loading a document's comments is a single
+    # range scan of the thread index, already in display order; comment
+    # counts per paragraph are kept up to date as comments are added, so
+    # showing them never counts rows.
+
+    def __init__(self, path=None, seed=SEED_COMMENTS):
+        self._conn = LocalConnection(path)
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        if seed and not conn.execute("SELECT 1 FROM consultation_comments LIMIT 1").fetchone():
+            for document, paragraph, author, body, replies in seed:
+                parent = self.add(document, paragraph, body, author)
+                for reply_author, reply in replies:
+                    self.add(document, paragraph, reply, reply_author, parent=parent)
+
+    def add(self, document, paragraph, body, author=None, parent=None):
+        # Returns the new comment's id. Replies nested deeper than MAX_DEPTH
+        # are attached to the deepest allowed ancestor instead.
+        if document not in DOCUMENTS or not 0 <= paragraph < len(DOCUMENTS[document].paragraphs):
+            raise ValueError("Unknown paragraph")
+        body = body.strip()
+        if not body:
+            raise ValueError("Please write a comment before submitting.")
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            prefix, depth = "", 0
+            if parent is not None:
+                row = conn.execute(
+                    "SELECT path, depth FROM consultation_comments WHERE id = ? AND document = ? AND paragraph = ?",
+                    (parent, document, paragraph),
+                ).fetchone()
+                if row is None:
+                    raise ValueError("The comment you replied to no longer exists.")
+                prefix, depth = row["path"], row["depth"] + 1
+                if depth > MAX_DEPTH:
+                    prefix, depth = ".".join(prefix.split(".")[:MAX_DEPTH]), MAX_DEPTH
+                prefix += "."
+            # The path needs the new id, so the row is inserted first and
+            # completed in the same transaction
+            comment_id = conn.execute(
+                "INSERT INTO consultation_comments (document, paragraph, path, depth, author, body, created_at) "
+                "VALUES (?, ?, '', ?, ?, ?, ?)",
+                (document, paragraph, depth, (author or "").strip() or None, body, time.time()),
+            ).lastrowid
+            conn.execute("UPDATE consultation_comments SET path = ? WHERE id = ?",
+                         (prefix + _segment(comment_id), comment_id))
+            conn.execute(
+                "INSERT INTO consultation_counts (document, paragraph, comments) VALUES (?, ?, 1) "
+                "ON CONFLICT (document, paragraph) DO UPDATE SET comments = comments + 1",
+                (document, paragraph),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return comment_id
+
+    def counts(self, document):
+        # {paragraph: comments}, for every paragraph of the document
+        counts = dict.fromkeys(range(len(DOCUMENTS[document].paragraphs)), 0)
+        counts.update(self._conn().execute(
+            "SELECT paragraph, comments FROM consultation_counts WHERE document = ?", (document,)
+        ).fetchall())
+        return counts
+
+    def comments(self, document, paragraph=None):
+        # Threads in display order: each comment is followed by its replies.
+        # Without a paragraph, all of the document's comments.
+        sql = ("SELECT id, paragraph, path, depth, author, body, created_at FROM consultation_comments "
+               "WHERE document = ?")
+        params = [document]
+        if paragraph is not None:
+            sql += " AND paragraph = ?"
+            params.append(paragraph)
+        return [Comment(*row) for row in self._conn().execute(sql + " ORDER BY paragraph, path", params)]
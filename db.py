@@ -0,0 +1,93 @@
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.environ.get(
+    "AIANDME_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+)
+DB_PATH = os.path.join(DATA_DIR, "aiandme.db")
+
+
+def connect(path=None):
+    # Autocommit connection in WAL mode: readers never block the writer and
+    # writers group their statements in explicit BEGIN/COMMIT blocks.
+    path = path or DB_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
+
+class LocalConnection:
+    # Called to get the calling thread's own connection, opened on first
+    # use. Stores use it for reads and for writes made from session threads,
+    # which WAL mode lets run next to their writer thread.
+
+    def __init__(self, path=None):
+        self._path = path
+        self._local = threading.local()
+
+    def __call__(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = connect(self._path)
+        return conn
+
+
+class BufferedWriter(ABC):
+    # Base for stores that collect writes in memory and write them in
+    # batches. A daemon thread calls flush() every `interval` seconds, from
+    # when the subclass calls _start(), and close() stops it and flushes
+    # what is left. flush() runs under _flush_lock and writes its batch
+    # in a _transaction() on the writer's own connection.
+
+    def __init__(self, path=None, interval=1.0):
+        self._conn = connect(path)
+        self._flush_lock = threading.Lock()
+        self._interval = interval
+        self._stop = threading.Event()
+        self._flusher = None
+
+    def _start(self, name):
+        self._flusher = threading.Thread(target=self._run, name=name, daemon=True)
+        self._flusher.start()
+
+    @contextmanager
+    def _transaction(self, put_back):
+        # One transaction on the writer's connection. When it fails,
+        # put_back() returns the batch to the buffer, so the next flush
+        # retries it.
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            put_back()
+            raise
+
+    @abstractmethod
+    def flush(self):
+        # Writes what is buffered and returns how much was written
+        ...
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Flush by %s failed", self._flusher.name)
+
+    def close(self):
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
@@ -0,0 +1,143 @@
+import zlib
+
+import numpy as np
+
+from search import analyze
+
+# Copies are recorded as they are written, with a running count per first
+# copy, so the feed folds them without grouping the feedback table
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback_duplicates (
+    feedback_id INTEGER PRIMARY KEY REFERENCES feedback(id),
+    duplicate_of INTEGER NOT NULL REFERENCES feedback(id),
+    similarity REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feedback_copies (
+    feedback_id INTEGER PRIMARY KEY REFERENCES feedback(id),
+    copies INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feedback_signatures (
+    feedback_id INTEGER PRIMARY KEY REFERENCES feedback(id),
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feedback_bands (
+    bucket BLOB NOT NULL,
+    feedback_id INTEGER NOT NULL REFERENCES feedback(id),
+    PRIMARY KEY (bucket, feedback_id)
+) WITHOUT ROWID;
+"""
+
+# 32 bands of 4 rows: pairs with a similarity of 0.6 share a bucket with a
+# probability of 99%, pairs at 0.3 with 23%, and those are then rejected on
+# their estimated similarity. Shingles are single terms: copies after a news
+# story are reworded as often as they are pasted, and a reworded copy keeps
+# most of its terms (about 0.75) but few of its word pairs (about 0.4).
+NUM_PERM = 128
+BANDS = 32
+THRESHOLD = 0.6
+SHINGLE_SIZE = 1
+MAX_CANDIDATES = 32
+
+_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    # Hashes of the runs of `size` analyzed terms, so stopwords, case,
+    # accents and word endings don't make copies look different
+    terms = analyze(text)
+    grams = {" ".join(terms[i:i + size]) for i in range(max(len(terms) - size + 1, 1))} if terms else set()
+    return np.fromiter((zlib.crc32(gram.encode()) for gram in grams), dtype=np.uint64, count=len(grams))
+
+
+def install(conn):
+    conn.executescript(SCHEMA)
+
+
+def record(conn, duplicates):
+    # duplicates are (feedback_id, duplicate_of, similarity); runs inside
+    # the writer's transaction
+    if not duplicates:
+        return
+    conn.executemany(
+        "INSERT INTO feedback_duplicates (feedback_id, duplicate_of, similarity) VALUES (?, ?, ?)", duplicates
+    )
+    conn.executemany(
+        "INSERT INTO feedback_copies (feedback_id, copies) VALUES (?, 1) "
+        "ON CONFLICT (feedback_id) DO UPDATE SET copies = copies + 1",
+        [(duplicate_of,) for _, duplicate_of, _ in duplicates],
+    )
+
+
+class DuplicateIndex:
+    # MinHash with LSH banding over tables. A signature holds the minimum of
+    # NUM_PERM hash permutations over a document's shingles, and the share
+    # of equal positions in two signatures estimates their Jaccard
+    # similarity. Signatures are cut into bands, and documents that share a
+    # band's bucket are the candidates. Signatures and buckets are stored
+    # with the feedback, by the caller's transaction, so nothing is loaded
+    # at startup and nothing is kept in memory. Only first copies are
+    # indexed, so buckets stay small however many copies arrive: a lookup
+    # is one query over BANDS primary-key probes and at most MAX_CANDIDATES
+    # comparisons, whatever the size of the index.
+
+    def __init__(self, num_perm=NUM_PERM, bands=BANDS, threshold=THRESHOLD, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)
+        self._rows = num_perm // bands
+        self._buckets_sql = ", ".join("?" * bands)
+        self.threshold = threshold
+
+    def signature(self, text):
+        hashes = shingles(text)
+        if not len(hashes):
+            return None
+        # (a * x + b) mod p for every shingle and permutation; the products
+        # wrap around in uint64, which keeps the permutations well mixed
+        values = (np.outer(hashes, self._a) + self._b) % _PRIME & _MAX_HASH
+        return values.min(axis=0).astype(np.uint32)
+
+    def _buckets(self, signature):
+        # The band's number followed by its rows
+        rows = self._rows
+        return [bytes([band]) + signature[i:i + rows].tobytes()
+                for band, i in enumerate(range(0, len(signature), rows))]
+
+    def query(self, conn, signature):
+        # (key, estimated similarity) of the most similar indexed document
+        # at or above the threshold, or (None, None)
+        candidates = conn.execute(
+            f"SELECT DISTINCT s.feedback_id, s.signature FROM feedback_bands b "
+            f"JOIN feedback_signatures s ON s.feedback_id = b.feedback_id "
+            f"WHERE b.bucket IN ({self._buckets_sql}) LIMIT ?",
+            self._buckets(signature) + [MAX_CANDIDATES],
+        ).fetchall()
+        if not candidates:
+            return None, None
+        signatures = np.frombuffer(b"".join(row[1] for row in candidates), dtype=np.uint32)
+        similarity = (signatures.reshape(len(candidates), -1) == signature).mean(axis=1)
+        best = int(similarity.argmax())
+        if similarity[best] < self.threshold:
+            return None, None
+        return candidates[best][0], float(similarity[best])
+
+    def add(self, conn, key, signature):
+        conn.execute("INSERT INTO feedback_signatures (feedback_id, signature) VALUES (?, ?)",
+                     (key, signature.tobytes()))
+        conn.executemany("INSERT INTO feedback_bands (bucket, feedback_id) VALUES (?, ?)",
+                         [(bucket, key) for bucket in self._buckets(signature)])
+
+    def check(self, conn, key, text):
+        # Returns (duplicate_of, similarity) for a copy, or (None, None) for
+        # a first copy, which is indexed. Text without terms is neither.
+        # Runs inside the caller's transaction.
+        signature = self.signature(text)
+        if signature is None:
+            return None, None
+        duplicate_of, similarity = self.query(conn, signature)
+        if duplicate_of is None:
+            self.add(conn, key, signature)
+        return duplicate_of, similarity
@@ -0,0 +1,113 @@
+import numpy as np
+
+# Scoring rules of the social housing allocation system, as published for
+# the self-check. Every factor is a small lookup table of points; the total
+# score is their sum.
+MAX_WAITING_YEARS = 20
+POINTS_PER_WAITING_YEAR = 10
+MAX_WAITING_POINTS = 150
+
+HOUSING_SITUATIONS = {
+    "Own rented or bought home": 0,
+    "Living with parents": 20,
+    "Sharing with other households": 30,
+    "Overcrowded home": 40,
+    "Homeless or in a shelter": 60,
+}
+
+MAX_HOUSEHOLD = 8
+POINTS_PER_HOUSEHOLD_MEMBER = 5
+MAX_HOUSEHOLD_POINTS = 30
+
+MAX_INCOME = 80000
+INCOME_STEP = 1000
+MAX_INCOME_POINTS = 40
+
+# Income limits for social housing (2023), by household size
+SINGLE_INCOME_LIMIT = 44035
+HOUSEHOLD_INCOME_LIMIT = 48625
+
+CIRCUMSTANCES = {
+    "Medical urgency": 50,
+    "Social urgency": 40,
+    "Informal caregiver": 20,
+}
+
+FACTORS = ["Waiting time", "Housing situation", "Household", "Income", "Special circumstances"]
+
+
+def income_limit(household):
+    return SINGLE_INCOME_LIMIT if household == 1 else HOUSEHOLD_INCOME_LIMIT
+
+
+class ScoringTable:
+    # Scores for every combination of answers, computed once with numpy
+    # broadcasting: a self-check is a single array lookup plus a binary
+    # search in the sorted scores of a reference population, so moving a
+    # slider costs microseconds however many people use the calculator.
+
+    def __init__(self, population=50000, seed=2023):
+        self.waiting = np.minimum(np.arange(MAX_WAITING_YEARS + 1) * POINTS_PER_WAITING_YEAR,
+                                  MAX_WAITING_POINTS).astype(np.int16)
+        self.situation = np.array(list(HOUSING_SITUATIONS.values()), dtype=np.int16)
+        household = np.arange(1, MAX_HOUSEHOLD + 1)
+        self.household = np.minimum((household - 1) * POINTS_PER_HOUSEHOLD_MEMBER,
+                                    MAX_HOUSEHOLD_POINTS).astype(np.int16)
+        # Income points fall linearly to zero at the household's income limit
+        incomes = np.arange(0, MAX_INCOME + 1, INCOME_STEP)
+        limits = np.where(household == 1, SINGLE_INCOME_LIMIT, HOUSEHOLD_INCOME_LIMIT)[:, None]
+        self.income = np.round(np.clip(1 - incomes / limits, 0, 1) * MAX_INCOME_POINTS).astype(np.int16)
+        self.eligible = incomes <= limits
+        # Circumstances are a bit mask, bit i for the i-th entry of CIRCUMSTANCES
+        masks = np.arange(2 ** len(CIRCUMSTANCES))
+        bits = (masks[:, None] >> np.arange(len(CIRCUMSTANCES))) & 1
+        self.circumstances = (bits @ np.array(list(CIRCUMSTANCES.values()))).astype(np.int16)
+
+        # (years, situation, household, income, circumstances)
+        self.scores = (
+            self.waiting[:, None, None, None, None]
+            + self.situation[None, :, None, None, None]
+            + self.income[None, None, :, :, None]
+            + self.household[None, None, :, None, None]
+            + self.circumstances[None, None, None, None, :]
+        )
+        self.max_score = int(self.scores.max())
+        self.maxima = dict(zip(FACTORS, (int(table.max()) for table in (
+            self.waiting, self.situation, self.household, self.income, self.circumstances))))
+        self.population = self._population(population, seed)
+
+    def _population(self, size, seed):
+        # Sorted scores of a synthetic pool of eligible applicants, used to
+        # say how a score compares. The mix of answers roughly follows the
+        # published waiting list statistics.
+        rng = np.random.default_rng(seed)
+        years = np.minimum(rng.exponential(6, size).astype(int), MAX_WAITING_YEARS)
+        situation = rng.choice(len(HOUSING_SITUATIONS), size, p=[0.45, 0.2, 0.2, 0.1, 0.05])
+        household = np.minimum(rng.geometric(0.45, size), MAX_HOUSEHOLD) - 1
+        income = rng.integers(0, (SINGLE_INCOME_LIMIT // INCOME_STEP) + 1, size)
+        circumstances = rng.choice(2 ** len(CIRCUMSTANCES), size,
+                                   p=[0.8, 0.06, 0.06, 0.01, 0.05, 0.01, 0.01, 0.0])
+        return np.sort(self.scores[years, situation, household, income, circumstances])
+
+    def score(self, years, situation, household, income, circumstances=()):
+        # situation and circumstances are the English labels of
+        # HOUSING_SITUATIONS and CIRCUMSTANCES
+        index = (
+            min(max(int(years), 0), MAX_WAITING_YEARS),
+            list(HOUSING_SITUATIONS).index(situation),
+            min(max(int(household), 1), MAX_HOUSEHOLD) - 1,
+            min(max(int(income), 0), MAX_INCOME) // INCOME_STEP,
+            sum(1 << i for i, label in enumerate(CIRCUMSTANCES) if label in circumstances),
+        )
+        total = int(self.scores[index])
+        parts = [self.waiting[index[0]], self.situation[index[1]], self.household[index[2]],
+                 self.income[index[2], index[3]], self.circumstances[index[4]]]
+        below = np.searchsorted(self.population, total, side="left")
+        return {
+            "score": total,
+            "max_score": self.max_score,
+            "eligible": bool(self.eligible[index[2], index[3]]),
+            "income_limit": income_limit(index[2] + 1),
+            "percentile": round(100 * below / len(self.population)),
+            "breakdown": dict(zip(FACTORS, (int(points) for points in parts))),
+        }
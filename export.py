@@ -0,0 +1,226 @@
+"""Bulk export of public feedback, responses and impact statistics as CSV or
+Parquet. Rows are read in keyset-paginated chunks and encoded chunk by chunk,
+so memory stays flat however many rows are exported.
+
+    python export.py feedback --format parquet -o feedback.parquet
+
+The same exports are served by the sidecar at /export/<dataset>.<format>,
+e.g. /export/feedback.csv?after=1000 for rows with an id above 1000.
+"""
+import argparse
+import csv
+import io
+import importlib.util
+import sys
+
+import impact
+import redaction
+import sidecar
+from db import connect
+from feedback_store import SCHEMA
+
+CHUNK_SIZE = 5000
+
+# pyarrow is optional and slow to import, so it is only loaded by the first
+# Parquet export
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Timestamps are exported as ISO 8601 in UTC
+_ISO_TIME = "strftime('%Y-%m-%dT%H:%M:%SZ', {0}, 'unixepoch')"
+
+# Only what the submitter agreed to publish, with personal details redacted
+FEEDBACK_COLUMNS = [("id", "int"), ("created_at", "str"), ("kind", "str"), ("system", "str"),
+                    ("topic", "str"), ("title", "str"), ("details", "str"), ("impact", "str")]
+RESPONSE_COLUMNS = [("id", "int"), ("feedback_id", "int"), ("created_at", "str"),
+                    ("author", "str"), ("official", "int"), ("body", "str")]
+IMPACT_COLUMNS = [("year", "str"), ("system", "str"), ("neighborhood", "str"), ("feedback", "int"),
+                  ("changed", "int")]
+PARTICIPATION_COLUMNS = [("year", "str"), ("participants", "int"), ("feedback", "int"),
+                         ("changed", "int")]
+
+
+def _keyset(conn, sql, after, chunk_size):
+    # One short query per chunk instead of a cursor held open for the whole
+    # export, so the writer can checkpoint the WAL while an export runs
+    while True:
+        rows = conn.execute(sql, (after, chunk_size)).fetchall()
+        if not rows:
+            return
+        yield rows
+        after = rows[-1][0]
+
+
+def feedback_chunks(conn, after=0, chunk_size=CHUNK_SIZE):
+    return _keyset(conn, f"""
+        SELECT f.id, {_ISO_TIME.format("f.created_at")}, f.kind, f.system, f.topic, r.title, r.details, r.impact
+        FROM feedback f JOIN feedback_redacted r ON r.feedback_id = f.id
+        WHERE f.public = 1 AND f.id > ? ORDER BY f.id LIMIT ?
+    """, after, chunk_size)
+
+
+def response_chunks(conn, after=0, chunk_size=CHUNK_SIZE):
+    return _keyset(conn, f"""
+        SELECT r.id, r.feedback_id, {_ISO_TIME.format("r.created_at")}, r.author, r.official, r.body
+        FROM responses r JOIN feedback f ON f.id = r.feedback_id
+        WHERE f.public = 1 AND r.id > ? ORDER BY r.id LIMIT ?
+    """, after, chunk_size)
+
+
+def _rollup(conn, sql, chunk_size):
+    # The rollup tables hold one row per year and system, small enough to
+    # read in one query
+    cur = conn.execute(sql)
+    while True:
+        rows = cur.fetchmany(chunk_size)
+        if not rows:
+            return
+        yield rows
+
+
+def impact_chunks(conn, after=0, chunk_size=CHUNK_SIZE):
+    return _rollup(conn, """
+        SELECT year, system, neighborhood, feedback, changed FROM impact_rollup
+        ORDER BY year, system, neighborhood
+    """, chunk_size)
+
+
+def participation_chunks(conn, after=0, chunk_size=CHUNK_SIZE):
+    return _rollup(conn, "SELECT year, participants, feedback, changed FROM impact_years ORDER BY year",
+                   chunk_size)
+
+
+DATASETS = {
+    "feedback": (FEEDBACK_COLUMNS, feedback_chunks),
+    "responses": (RESPONSE_COLUMNS, response_chunks),
+    "impact": (IMPACT_COLUMNS, impact_chunks),
+    "participation": (PARTICIPATION_COLUMNS, participation_chunks),
+}
+
+
+def to_csv(columns, chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+class _StreamSink(io.RawIOBase):
+    # Write-only file that hands everything written back to the caller. It
+    # keeps counting the position, which the Parquet footer offsets rely on.
+
+    def __init__(self):
+        self._parts = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._parts.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def to_parquet(columns, chunks):
+    # One row group per chunk, written out as soon as it is encoded
+    if not HAS_PYARROW:
+        raise ValueError("Parquet export needs pyarrow")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    types = {"int": pa.int64(), "str": pa.string()}
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    sink = _StreamSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in chunks:
+            table = pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)],
+                schema=schema,
+            )
+            writer.write_table(table)
+            yield sink.drain()
+    yield sink.drain()
+
+
+FORMATS = {
+    "csv": ("text/csv; charset=utf-8", to_csv),
+    "parquet": ("application/vnd.apache.parquet", to_parquet),
+}
+
+
+def export(dataset, fmt, path=None, after=0, chunk_size=CHUNK_SIZE):
+    # Yields the encoded export in pieces; the connection is closed once the
+    # generator is exhausted or closed
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset {dataset!r}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r}")
+    if fmt == "parquet" and not HAS_PYARROW:
+        raise ValueError("Parquet export needs pyarrow")
+    columns, chunks = DATASETS[dataset]
+    encode = FORMATS[fmt][1]
+
+    def generate():
+        conn = connect(path)
+        try:
+            conn.executescript(SCHEMA)
+            impact.install(conn)
+            redaction.install(conn)
+            yield from encode(columns, chunks(conn, after, chunk_size))
+        finally:
+            conn.close()
+
+    return generate()
+
+
+def _export_route(dataset, fmt):
+    @sidecar.route(f"/export/{dataset}.{fmt}")
+    def handler(query):
+        try:
+            after = int(query.get("after", ["0"])[0])
+        except ValueError:
+            raise ValueError("after must be an integer id")
+        return 200, FORMATS[fmt][0], export(dataset, fmt, after=after)
+    return handler
+
+
+for _dataset in DATASETS:
+    for _fmt in FORMATS:
+        _export_route(_dataset, _fmt)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("dataset", choices=sorted(DATASETS))
+    parser.add_argument("--format", choices=sorted(FORMATS), default="csv")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--db", help="database path (default: the app's database)")
+    parser.add_argument("--after", type=int, default=0, help="only rows with a larger id")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="rows per chunk")
+    args = parser.parse_args()
+
+    pieces = export(args.dataset, args.format, args.db, args.after, args.chunk_size)
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for piece in pieces:
+            out.write(piece)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
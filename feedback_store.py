@@ -0,0 +1,374 @@
+import logging
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future
+
+import dedup
+import impact
+import redaction
+from db import LocalConnection, connect
+from search import ALL_STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+FEEDBACK_KINDS = ["concern", "question", "suggestion"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    kind TEXT NOT NULL,
+    system TEXT,
+    topic TEXT,
+    title TEXT NOT NULL,
+    details TEXT NOT NULL,
+    impact TEXT,
+    name TEXT,
+    email TEXT,
+    public INTEGER NOT NULL DEFAULT 0,
+    seeded INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS responses (
+    id INTEGER PRIMARY KEY,
+    feedback_id INTEGER NOT NULL REFERENCES feedback(id),
+    created_at REAL NOT NULL,
+    author TEXT NOT NULL,
+    official INTEGER NOT NULL DEFAULT 0,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_feedback ON responses(feedback_id);
+CREATE INDEX IF NOT EXISTS feedback_public ON feedback(public, id);
+CREATE INDEX IF NOT EXISTS feedback_public_kind ON feedback(public, kind, id);
+CREATE INDEX IF NOT EXISTS feedback_public_system ON feedback(public, system, id);
+"""
+
+# Published feedback, one row per group of near-duplicates: the first copy,
+# with the number of copies that came after it
+PUBLIC_FEED = (
+    "SELECT f.id, f.created_at, f.kind, f.system, f.topic, r.title, r.details, r.impact, "
+    "COALESCE(c.copies, 0) AS copies FROM feedback f "
+    "JOIN feedback_redacted r ON r.feedback_id = f.id "
+    "LEFT JOIN feedback_copies c ON c.feedback_id = f.id "
+    "WHERE f.public = 1 AND NOT EXISTS (SELECT 1 FROM feedback_duplicates d WHERE d.feedback_id = f.id)"
+)
+
+FEEDBACK_COLUMNS = ("created_at", "kind", "system", "topic", "title", "details", "impact",
+                    "name", "email", "public")
+
+DAY = 24 * 60 * 60
+
+# Public feedback that was on the platform before submissions were stored
+SEED_FEEDBACK = [
+    {
+        "age": 2 * DAY, "kind": "concern", "system": "housing-allocation",
+        "title": "Housing allocation seems biased against single parents",
+        "details": "I've been waiting for social housing for 3 years as a single parent, but I know "
+                   "couples who got housing faster. The algorithm seems to prioritize two-parent households.",
+        "responses": [
+            (1 * DAY, "Housing Department", True,
+             "Thank you for your feedback. We're investigating this concern and will update our bias "
+             "testing procedures. We've scheduled an audit specifically looking at outcomes for "
+             "single-parent households."),
+        ],
+    },
+    {
+        "age": 7 * DAY, "kind": "question", "system": "parking-enforcement",
+        "title": "How does the parking enforcement system handle privacy?",
+        "details": "I'm curious about how the parking enforcement cameras handle privacy. Do they record "
+                   "and store footage of people walking by? How long is data kept?",
+        "responses": [
+            (6 * DAY, "Mobility Department", True,
+             "The parking enforcement cameras only capture license plates, not pedestrians. Images are "
+             "automatically processed to detect violations, and all data is deleted after 72 hours "
+             "unless a violation is detected."),
+            (5 * DAY, "Amsterdam Privacy Coalition", False,
+             "We've reviewed this system and can confirm the data retention policies are being followed. "
+             "However, we're advocating for clearer signage in areas where these cameras operate."),
+        ],
+    },
+]
+
+
+def _text(row):
+    return f"{row['title']}\n{row['details']}"
+
+
+class FeedbackStore:
+    # Submissions go onto an in-process queue and return immediately; a single
+    # writer thread drains the queue and commits whole batches in one
+    # transaction. Readers get their own per-thread connection, which WAL
+    # mode lets run concurrently with the writer. Public feedback is only
+    # shown once the redactor has stored a copy without personal details.
+    # The writer also checks public rows against a MinHash index of earlier
+    # ones, and records near-duplicates and the index entries of first
+    # copies in the same transaction, so the feed shows each group once.
+
+    def __init__(self, path=None, batch_size=500, seed=True, redact=True):
+        self._batch_size = batch_size
+        self._queue = queue.Queue()
+        self._reader = LocalConnection(path)
+        self._listeners = []
+
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        impact.install(self._conn)
+        redaction.install(self._conn)
+        dedup.install(self._conn)
+        self._duplicates = dedup.DuplicateIndex()
+        if seed:
+            self._seed()
+
+        self._writer = threading.Thread(target=self._run, name="feedback-writer", daemon=True)
+        self._writer.start()
+        threading.Thread(target=self._index_existing, args=(path,), name="feedback-dedup", daemon=True).start()
+
+        # New public rows go to the redactor as they are committed; the
+        # backfill picks up rows from before, including the seeded ones
+        self._redactor = None
+        if redact:
+            self._redactor = redaction.Redactor(path)
+            self.add_listener(lambda rows: self._redactor.submit([row for row in rows if row["public"]]))
+            threading.Thread(target=self._redactor.backfill, name="redaction-backfill", daemon=True).start()
+
+    def _seed(self):
+        if self._conn.execute("SELECT 1 FROM feedback LIMIT 1").fetchone():
+            return
+        # Seeded feedback is marked, so it stays out of the impact totals,
+        # which count participation on the platform
+        now = time.time()
+        self._conn.execute("BEGIN")
+        for item in SEED_FEEDBACK:
+            cur = self._conn.execute(
+                "INSERT INTO feedback (created_at, kind, system, title, details, public, seeded) "
+                "VALUES (?, ?, ?, ?, ?, 1, 1)",
+                (now - item["age"], item["kind"], item["system"], item["title"], item["details"]),
+            )
+            for age, author, official, body in item["responses"]:
+                self._conn.execute(
+                    "INSERT INTO responses (feedback_id, created_at, author, official, body) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cur.lastrowid, now - age, author, int(official), body),
+                )
+        self._conn.execute("COMMIT")
+
+    def add_listener(self, callback):
+        # Called from the writer thread with the list of committed rows
+        self._listeners.append(callback)
+
+    def add_publish_listener(self, callback):
+        # Called from the redactor's writer thread with public rows, redacted,
+        # when they are published. Copies of earlier feedback are left out.
+        self._redactor.add_listener(lambda rows: callback(self.published([row["id"] for row in rows])))
+
+    def submit(self, kind, title, details, system=None, topic=None, impact="", name="",
+               email="", public=False):
+        if kind not in FEEDBACK_KINDS:
+            raise ValueError(f"Unknown feedback kind {kind!r}")
+        row = {
+            "created_at": time.time(), "kind": kind, "system": system, "topic": topic,
+            "title": title.strip(), "details": details.strip(), "impact": impact.strip(),
+            "name": name.strip(), "email": email.strip(), "public": int(bool(public)),
+        }
+        future = Future()
+        self._queue.put((row, future))
+        return future
+
+    def flush(self, timeout=None):
+        # Block until everything submitted so far has been committed
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = [(row, future) for row, future in batch if row is not None]
+            try:
+                committed = self._write_batch(rows)
+            except Exception as exc:
+                for _, future in rows:
+                    future.set_exception(exc)
+            else:
+                for row, future in rows:
+                    future.set_result(row["id"])
+                # A failing listener must not take the writer thread down
+                # with it, or every later submission would wait forever
+                for callback in self._listeners:
+                    try:
+                        callback(committed)
+                    except Exception:
+                        logger.exception("Feedback listener failed")
+            for row, done in batch:
+                if row is None:
+                    done.set()
+
+    def _index_existing(self, path, chunk_size=1000):
+        # Indexes public feedback that has no signature and isn't a known
+        # copy: the seeded rows, and rows from before detection existed or
+        # its settings changed. Copies among them are recorded on the way.
+        # Runs next to the writer, one short transaction per chunk.
+        conn = connect(path)
+        after = 0
+        try:
+            while True:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    rows = conn.execute(
+                        "SELECT id, title, details FROM feedback f WHERE public = 1 AND id > ? "
+                        "AND NOT EXISTS (SELECT 1 FROM feedback_signatures s WHERE s.feedback_id = f.id) "
+                        "AND NOT EXISTS (SELECT 1 FROM feedback_duplicates d WHERE d.feedback_id = f.id) "
+                        "ORDER BY id LIMIT ?",
+                        (after, chunk_size),
+                    ).fetchall()
+                    duplicates = []
+                    for row in rows:
+                        duplicate_of, similarity = self._duplicates.check(conn, row["id"], _text(row))
+                        if duplicate_of is not None:
+                            duplicates.append((row["id"], duplicate_of, similarity))
+                    dedup.record(conn, duplicates)
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+                if not rows:
+                    return
+                after = rows[-1]["id"]
+        except Exception:
+            logger.exception("Indexing existing feedback for duplicates failed")
+        finally:
+            conn.close()
+
+    def _write_batch(self, rows):
+        if not rows:
+            return []
+        sql = (f"INSERT INTO feedback ({', '.join(FEEDBACK_COLUMNS)}) "
+               f"VALUES ({', '.join('?' * len(FEEDBACK_COLUMNS))})")
+        duplicates = []
+        self._conn.execute("BEGIN")
+        try:
+            for row, _ in rows:
+                row["id"] = self._conn.execute(sql, [row[c] for c in FEEDBACK_COLUMNS]).lastrowid
+                row["duplicate_of"] = None
+                if row["public"]:
+                    row["duplicate_of"], similarity = self._duplicates.check(self._conn, row["id"], _text(row))
+                    if row["duplicate_of"] is not None:
+                        duplicates.append((row["id"], row["duplicate_of"], similarity))
+            dedup.record(self._conn, duplicates)
+            impact.record(self._conn, [row for row, _ in rows])
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return [row for row, _ in rows]
+
+    def get(self, feedback_id):
+        row = self._reader().execute("SELECT * FROM feedback WHERE id = ?", (feedback_id,)).fetchone()
+        return dict(row) if row else None
+
+    def get_many(self, feedback_ids):
+        # Rows in the order of the given ids, skipping unknown ones
+        if not feedback_ids:
+            return []
+        rows = self._reader().execute(
+            f"SELECT * FROM feedback WHERE id IN ({', '.join('?' * len(feedback_ids))})",
+            list(feedback_ids),
+        ).fetchall()
+        by_id = {row["id"]: dict(row) for row in rows}
+        return [by_id[i] for i in feedback_ids if i in by_id]
+
+    def published(self, feedback_ids):
+        # Feed rows in the order of the given ids, skipping ones that aren't
+        # published and copies of earlier feedback
+        if not feedback_ids:
+            return []
+        rows = self._reader().execute(
+            f"{PUBLIC_FEED} AND f.id IN ({', '.join('?' * len(feedback_ids))})",
+            list(feedback_ids),
+        ).fetchall()
+        by_id = {row["id"]: dict(row) for row in rows}
+        return [by_id[i] for i in feedback_ids if i in by_id]
+
+    def last_id(self):
+        return self._reader().execute("SELECT COALESCE(MAX(id), 0) FROM feedback").fetchone()[0]
+
+    def public_feedback(self, limit=20, before=None, kind=None, system=None):
+        # Newest first. Pages continue with before set to the last id seen,
+        # a range scan on the (public, ..., id) indexes at any depth.
+        sql = PUBLIC_FEED
+        params = []
+        if before is not None:
+            sql += " AND f.id < ?"
+            params.append(before)
+        if kind:
+            sql += " AND f.kind = ?"
+            params.append(kind)
+        if system:
+            sql += " AND f.system = ?"
+            params.append(system)
+        rows = self._reader().execute(sql + " ORDER BY f.id DESC LIMIT ?", params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def search_public(self, query, limit=20, before=None, kind=None, system=None):
+        # Unranked fallback for while the search index is being built: feed
+        # rows whose text contains every query word, newest first. Pages
+        # continue with before set to the (created_at, id) of the last row
+        # seen. It scans the feed, so it isn't meant for anything else.
+        words = [word for word in re.findall(r"[^\W_]+", query.lower()) if word not in ALL_STOPWORDS]
+        if not words:
+            return []
+        sql = PUBLIC_FEED
+        params = []
+        if before is not None:
+            sql += " AND (f.created_at, f.id) < (?, ?)"
+            params += list(before)
+        for word in words:
+            sql += " AND (r.title LIKE ? ESCAPE '\\' OR r.details LIKE ? ESCAPE '\\')"
+            pattern = "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            params += [pattern, pattern]
+        if kind:
+            sql += " AND f.kind = ?"
+            params.append(kind)
+        if system:
+            sql += " AND f.system = ?"
+            params.append(system)
+        rows = self._reader().execute(sql + " ORDER BY f.created_at DESC, f.id DESC LIMIT ?",
+                                      params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_public(self, upto, chunk_size=10000):
+        cur = self._reader().execute(
+            f"{PUBLIC_FEED} AND f.id <= ? ORDER BY f.id", (upto,)
+        )
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+
+    def mark_changed(self, feedback_id):
+        # Staff action, rare enough to write directly instead of via the queue
+        return impact.mark_changed(self._reader(), feedback_id)
+
+    def impact(self, year=None):
+        return impact.summary(self._reader(), year)
+
+    def responses(self, feedback_ids):
+        result = {feedback_id: [] for feedback_id in feedback_ids}
+        if not result:
+            return result
+        rows = self._reader().execute(
+            f"SELECT * FROM responses WHERE feedback_id IN ({', '.join('?' * len(result))}) "
+            "ORDER BY created_at",
+            list(result),
+        ).fetchall()
+        for row in rows:
+            result[row["feedback_id"]].append(dict(row))
+        return result
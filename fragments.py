@@ -0,0 +1,66 @@
+import re
+import threading
+import time
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def minify(html):
+    # Fragments are plain HTML without <pre> or <textarea>, where any run of
+    # whitespace renders as a single space. This also keeps each fragment on
+    # one line, which the markdown renderer treats as a single HTML block.
+    return _WHITESPACE_RE.sub(" ", html).strip()
+
+
+class Fragment:
+    def __init__(self, html):
+        self.html = html
+
+
+class FragmentCache:
+    # Rendered static sections keyed by their source and language, with
+    # translate(html, lang), if given, applied once per entry. Keying by the
+    # source string itself is cheap: Streamlit reuses the compiled script
+    # between reruns, so the same constant object comes back with its hash
+    # already computed, and the content hash is only taken on a miss.
+
+    def __init__(self, enabled=True, render=minify, translate=None):
+        self.enabled = enabled
+        self._render = render
+        self._translate = translate
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
+        self.source_bytes = 0
+        self.served_bytes = 0
+
+    def get(self, source, lang="en"):
+        key = (source, lang)
+        fragment = self._entries.get(key)
+        if fragment is None:
+            start = time.perf_counter()
+            html = self._render(source) if self.enabled else source
+            if self._translate is not None:
+                html = self._translate(html, lang)
+            fragment = Fragment(html)
+            with self._lock:
+                fragment = self._entries.setdefault(key, fragment)
+                self.misses += 1
+                self.render_seconds += time.perf_counter() - start
+        else:
+            self.hits += 1
+        self.source_bytes += len(source)
+        self.served_bytes += len(fragment.html)
+        return fragment
+
+    def stats(self):
+        return {
+            "fragments": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "render_seconds": self.render_seconds,
+            "source_bytes": self.source_bytes,
+            "served_bytes": self.served_bytes,
+        }
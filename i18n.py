@@ -0,0 +1,74 @@
+import functools
+import json
+import os
+import re
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+DEFAULT_LOCALE = "en"
+
+# Languages offered in the sidebar, by locale code. The interface is written
+# in English, so English needs no catalog.
+LOCALES = {"en": "English", "nl": "Nederlands", "tr": "Türkçe", "ar": "العربية"}
+RTL_LOCALES = {"ar"}
+
+_TEXT_RE = re.compile(r">([^<>]+)<")
+
+
+def _normalize(text):
+    return " ".join(text.split())
+
+
+class Catalog:
+    # One locale's messages, keyed by the English text with whitespace
+    # collapsed, so the same lookup works for widget labels and for text
+    # taken from indented HTML. Missing messages fall back to English.
+
+    def __init__(self, locale, messages):
+        self.locale = locale
+        self.rtl = locale in RTL_LOCALES
+        self._messages = {_normalize(source): text for source, text in messages.items()}
+
+    def __len__(self):
+        return len(self._messages)
+
+    def gettext(self, text):
+        if not self._messages:
+            return text
+        return self._messages.get(_normalize(text), text)
+
+    def translate_html(self, html):
+        # Replaces each text node that has a translation, and keeps the
+        # language on links to other pages. Used when a static section is
+        # first rendered for a locale, not on every rerun.
+        if self.locale != DEFAULT_LOCALE:
+            html = html.replace('href="?', f'href="?lang={self.locale}&amp;')
+        if not self._messages:
+            return html
+
+        def replace(match):
+            text = match.group(1)
+            translated = self._messages.get(_normalize(text))
+            if translated is None:
+                return match.group(0)
+            start = len(text) - len(text.lstrip())
+            end = len(text.rstrip())
+            return f">{text[:start]}{translated}{text[end:]}<"
+
+        return _TEXT_RE.sub(replace, html)
+
+
+@functools.lru_cache(maxsize=None)
+def catalog(locale):
+    # Each locale file is read the first time the locale is used, then kept
+    # for the life of the process, so switching language is a dict lookup
+    if locale not in LOCALES:
+        locale = DEFAULT_LOCALE
+    path = os.path.join(LOCALES_DIR, f"{locale}.json")
+    if locale == DEFAULT_LOCALE or not os.path.exists(path):
+        return Catalog(locale, {})
+    with open(path, encoding="utf-8") as f:
+        return Catalog(locale, json.load(f))
+
+
+def translate_html(html, locale):
+    return catalog(locale).translate_html(html)
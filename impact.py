@@ -0,0 +1,213 @@
+"""Impact by Numbers on the Influence page: participants, feedback and the
+share of feedback that led to changes, per year. Running totals are kept up
+to date as feedback is written, so the page reads a single row instead of
+aggregating the feedback table. Staff record which feedback led to a change
+from the command line:
+
+    python impact.py changed 1234 1240
+    python impact.py summary --year 2024
+"""
+import argparse
+import hashlib
+import sys
+import time
+from collections import Counter
+
+from db import connect
+from registry import SEED_ALGORITHMS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS impact_years (
+    year TEXT PRIMARY KEY,
+    participants INTEGER NOT NULL DEFAULT 0,
+    feedback INTEGER NOT NULL DEFAULT 0,
+    changed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS impact_rollup (
+    year TEXT NOT NULL,
+    system TEXT NOT NULL,
+    neighborhood TEXT NOT NULL,
+    feedback INTEGER NOT NULL DEFAULT 0,
+    changed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (year, system, neighborhood)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS participants_seen (
+    year TEXT NOT NULL,
+    participant TEXT NOT NULL,
+    PRIMARY KEY (year, participant)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS feedback_changes (
+    feedback_id INTEGER PRIMARY KEY REFERENCES feedback(id),
+    changed_at REAL NOT NULL
+);
+"""
+
+NEIGHBORHOODS = {algorithm.slug: algorithm.neighborhood for algorithm in SEED_ALGORITHMS}
+
+# Participation before feedback was stored on the platform:
+# year -> participants, {system: (feedback, changed)}
+SEED_HISTORY = {
+    "2022": (1240, {
+        "housing-allocation": (350, 266),
+        "parking-enforcement": (250, 190),
+        "crowd-monitoring": (200, 152),
+        "waste-collection": (200, 152),
+    }),
+}
+
+
+def _year(timestamp):
+    return time.strftime("%Y", time.gmtime(timestamp))
+
+
+def _participant(row):
+    # Submissions with the same email count as one participant per year.
+    # Only a hash is kept; anonymous submissions each count once.
+    email = (row["email"] or "").strip().lower()
+    key = f"email:{email}" if email else f"feedback:{row['id']}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def install(conn):
+    # Creates the tables. Feedback and changes recorded before the rollups
+    # existed are counted once, then the pre-platform history is added.
+    conn.executescript(SCHEMA)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM impact_years LIMIT 1").fetchone():
+            conn.execute("COMMIT")
+            return
+        cur = conn.execute("SELECT id, created_at, system, email FROM feedback WHERE NOT seeded ORDER BY id")
+        while True:
+            rows = cur.fetchmany(10000)
+            if not rows:
+                break
+            record(conn, rows)
+        changed = Counter(
+            (_year(row["created_at"]), row["system"]) for row in conn.execute(
+                "SELECT f.created_at, f.system FROM feedback_changes c JOIN feedback f ON f.id = c.feedback_id "
+                "WHERE NOT f.seeded"
+            )
+        )
+        for (year, system), count in changed.items():
+            _add(conn, year, system, 0, count)
+        for year, (participants, systems) in SEED_HISTORY.items():
+            conn.execute("INSERT OR IGNORE INTO impact_years (year) VALUES (?)", (year,))
+            conn.execute("UPDATE impact_years SET participants = participants + ? WHERE year = ?",
+                         (participants, year))
+            for system, (feedback, changed) in systems.items():
+                _add(conn, year, system, feedback, changed)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _add(conn, year, system, feedback, changed=0):
+    conn.execute(
+        "INSERT INTO impact_rollup (year, system, neighborhood, feedback, changed) "
+        "VALUES (?, ?, ?, ?, ?) ON CONFLICT (year, system, neighborhood) DO UPDATE SET "
+        "feedback = feedback + excluded.feedback, changed = changed + excluded.changed",
+        (year, system or "", NEIGHBORHOODS.get(system, ""), feedback, changed),
+    )
+    conn.execute(
+        "INSERT INTO impact_years (year, feedback, changed) VALUES (?, ?, ?) "
+        "ON CONFLICT (year) DO UPDATE SET "
+        "feedback = feedback + excluded.feedback, changed = changed + excluded.changed",
+        (year, feedback, changed),
+    )
+
+
+def record(conn, rows):
+    # Counts newly written feedback rows. Runs inside the caller's
+    # transaction, so the totals commit or roll back with the rows.
+    counts = Counter()
+    participants = {}
+    for row in rows:
+        year = _year(row["created_at"])
+        counts[year, row["system"]] += 1
+        participants.setdefault(year, set()).add(_participant(row))
+    for (year, system), feedback in counts.items():
+        _add(conn, year, system, feedback)
+    for year, keys in participants.items():
+        before = conn.total_changes
+        conn.executemany("INSERT OR IGNORE INTO participants_seen (year, participant) VALUES (?, ?)",
+                         [(year, key) for key in keys])
+        conn.execute("UPDATE impact_years SET participants = participants + ? WHERE year = ?",
+                     (conn.total_changes - before, year))
+
+
+def mark_changed(conn, feedback_id):
+    # Records that a piece of feedback led to a change; returns False if it
+    # was already recorded
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT created_at, system, seeded FROM feedback WHERE id = ?",
+                           (feedback_id,)).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown feedback {feedback_id}")
+        if row["seeded"]:
+            raise ValueError(f"Feedback {feedback_id} is seeded and not counted")
+        inserted = conn.execute(
+            "INSERT OR IGNORE INTO feedback_changes (feedback_id, changed_at) VALUES (?, ?)",
+            (feedback_id, time.time()),
+        ).rowcount
+        if inserted:
+            year = _year(row["created_at"])
+            system = row["system"] or ""
+            conn.execute("UPDATE impact_rollup SET changed = changed + 1 "
+                         "WHERE year = ? AND system = ? AND neighborhood = ?",
+                         (year, system, NEIGHBORHOODS.get(system, "")))
+            conn.execute("UPDATE impact_years SET changed = changed + 1 WHERE year = ?", (year,))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return bool(inserted)
+
+
+def summary(conn, year=None):
+    # Totals for the given year, or for the last completed year on record
+    if year is None:
+        row = conn.execute("SELECT * FROM impact_years WHERE year < ? ORDER BY year DESC LIMIT 1",
+                           (_year(time.time()),)).fetchone()
+    else:
+        row = conn.execute("SELECT * FROM impact_years WHERE year = ?", (year,)).fetchone()
+    if row is None:
+        return {"year": year or _year(time.time()), "participants": 0, "feedback": 0,
+                "changed": 0, "changed_percent": 0}
+    percent = round(100 * row["changed"] / row["feedback"]) if row["feedback"] else 0
+    return dict(row, changed_percent=percent)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", help="database path (default: the app's database)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    changed = commands.add_parser("changed", help="record that feedback led to a change")
+    changed.add_argument("feedback_ids", nargs="+", type=int, metavar="feedback_id")
+    summary_parser = commands.add_parser("summary", help="print the totals of a year")
+    summary_parser.add_argument("--year", help="default: the last completed year on record")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'impact_years'").fetchone():
+        print("This database has no impact totals yet; they are created when the app starts", file=sys.stderr)
+        return 1
+    if args.command == "changed":
+        for feedback_id in args.feedback_ids:
+            try:
+                recorded = mark_changed(conn, feedback_id)
+            except ValueError as exc:
+                print(exc, file=sys.stderr)
+                return 1
+            print(f"feedback {feedback_id}: {'recorded' if recorded else 'already recorded'}")
+    else:
+        totals = summary(conn, args.year)
+        print(f"{totals['year']}: {totals['participants']} participants, {totals['feedback']} pieces of "
+              f"feedback, {totals['changed']} led to changes ({totals['changed_percent']}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
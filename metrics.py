@@ -0,0 +1,129 @@
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import sidecar
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RenderStats:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.bytes = 0
+        self.markdown_bytes = 0
+        self.elements = 0
+        self.last = {}
+
+    def observe(self, seconds, sent):
+        self.count += 1
+        self.seconds += seconds
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+        self.bytes += sent["bytes"]
+        self.markdown_bytes += sent["markdown_bytes"]
+        self.elements += sent["elements"]
+        self.last = dict(sent, seconds=seconds)
+
+
+class RenderMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages = {}
+
+    def observe(self, name, seconds, sent):
+        with self._lock:
+            self._pages.setdefault(name, RenderStats()).observe(seconds, sent)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {
+                    "renders": stats.count,
+                    "avg_ms": 1000 * stats.seconds / stats.count,
+                    "last_ms": 1000 * stats.last["seconds"],
+                    "last_bytes": stats.last["bytes"],
+                    "last_markdown_bytes": stats.last["markdown_bytes"],
+                    "last_elements": stats.last["elements"],
+                }
+                for name, stats in sorted(self._pages.items())
+            }
+
+    def prometheus(self):
+        lines = [
+            "# HELP aiandme_render_seconds Wall time spent rendering a page section.",
+            "# TYPE aiandme_render_seconds histogram",
+        ]
+        with self._lock:
+            pages = sorted(self._pages.items())
+            for name, stats in pages:
+                for bound, count in zip(BUCKETS, stats.buckets):
+                    lines.append(f'aiandme_render_seconds_bucket{{page="{name}",le="{bound}"}} {count}')
+                lines.append(f'aiandme_render_seconds_bucket{{page="{name}",le="+Inf"}} {stats.count}')
+                lines.append(f'aiandme_render_seconds_sum{{page="{name}"}} {stats.seconds}')
+                lines.append(f'aiandme_render_seconds_count{{page="{name}"}} {stats.count}')
+            for metric, attr, help_text in (
+                ("aiandme_render_bytes_total", "bytes", "Bytes of forward messages sent to the browser."),
+                ("aiandme_render_markdown_bytes_total", "markdown_bytes", "Bytes of markdown bodies sent with st.markdown."),
+                ("aiandme_render_elements_total", "elements", "Number of elements sent to the browser."),
+            ):
+                lines.append(f"# HELP {metric} {help_text}")
+                lines.append(f"# TYPE {metric} counter")
+                for name, stats in pages:
+                    lines.append(f'{metric}{{page="{name}"}} {getattr(stats, attr)}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = RenderMetrics()
+
+
+@contextmanager
+def _count_messages():
+    # Wrap the session's enqueue function for the duration of the render so
+    # every element sent to the browser is counted, whichever st.* call made it.
+    sent = {"bytes": 0, "markdown_bytes": 0, "elements": 0}
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        yield sent
+        return
+    enqueue = ctx._enqueue
+
+    def counting_enqueue(msg):
+        sent["bytes"] += msg.ByteSize()
+        if msg.HasField("delta") and msg.delta.HasField("new_element"):
+            sent["elements"] += 1
+            element = msg.delta.new_element
+            if element.HasField("markdown"):
+                sent["markdown_bytes"] += len(element.markdown.body.encode())
+        enqueue(msg)
+
+    ctx._enqueue = counting_enqueue
+    try:
+        yield sent
+    finally:
+        ctx._enqueue = enqueue
+
+
+def profiled(name):
+    def decorate(render):
+        @functools.wraps(render)
+        def wrapper(*args, **kwargs):
+            with _count_messages() as sent:
+                start = time.perf_counter()
+                try:
+                    return render(*args, **kwargs)
+                finally:
+                    METRICS.observe(name, time.perf_counter() - start, sent)
+        return wrapper
+    return decorate
+
+
+@sidecar.route("/metrics")
+def metrics_endpoint(query):
+    return 200, "text/plain; version=0.0.4", METRICS.prometheus().encode()
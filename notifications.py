@@ -0,0 +1,475 @@
+"""Email notifications for subscribers. Publishing only queues a fan-out on a
+background asyncio loop: subscribers are read in keyset batches and each
+batch is handed to the transport, with retries and exponential backoff, so a
+large fan-out never runs on the Streamlit script thread.
+
+    python notifications.py publish opportunities "New workshop" "Sign up at ..."
+"""
+import argparse
+import asyncio
+import logging
+import os
+import quopri
+import random
+import secrets
+import smtplib
+import sys
+import threading
+import time
+import unicodedata
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from email.header import Header
+from email.utils import formataddr, formatdate, parseaddr
+
+from db import DATA_DIR, LocalConnection, connect
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    token TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    confirmed_at REAL,
+    confirm_sent_at REAL,
+    UNIQUE (email, topic)
+);
+CREATE INDEX IF NOT EXISTS subscriptions_topic ON subscriptions(topic, active, id);
+CREATE TABLE IF NOT EXISTS notifications (
+    id INTEGER PRIMARY KEY,
+    created_at REAL NOT NULL,
+    topic TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    delivered_upto INTEGER NOT NULL DEFAULT 0,
+    claimed_by TEXT,
+    claimed_at REAL,
+    done_at REAL
+);
+CREATE TABLE IF NOT EXISTS deliveries (
+    notification_id INTEGER NOT NULL REFERENCES notifications(id),
+    subscription_id INTEGER NOT NULL REFERENCES subscriptions(id),
+    done_at REAL NOT NULL,
+    PRIMARY KEY (notification_id, subscription_id)
+) WITHOUT ROWID;
+"""
+
+# Subscribers to new participation opportunities (the Stay Informed card)
+OPPORTUNITIES = "opportunities"
+
+SENDER = os.environ.get("AIANDME_MAIL_FROM", "AI & Me Amsterdam <noreply@aiandme.amsterdam.nl>")
+# Where the app is reached, for the confirm and unsubscribe links in emails
+PUBLIC_URL = os.environ.get("AIANDME_PUBLIC_URL", "https://aiandme.amsterdam.nl").rstrip("/")
+# Seconds before subscribing an unconfirmed address again resends the
+# confirmation email
+CONFIRM_INTERVAL = 60 * 60
+# Seconds a notifier holds an unfinished notification without reporting
+# progress before another process may take it over
+LEASE = 5 * 60
+OUTBOX_DIR = os.path.join(DATA_DIR, "outbox")
+
+
+def clean_email(email):
+    # Returns the address stripped and lowercased, or raises ValueError.
+    # Addresses end up in a To: header, so whitespace and control
+    # characters, which could start a header of their own, are refused, and
+    # the address must come out of parseaddr unchanged: no display name, no
+    # angle brackets, no second address.
+    email = email.strip().lower()
+    if (any(ch.isspace() or unicodedata.category(ch).startswith("C") for ch in email)
+            or parseaddr(email) != ("", email) or email.count("@") != 1):
+        raise ValueError("Please enter a valid email address")
+    local, _, domain = email.partition("@")
+    if not local or "." not in domain.strip(".") or ".." in domain:
+        raise ValueError("Please enter a valid email address")
+    return email
+
+
+def link(action, token):
+    # ?confirm=<token> and ?unsubscribe=<token> are handled by the app
+    return f"{PUBLIC_URL}/?{action}={token}"
+
+
+def feedback_topic(feedback_id):
+    # Status updates on one piece of feedback go to whoever submitted it
+    return f"feedback:{feedback_id}"
+
+
+def booking_topic(booking_id):
+    # Confirmations and waitlist updates for one workshop booking
+    return f"booking:{booking_id}"
+
+
+def _quoted_printable(text):
+    return quopri.encodestring(text.replace("\r\n", "\n").encode()).decode().replace("\n", "\r\n")
+
+
+class MessageTemplate:
+    # Headers and body are encoded once per notification; each recipient
+    # only adds its own To, Message-ID and unsubscribe token. Building an
+    # EmailMessage per recipient costs milliseconds, which adds up to
+    # minutes on a large fan-out.
+
+    FOOTER = ("\n\n--\nYou receive this because this address was subscribed on AI & Me. To stop these "
+              "emails, open {url}\n")
+
+    def __init__(self, subject, body, sender=SENDER):
+        name, self.sender = parseaddr(sender)
+        # A line break in the subject would end the header
+        subject = " ".join(subject.split())
+        if not subject.isascii():
+            # Folded with CRLF, as SMTP expects
+            subject = Header(subject, "utf-8", header_name="Subject").encode(linesep="\r\n")
+        self._head = (
+            f"From: {formataddr((name, self.sender))}\r\n"
+            f"Subject: {subject}\r\n"
+            f"Date: {formatdate(localtime=True)}\r\n"
+            "MIME-Version: 1.0\r\n"
+            "Content-Type: text/plain; charset=utf-8\r\n"
+            "Content-Transfer-Encoding: quoted-printable\r\n"
+        )
+        self._body = _quoted_printable(body)
+
+    def render(self, email, token):
+        return (
+            f"{self._head}To: {email}\r\n"
+            f"Message-ID: <{uuid.uuid4().hex}@{self.sender.partition('@')[2]}>\r\n"
+            f"List-Unsubscribe: <{link('unsubscribe', token)}>\r\n"
+            f"\r\n{self._body}{_quoted_printable(self.FOOTER.format(url=link('unsubscribe', token)))}"
+        ).encode()
+
+
+class OutboxTransport:
+    # Stand-in for a mail server: every message becomes an .eml file
+
+    def __init__(self, directory=OUTBOX_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def send(self, sender, messages, done):
+        for recipient, data in messages:
+            path = os.path.join(self.directory, f"{time.time():.6f}-{uuid.uuid4().hex[:8]}.eml")
+            with open(path, "wb") as f:
+                f.write(data)
+            done(recipient)
+
+
+class SMTPTransport:
+    # One connection per batch. Transports call done(recipient) for every
+    # message as soon as it is out of their hands, sent or rejected for
+    # good; messages the server refused temporarily are left for a retry.
+
+    def __init__(self, host, port=25, username=None, password=None, starttls=False):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+
+    def send(self, sender, messages, done):
+        # messages are (recipient, encoded message) pairs
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            for recipient, data in messages:
+                try:
+                    smtp.sendmail(sender, [recipient], data)
+                except smtplib.SMTPRecipientsRefused:
+                    logger.warning("Recipient refused: %s", recipient)
+                except smtplib.SMTPResponseException as exc:
+                    if exc.smtp_code < 500:
+                        continue
+                    logger.warning("Message to %s rejected: %s", recipient, exc)
+                done(recipient)
+
+
+def default_transport():
+    host = os.environ.get("AIANDME_SMTP_HOST")
+    if not host:
+        return OutboxTransport()
+    return SMTPTransport(
+        host, int(os.environ.get("AIANDME_SMTP_PORT", "25")),
+        os.environ.get("AIANDME_SMTP_USER"), os.environ.get("AIANDME_SMTP_PASSWORD"),
+        os.environ.get("AIANDME_SMTP_STARTTLS") == "1",
+    )
+
+
+class Notifier:
+    # Subscriptions are written directly; deliveries run on an event loop in
+    # a daemon thread. Database work goes through a single-thread executor
+    # and transport calls through a small pool, at most `concurrency`
+    # batches in flight. Every message is recorded in deliveries as it goes
+    # out, and the subscriber cursor after every round of batches, so an
+    # interrupted fan-out resumes without sending anything twice.
+    #
+    # Several notifiers can share a database (app workers, the publish
+    # CLI). A notification belongs to the notifier that claimed it, for as
+    # long as it keeps renewing the claim with its progress; unfinished
+    # notifications whose claim ran out are taken over by whichever
+    # resuming notifier claims them first.
+
+    def __init__(self, path=None, transport=None, batch_size=500, concurrency=4, max_attempts=5,
+                 backoff=1.0, resume=True):
+        self._transport = transport or default_transport()
+        self._batch_size = batch_size
+        self._concurrency = concurrency
+        self._max_attempts = max_attempts
+        self._backoff = backoff
+        self._writer = LocalConnection(path)
+        self._owner = uuid.uuid4().hex
+        # Notifications this notifier is sending right now
+        self._active = set()
+        self.stats = Counter()
+
+        self._conn = connect(path)
+        self._conn.executescript(SCHEMA)
+        self._db = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify-db")
+        self._pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notify-send")
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="notifier", daemon=True).start()
+        if resume:
+            asyncio.run_coroutine_threadsafe(self._resume(), self._loop)
+
+    def subscribe(self, email, topic=OPPORTUNITIES, confirmed=False):
+        # Returns the unsubscribe token. Fan-outs only go to confirmed
+        # subscriptions; until then, subscribing sends an email with a
+        # confirmation link, at most once per CONFIRM_INTERVAL so the form
+        # can't be used to flood an inbox. confirmed=True is for updates on
+        # something the address's owner just did on the site, which that
+        # first update confirms just as well.
+        email = clean_email(email)
+        conn = self._writer()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT token, active, confirmed_at, confirm_sent_at FROM subscriptions "
+                "WHERE email = ? AND topic = ?", (email, topic),
+            ).fetchone()
+            if row is None:
+                token = secrets.token_urlsafe(16)
+                confirmed_at = sent_at = None
+                conn.execute("INSERT INTO subscriptions (email, topic, token, created_at) VALUES (?, ?, ?, ?)",
+                             (email, topic, token, now))
+            else:
+                # Subscribing again after unsubscribing needs a new confirmation
+                token = row["token"]
+                confirmed_at, sent_at = None, None
+                if row["active"]:
+                    confirmed_at, sent_at = row["confirmed_at"], row["confirm_sent_at"]
+            if confirmed:
+                confirmed_at = confirmed_at or now
+            send = confirmed_at is None and (sent_at is None or now - sent_at >= CONFIRM_INTERVAL)
+            conn.execute(
+                "UPDATE subscriptions SET active = 1, confirmed_at = ?, confirm_sent_at = ? WHERE token = ?",
+                (confirmed_at, now if send else sent_at, token),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if send:
+            asyncio.run_coroutine_threadsafe(self._confirmation(email, token), self._loop)
+        return token
+
+    def confirm(self, token):
+        # True when the subscription is active and confirmed
+        return bool(self._writer().execute(
+            "UPDATE subscriptions SET confirmed_at = COALESCE(confirmed_at, ?) WHERE token = ? AND active = 1",
+            (time.time(), token),
+        ).rowcount)
+
+    def unsubscribe(self, token):
+        # True when the token is known, also when it was used before
+        return bool(self._writer().execute(
+            "UPDATE subscriptions SET active = 0 WHERE token = ?", (token,)
+        ).rowcount)
+
+    def publish(self, topic, subject, body):
+        # Returns a concurrent.futures.Future that resolves to the number of
+        # messages sent once the fan-out is done
+        return asyncio.run_coroutine_threadsafe(self._publish(topic, subject, body), self._loop)
+
+    async def _run_db(self, func, *args):
+        return await self._loop.run_in_executor(self._db, func, *args)
+
+    def _create(self, topic, subject, body):
+        now = time.time()
+        return self._conn.execute(
+            "INSERT INTO notifications (created_at, topic, subject, body, claimed_by, claimed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)", (now, topic, subject, body, self._owner, now),
+        ).lastrowid
+
+    def _claim(self):
+        # Claims the unfinished notifications nobody holds a live claim on,
+        # and returns them with the ones this notifier already holds
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "UPDATE notifications SET claimed_by = ?, claimed_at = ? WHERE done_at IS NULL "
+                "AND claimed_by IS NOT ? AND (claimed_at IS NULL OR claimed_at < ?)",
+                (self._owner, now, self._owner, now - LEASE),
+            )
+            rows = self._conn.execute(
+                "SELECT id, topic, subject, body, delivered_upto FROM notifications "
+                "WHERE done_at IS NULL AND claimed_by = ?", (self._owner,),
+            ).fetchall()
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return rows
+
+    def _subscribers(self, notification_id, topic, after, limit):
+        # Skips subscribers the notification already went out to, in a
+        # round that was interrupted before its cursor was stored
+        return self._conn.execute(
+            "SELECT id, email, token FROM subscriptions s WHERE topic = ? AND active = 1 AND id > ? "
+            "AND confirmed_at IS NOT NULL AND NOT EXISTS (SELECT 1 FROM deliveries d "
+            "WHERE d.notification_id = ? AND d.subscription_id = s.id) ORDER BY id LIMIT ?",
+            (topic, after, notification_id, limit),
+        ).fetchall()
+
+    def _delivered(self, notification_id, subscription_id):
+        # Runs on the transport threads, once per message
+        self._writer().execute(
+            "INSERT OR IGNORE INTO deliveries (notification_id, subscription_id, done_at) VALUES (?, ?, ?)",
+            (notification_id, subscription_id, time.time()),
+        )
+
+    def _progress(self, notification_id, upto, done):
+        # Stores the cursor and renews the claim. Returns False when another
+        # notifier has taken the notification over, which then finishes it.
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            owned = self._conn.execute(
+                "UPDATE notifications SET delivered_upto = ?, claimed_at = ?, done_at = ? "
+                "WHERE id = ? AND claimed_by = ?",
+                (upto, now, now if done else None, notification_id, self._owner),
+            ).rowcount
+            if owned and done:
+                self._conn.execute("DELETE FROM deliveries WHERE notification_id = ?", (notification_id,))
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return bool(owned)
+
+    async def _publish(self, topic, subject, body):
+        notification_id = await self._run_db(self._create, topic, subject, body)
+        return await self._fan_out(notification_id, topic, subject, body, 0)
+
+    async def _confirmation(self, email, token):
+        template = MessageTemplate(
+            "Please confirm your subscription",
+            "Someone, hopefully you, asked to receive emails from AI & Me Amsterdam at this address. To "
+            f"confirm, open this link:\n\n{link('confirm', token)}\n\nIf it wasn't you, ignore this email and "
+            "you won't hear from us again.",
+        )
+        await self._deliver(template, [(None, email, token)])
+
+    async def _resume(self):
+        # Picks up unfinished notifications on start, and later those of
+        # notifiers that stopped without finishing
+        while True:
+            try:
+                for row in await self._run_db(self._claim):
+                    if row[0] in self._active:
+                        continue
+                    logger.info("Resuming notification %s after subscriber %s", row[0], row[4])
+                    await self._fan_out(*row)
+            except Exception:
+                logger.exception("Resuming notifications failed")
+            await asyncio.sleep(LEASE / 2)
+
+    async def _fan_out(self, notification_id, topic, subject, body, after):
+        self._active.add(notification_id)
+        try:
+            return await self._send_all(notification_id, topic, subject, body, after)
+        finally:
+            self._active.discard(notification_id)
+
+    async def _send_all(self, notification_id, topic, subject, body, after):
+        template = MessageTemplate(subject, body)
+        sent = 0
+        while True:
+            batches = []
+            for _ in range(self._concurrency):
+                batch = await self._run_db(self._subscribers, notification_id, topic, after, self._batch_size)
+                if not batch:
+                    break
+                batches.append(batch)
+                after = batch[-1][0]
+            if batches:
+                results = await asyncio.gather(*(self._deliver(template, batch, notification_id)
+                                                 for batch in batches))
+                sent += sum(results)
+            if not await self._run_db(self._progress, notification_id, after, not batches):
+                logger.warning("Notification %s was taken over by another notifier", notification_id)
+                return sent
+            if not batches:
+                return sent
+
+    async def _deliver(self, template, batch, notification_id=None):
+        # Retries only the messages the transport hasn't reported done, also
+        # when it failed halfway through a batch
+        pending = {email: (subscription_id, template.render(email, token))
+                   for subscription_id, email, token in batch}
+
+        def done(email):
+            subscription_id, _ = pending.pop(email)
+            self.stats["sent"] += 1
+            if notification_id is not None:
+                self._delivered(notification_id, subscription_id)
+
+        for attempt in range(1, self._max_attempts + 1):
+            messages = [(email, data) for email, (_, data) in pending.items()]
+            try:
+                await self._loop.run_in_executor(self._pool, self._transport.send, template.sender, messages,
+                                                 done)
+            except Exception as exc:
+                error = exc
+            else:
+                error = None
+            if not pending:
+                break
+            if attempt == self._max_attempts:
+                logger.warning("Giving up on %d messages after %d attempts: %s", len(pending), attempt, error)
+                self.stats["failed"] += len(pending)
+                break
+            self.stats["retries"] += 1
+            # Exponential backoff with jitter, so retries from many batches spread out
+            await asyncio.sleep(self._backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+        return len(batch) - len(pending)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    publish = commands.add_parser("publish", help="send a notification to a topic's subscribers")
+    publish.add_argument("topic")
+    publish.add_argument("subject")
+    publish.add_argument("body")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Leaves unfinished notifications to the app's notifier, which resumes them
+    notifier = Notifier(resume=False)
+    start = time.perf_counter()
+    sent = notifier.publish(args.topic, args.subject, args.body).result()
+    print(f"sent {sent} messages in {time.perf_counter() - start:.1f}s "
+          f"({notifier.stats['retries']} retries, {notifier.stats['failed']} failed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
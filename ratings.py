@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import Counter
+
+from db import BufferedWriter
+
+# Questions of the "Was this explanation helpful?" block, by key
+QUESTIONS = {
+    "clarity": "Was the explanation clear and easy to understand?",
+    "care": "Did the explanation feel human and considerate?",
+    "usefulness": "Did you learn about your rights related to this system?",
+}
+ANSWERS = ["yes", "somewhat", "no"]
+
+WINDOW_DAYS = 30
+
+# Only daily histograms are stored, never individual ratings
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rating_days (
+    algorithm TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (algorithm, day, question, answer)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rating_totals (
+    algorithm TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (algorithm, question, answer)
+) WITHOUT ROWID;
+"""
+
+
+def _day(timestamp):
+    # Days since the epoch, in UTC
+    return int(timestamp // 86400)
+
+
+class _Histograms:
+    # Rating counts of one algorithm: all time, per day for the last
+    # WINDOW_DAYS days, and the running sum of those days. Days that leave
+    # the window are subtracted from the sum, so reading it never adds up
+    # the days.
+
+    def __init__(self):
+        self.total = Counter()
+        self.days = {}
+        self.window = Counter()
+
+    def add(self, day, counts):
+        self.total.update(counts)
+        self.days.setdefault(day, Counter()).update(counts)
+        self.window.update(counts)
+
+    def expire(self, today):
+        for day in [day for day in self.days if day <= today - WINDOW_DAYS]:
+            self.window.subtract(self.days.pop(day))
+
+
+class RatingStore(BufferedWriter):
+    # Explanation ratings per algorithm. A rating updates the in-memory
+    # histograms, which dashboards read directly, and a pending batch that a
+    # background thread writes to the database every flush_interval seconds
+    # as one upsert per (algorithm, day, question, answer). The histograms
+    # are loaded from the database once, at startup.
+
+    def __init__(self, path=None, flush_interval=5.0):
+        super().__init__(path, flush_interval)
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._pending = Counter()
+        self._conn.executescript(SCHEMA)
+        self._load()
+        self._start("rating-flusher")
+
+    def _histogram(self, algorithm):
+        histogram = self._histograms.get(algorithm)
+        if histogram is None:
+            histogram = self._histograms[algorithm] = _Histograms()
+        return histogram
+
+    def _load(self):
+        today = _day(time.time())
+        for algorithm, question, answer, count in self._conn.execute(
+            "SELECT algorithm, question, answer, count FROM rating_totals"
+        ):
+            self._histogram(algorithm).total[question, answer] = count
+        for algorithm, day, question, answer, count in self._conn.execute(
+            "SELECT algorithm, day, question, answer, count FROM rating_days WHERE day > ?",
+            (today - WINDOW_DAYS,),
+        ):
+            histogram = self._histogram(algorithm)
+            histogram.days.setdefault(day, Counter())[question, answer] = count
+            histogram.window[question, answer] += count
+
+    def rate(self, algorithm, answers, now=None):
+        # answers maps question keys to answer keys; unanswered questions are
+        # left out. Returns the number of answers recorded.
+        counts = Counter((question, answer) for question, answer in answers.items()
+                         if question in QUESTIONS and answer in ANSWERS)
+        if not counts:
+            return 0
+        day = _day(time.time() if now is None else now)
+        with self._lock:
+            self._histogram(algorithm).add(day, counts)
+            for (question, answer), count in counts.items():
+                self._pending[algorithm, day, question, answer] += count
+        return sum(counts.values())
+
+    def histogram(self, algorithm, window=True):
+        # {question: {answer: count}} over the last WINDOW_DAYS days, or over
+        # all time with window=False
+        with self._lock:
+            histogram = self._histogram(algorithm)
+            if window:
+                histogram.expire(_day(time.time()))
+            counts = histogram.window if window else histogram.total
+            return {question: {answer: counts[question, answer] for answer in ANSWERS} for question in QUESTIONS}
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+            if not pending:
+                return 0
+            totals = Counter()
+            for (algorithm, day, question, answer), count in pending.items():
+                totals[algorithm, question, answer] += count
+
+            def put_back():
+                with self._lock:
+                    self._pending.update(pending)
+            with self._transaction(put_back) as conn:
+                conn.executemany(
+                    "INSERT INTO rating_days (algorithm, day, question, answer, count) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (algorithm, day, question, answer) DO UPDATE SET count = count + excluded.count",
+                    [(*key, count) for key, count in pending.items()],
+                )
+                conn.executemany(
+                    "INSERT INTO rating_totals (algorithm, question, answer, count) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (algorithm, question, answer) DO UPDATE SET count = count + excluded.count",
+                    [(*key, count) for key, count in totals.items()],
+                )
+            return sum(pending.values())
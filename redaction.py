@@ -0,0 +1,693 @@
+"""Redaction of personal details from feedback before it is published. Names,
+email addresses, BSN numbers, phone numbers, IBANs and addresses are replaced
+by placeholders in a process pool, off the feedback writer thread. Public
+pages and exports only show the redacted copy, and only once it exists.
+
+    python redaction.py backfill
+    python redaction.py bench --records 100000
+
+Backfill redacts public feedback that has no redacted copy by the current
+version, e.g. after the patterns changed. Bench pushes a burst of synthetic
+submissions through the pipeline and reports throughput and any personal
+details that were missed.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import queue
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import sidecar
+from db import connect
+from registry import SEED_ALGORITHMS
+
+logger = logging.getLogger(__name__)
+
+# Bump when the patterns or gazetteers change, so backfill redacts published
+# feedback again
+VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feedback_redacted (
+    feedback_id INTEGER PRIMARY KEY REFERENCES feedback(id),
+    version INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    details TEXT NOT NULL,
+    impact TEXT,
+    redactions INTEGER NOT NULL,
+    redacted_at REAL NOT NULL
+);
+"""
+
+# Public feedback as shown on the site: the redacted text, never the name or
+# email of the submitter
+PUBLIC_SELECT = ("SELECT f.id, f.created_at, f.kind, f.system, f.topic, r.title, r.details, r.impact "
+                 "FROM feedback f JOIN feedback_redacted r ON r.feedback_id = f.id")
+
+CHUNK_SIZE = 250
+BACKFILL_CHUNK_SIZE = 5000
+# Finished chunks written per transaction
+WRITE_BATCH = 16
+# A chunk that fails (a worker died, the write failed) is tried again after
+# RETRY_DELAY seconds, doubling each time, up to MAX_ATTEMPTS attempts
+MAX_ATTEMPTS = 5
+RETRY_DELAY = 1.0
+
+PLACEHOLDERS = {
+    "email": "[email]",
+    "iban": "[IBAN]",
+    "phone": "[phone]",
+    "bsn": "[BSN]",
+    "postcode": "[postcode]",
+    "address": "[address]",
+    "name": "[name]",
+}
+
+# Gazetteers. Given names and surnames common in Amsterdam, leaving out
+# the names in WORD_NAMES, which are also everyday words: those are only
+# names after a title or a cue, or capitalized as the submitter's own name.
+# Surnames that follow an infix ("de Vries", "van Dijk") are only names
+# after the infix.
+FIRST_NAMES = frozenset("""
+    Jan Piet Kees Henk Willem Johan Pieter Hendrik Gerrit Cornelis Dirk Klaas Joost Bart Ruud Sander
+    Thijs Lars Daan Bram Jeroen Wouter Maarten Niels Stijn Jesse Ruben Sven Luuk Sem Lucas Levi Noah
+    Tom Gijs Teun Jasper Rutger Erik Hans Peter Paul Marco Dennis Kevin Youssef Mohamed
+    Mohammed Ahmed Mustafa Mehmet Emre Hasan Ali Omar Karim Ibrahim Rachid Anna Emma Sophie Julia Lotte
+    Sanne Femke Anouk Eva Lisa Sara Saskia Ingrid Marieke Annemiek Esther Petra Monique
+    Linda Marloes Wilma Ans Mieke Tineke Lieke Noor Mila Tess Zoë Maria Ingeborg Hanneke
+    Fatima Fatma Samira Yasmina Khadija Aisha Ayşe Elif Zeynep Naima Nadia Priya Anjali Ravi
+""".split())
+WORD_NAMES = frozenset("Mark Roos Bos Frank Joke Iris Rob Fleur Els Hoop Wil".split())
+SURNAMES = frozenset("""
+    Jansen Janssen Visser Smit Meijer Mulder Bakker Dekker Brouwer Dijkstra Hendriks Peters Vermeulen
+    Willems Verhoeven Kuipers Postma Hoekstra Koster Prins Huisman Kramer Schouten Timmermans
+    Yılmaz Yilmaz Kaya Demir Şahin Çelik Aydın Öztürk Bouzid Benali Boukhari Ouali Amrani
+""".split())
+INFIX_SURNAMES = frozenset("""
+    Vries Jong Berg Dijk Boer Wit Graaf Leeuwen Bruijn Heuvel Veen Beek Wal Brink Meer Linden Broek
+    Vliet Laan Wijk Haan Groot Bosch Ven Velde Hoek Klerk
+""".split())
+INFIXES = frozenset("van de der den het ter ten te 't".split())
+TITLES = frozenset("mr mrs ms miss dr dhr mevr mevrouw meneer mw heer".split())
+# "my name is Anna", "ik heet Anna"
+NAME_CUES = frozenset(["name is", "naam is", "heet", "called", "named"])
+# A cue is as often followed by the name of a system ("it's called Social
+# Housing Allocation") or a date as by a person. Cued names don't start on
+# a word from a system name or a month, and a longer run of capitalized
+# words after a cue is taken for a title.
+SYSTEM_WORDS = frozenset(word for algorithm in SEED_ALGORITHMS for word in algorithm.name.split())
+MONTHS = frozenset("""
+    Jan Feb Mar Apr May Jun Jul Aug Sep Sept Oct Nov Dec Mrt Mei Okt
+    January February March April June July August September October November December
+    Januari Februari Maart Juni Juli Augustus Oktober
+""".split())
+MAX_CUED_WORDS = 3
+
+# Streets written without a street suffix, in the old centre mostly
+STREETS = """
+    Damrak Rokin Spui Singel Nieuwmarkt Westermarkt Nieuwendijk Zeedijk Overtoom Kinkerstraat
+    Amstel Buiksloterham Bijlmerdreef Osdorpplein Javastraat Dapperstraat
+""".split()
+STREET_SUFFIXES = ("straat", "laan", "weg", "plein", "gracht", "kade", "dijk", "singel", "steeg", "dreef",
+                   "baan", "markt", "hof", "pad", "plantsoen", "burgwal", "wal")
+
+# One pass over the text finds every structured detail; the order of the
+# alternatives decides which wins where two could match
+_PATTERNS = {
+    "email": r"(?<![\w.+-])[\w.+-]+@[\w-]+(?:\.[\w-]+)+",
+    "iban": r"\b[A-Z]{2}\d{2}(?: ?[A-Z0-9]{4}){2,7}(?: ?[A-Z0-9]{1,3})?\b",
+    "phone": r"(?<![\w+])(?:\+31|0031|0)[\s-]?(?:\(0\)[\s-]?)?\d(?:[\s-]?\d){8}(?!\d)",
+    "bsn": r"(?<![\w.,-])(?:\d{9}|\d{4}[ .]\d{2}[ .]\d{3}|\d{3}[ .]\d{3}[ .]\d{3})(?!\w|[.,-]\d)",
+    "postcode": r"\b[1-9]\d{3} ?(?!SA|SD|SS)[A-Z]{2}\b",
+    "address": (r"\b(?=[A-Zv])(?:(?:Eerste|Tweede|Derde|Nieuwe|Oude|Korte|Lange|Prins|Van|van) )*"
+                r"(?:\b(?:" + "|".join(STREETS) + r")|\b[A-Z][\w'-]*(?:" + "|".join(STREET_SUFFIXES) + r"))"
+                r" \d{1,4}(?:-\d{1,4})?(?: ?[A-Za-z](?![\w'-])| ?-?(?:hs|huis|[1-4]?hoog|I{1,3})\b)?"),
+}
+_STRUCTURED_RE = re.compile("|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _PATTERNS.items()))
+# Every kind but email has digits, so text without "@" or digits is skipped
+_DIGIT_RE = re.compile(r"\d")
+_WORD_RE = re.compile(r"[^\W\d_](?:[\w'’-]*[^\W\d_])?")
+
+
+def valid_bsn(number):
+    # The 11-proof: digits weighted 9 down to 2, the last one by -1
+    digits = [int(ch) for ch in number if ch.isdigit()]
+    if len(digits) != 9:
+        return False
+    return sum(d * w for d, w in zip(digits, (9, 8, 7, 6, 5, 4, 3, 2, -1))) % 11 == 0 and any(digits)
+
+
+def valid_iban(iban):
+    iban = iban.replace(" ", "")
+    if not 15 <= len(iban) <= 34:
+        return False
+    return int("".join(str(int(ch, 36)) for ch in iban[4:] + iban[:4])) % 97 == 1
+
+
+_VALIDATORS = {"bsn": valid_bsn, "iban": valid_iban}
+
+
+def _structured(text, counts):
+    if "@" not in text and not _DIGIT_RE.search(text):
+        return text
+
+    def replace(match):
+        kind = match.lastgroup
+        validate = _VALIDATORS.get(kind)
+        if validate and not validate(match.group()):
+            return match.group()
+        counts[kind] += 1
+        return PLACEHOLDERS[kind]
+    return _STRUCTURED_RE.sub(replace, text)
+
+
+def _joined(text, left, right, allowed=""):
+    # Two words are part of one name when only spaces (or the allowed
+    # characters) stand between them
+    gap = text[left.end():right.start()]
+    return gap.strip(" \u00a0" + allowed) == ""
+
+
+def _date(text, word):
+    # "Jan 5", "5 jan.", "Jan 2024": a month next to a number
+    return bool(re.match(r"\.? ?\d", text[word.end():]) or re.search(r"\d\.? ?$", text[:word.start()]))
+
+
+def _cued_run(text, words, i):
+    # Capitalized words joined from words[i] on, not counting infixes
+    count = 0
+    for j in range(i, len(words)):
+        if j > i and not _joined(text, words[j - 1], words[j]):
+            break
+        word = words[j].group()
+        if word.lower() in INFIXES:
+            continue
+        if not word[0].isupper():
+            break
+        count += 1
+    return count
+
+
+def _name_spans(text, extra=frozenset()):
+    # (start, end) of each name. A name starts at a gazetteer name, one of
+    # the submitter's own name parts, or a capitalized word after a title or
+    # a cue like "my name is"; it runs on over further given names and
+    # infixes to the surname.
+    words = list(_WORD_RE.finditer(text))
+    spans = []
+    i = 0
+    while i < len(words):
+        word = words[i].group()
+        lower = word.lower()
+        # "to be frank" from someone called Frank is not a name
+        own = lower in extra and (word[0].isupper() or lower.capitalize() not in WORD_NAMES)
+        if not word[0].isupper() and not own:
+            i += 1
+            continue
+        if own or word in SURNAMES:
+            start, given = i, own
+        elif word in FIRST_NAMES and not (word in MONTHS and _date(text, words[i])):
+            start, given = i, True
+        elif i and word in INFIX_SURNAMES and words[i - 1].group().lower() in INFIXES \
+                and _joined(text, words[i - 1], words[i]):
+            start, given = i, False
+        elif i and (words[i - 1].group().lower() in TITLES and _joined(text, words[i - 1], words[i], ".")
+                    or words[i - 1].group().lower() in NAME_CUES
+                    or i > 1 and f"{words[i - 2].group()} {words[i - 1].group()}".lower() in NAME_CUES) \
+                and word not in SYSTEM_WORDS and word not in MONTHS \
+                and _cued_run(text, words, i) <= MAX_CUED_WORDS:
+            start, given = i, True
+        else:
+            i += 1
+            continue
+        # "de Vries", "van der Berg": the infixes before a surname belong to it
+        while start and words[start - 1].group().lower() in INFIXES and _joined(text, words[start - 1], words[start]):
+            start -= 1
+        end = i
+        if given:
+            j = i + 1
+            while j < len(words) and _joined(text, words[j - 1], words[j]):
+                word = words[j].group()
+                if word.lower() in INFIXES:
+                    j += 1
+                    continue
+                if word[0].isupper():
+                    end = j
+                    if word in FIRST_NAMES:
+                        j += 1
+                        continue
+                break
+        spans.append((words[start].start(), words[end].end()))
+        i = end + 1
+    return spans
+
+
+def redact(text, name=None, email=None):
+    # Returns (redacted text, Counter of redactions by kind). The submitter's
+    # name and email, when given, are redacted wherever they occur.
+    counts = Counter()
+    if not text:
+        return text, counts
+    if email:
+        text, n = re.subn(re.escape(email), PLACEHOLDERS["email"], text, flags=re.IGNORECASE)
+        if n:
+            counts["email"] += n
+    text = _structured(text, counts)
+    extra = frozenset(part.lower() for part in _WORD_RE.findall(name or "") if len(part) > 1
+                      and part.lower() not in INFIXES)
+    spans = _name_spans(text, extra)
+    if spans:
+        counts["name"] += len(spans)
+        parts, last = [], 0
+        for start, end in spans:
+            parts += [text[last:start], PLACEHOLDERS["name"]]
+            last = end
+        text = "".join(parts) + text[last:]
+    return text, counts
+
+
+def redact_rows(rows):
+    # Runs in a worker process. rows are (id, title, details, impact, name,
+    # email); returns (id, title, details, impact, Counter) per row and the
+    # seconds spent.
+    start = time.perf_counter()
+    redacted = []
+    for feedback_id, title, details, impact, name, email in rows:
+        counts = Counter()
+        texts = []
+        for text in (title, details, impact):
+            text, found = redact(text, name, email)
+            counts.update(found)
+            texts.append(text)
+        redacted.append((feedback_id, *texts, counts))
+    return redacted, time.perf_counter() - start
+
+
+class RedactionMetrics:
+    # Counters for the /metrics/redaction sidecar endpoint and the bench
+    # report. Throughput is the rows redacted over the last minute.
+
+    WINDOW = 60.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.redacted = 0
+        self.failed = 0
+        self.retried = 0
+        self.worker_seconds = 0.0
+        self.redactions = Counter()
+        self._recent = deque()
+
+    def observe_submitted(self, rows):
+        with self._lock:
+            self.submitted += rows
+
+    def observe_failed(self, rows):
+        with self._lock:
+            self.failed += rows
+
+    def observe_retried(self, rows):
+        with self._lock:
+            self.retried += rows
+
+    def observe_redacted(self, rows, worker_seconds, redactions):
+        now = time.monotonic()
+        with self._lock:
+            self.redacted += rows
+            self.worker_seconds += worker_seconds
+            self.redactions.update(redactions)
+            self._recent.append((now, rows))
+
+    def snapshot(self):
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0][0] > self.WINDOW:
+                self._recent.popleft()
+            window = min(self.WINDOW, now - self._recent[0][0]) if self._recent else 0
+            return {
+                "submitted": self.submitted,
+                "redacted": self.redacted,
+                "failed": self.failed,
+                "retried": self.retried,
+                "pending": self.submitted - self.redacted - self.failed,
+                "rows_per_second": sum(rows for _, rows in self._recent) / window if window else 0.0,
+                "worker_seconds": self.worker_seconds,
+                "redactions": dict(self.redactions),
+            }
+
+    def prometheus(self):
+        stats = self.snapshot()
+        lines = [
+            "# HELP aiandme_redaction_rows_total Feedback rows by redaction state.",
+            "# TYPE aiandme_redaction_rows_total counter",
+        ]
+        for state in ("submitted", "redacted", "failed"):
+            lines.append(f'aiandme_redaction_rows_total{{state="{state}"}} {stats[state]}')
+        for metric, kind, key, help_text in (
+            ("aiandme_redaction_pending", "gauge", "pending", "Rows waiting for redaction."),
+            ("aiandme_redaction_retries_total", "counter", "retried", "Rows sent to the pool again after a failure."),
+            ("aiandme_redaction_rows_per_second", "gauge", "rows_per_second", "Rows redacted per second over the last minute."),
+            ("aiandme_redaction_worker_seconds_total", "counter", "worker_seconds", "Time spent redacting in worker processes."),
+        ):
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}", f"{metric} {stats[key]}"]
+        lines += [
+            "# HELP aiandme_redactions_total Personal details replaced, by kind.",
+            "# TYPE aiandme_redactions_total counter",
+        ]
+        for kind in PLACEHOLDERS:
+            lines.append(f'aiandme_redactions_total{{kind="{kind}"}} {stats["redactions"].get(kind, 0)}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = RedactionMetrics()
+
+
+@sidecar.route("/metrics/redaction")
+def metrics_endpoint(query):
+    return 200, "text/plain; version=0.0.4", METRICS.prometheus().encode()
+
+
+def install(conn):
+    conn.executescript(SCHEMA)
+
+
+class Redactor:
+    # Feedback rows are sent to a process pool in chunks; a single writer
+    # thread stores the finished chunks, several per transaction, and hands
+    # the newly published rows to the listeners. At most `max_pending`
+    # chunks are in flight, so submitting a large backlog blocks until the
+    # pool catches up instead of queueing every row in memory. A chunk that
+    # fails keeps its slot while it is retried. Workers are spawned rather
+    # than forked, since the app process runs threads.
+
+    def __init__(self, path=None, workers=None, chunk_size=CHUNK_SIZE, max_pending=None):
+        self._path = path
+        self._chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = self._new_pool()
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending or 4 * self.workers)
+        self._done = queue.Queue()
+        self._listeners = []
+        # Rows submitted and not yet stored, for flush()
+        self._in_flight = 0
+        self._idle = threading.Condition()
+
+        self._conn = connect(path)
+        install(self._conn)
+        self._writer = threading.Thread(target=self._run, name="redaction-writer", daemon=True)
+        self._writer.start()
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _submit_chunk(self, chunk):
+        pool = self._pool
+        try:
+            return pool.submit(redact_rows, chunk)
+        except BrokenProcessPool:
+            # A worker died (killed, out of memory), which breaks the whole
+            # pool; later chunks go to a fresh one. Retries arrive from
+            # several threads, so only the first replaces it.
+            with self._pool_lock:
+                if self._pool is pool:
+                    logger.warning("Redaction pool broken, starting a new one")
+                    self._pool = self._new_pool()
+            return self._pool.submit(redact_rows, chunk)
+
+    def add_listener(self, callback):
+        # Called from the writer thread with the rows published for the
+        # first time, in the shape of PUBLIC_SELECT
+        self._listeners.append(callback)
+
+    def submit(self, rows):
+        # rows need id, title, details, impact, name and email. Returns the
+        # number of rows submitted. Failed chunks are retried; rows that
+        # still fail after MAX_ATTEMPTS are counted as failed and left to the
+        # next backfill.
+        items = [(row["id"], row["title"], row["details"], row["impact"], row["name"], row["email"])
+                 for row in rows]
+        for start in range(0, len(items), self._chunk_size):
+            chunk = items[start:start + self._chunk_size]
+            self._slots.acquire()
+            with self._idle:
+                self._in_flight += len(chunk)
+            METRICS.observe_submitted(len(chunk))
+            self._dispatch(chunk, 1)
+        return len(items)
+
+    def _dispatch(self, chunk, attempt):
+        try:
+            future = self._submit_chunk(chunk)
+        except Exception:
+            logger.exception("Submitting feedback for redaction failed")
+            self._retry(chunk, attempt)
+            return
+        future.add_done_callback(lambda future: self._done.put((future, chunk, attempt)))
+
+    def _retry(self, chunk, attempt):
+        if attempt >= MAX_ATTEMPTS:
+            logger.error("Giving up on redacting %d feedback rows after %d attempts", len(chunk), attempt)
+            self._finished(len(chunk), failed=True)
+            return
+        METRICS.observe_retried(len(chunk))
+        timer = threading.Timer(RETRY_DELAY * 2 ** (attempt - 1), self._dispatch, (chunk, attempt + 1))
+        timer.daemon = True
+        timer.start()
+
+    def backfill(self, chunk_size=BACKFILL_CHUNK_SIZE):
+        # Public feedback without a redacted copy by the current VERSION.
+        # Returns the number of rows submitted.
+        conn = connect(self._path)
+        try:
+            submitted, after = 0, 0
+            while True:
+                rows = conn.execute(
+                    "SELECT f.id, f.title, f.details, f.impact, f.name, f.email "
+                    "FROM feedback f LEFT JOIN feedback_redacted r ON r.feedback_id = f.id "
+                    "WHERE f.public = 1 AND f.id > ? AND (r.version IS NULL OR r.version < ?) "
+                    "ORDER BY f.id LIMIT ?",
+                    (after, VERSION, chunk_size),
+                ).fetchall()
+                if not rows:
+                    return submitted
+                submitted += self.submit(rows)
+                after = rows[-1]["id"]
+        finally:
+            conn.close()
+
+    def flush(self, timeout=None):
+        # Block until every row submitted so far is stored or has failed
+        with self._idle:
+            return self._idle.wait_for(lambda: self._in_flight == 0, timeout)
+
+    def _finished(self, rows, failed=False):
+        if failed:
+            METRICS.observe_failed(rows)
+        self._slots.release()
+        with self._idle:
+            self._in_flight -= rows
+            self._idle.notify_all()
+
+    def _run(self):
+        while True:
+            batch = [self._done.get()]
+            while len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self._done.get_nowait())
+                except queue.Empty:
+                    break
+            results, stored = [], []
+            for future, chunk, attempt in batch:
+                try:
+                    redacted, seconds = future.result()
+                except Exception:
+                    logger.exception("Redacting feedback failed")
+                    self._retry(chunk, attempt)
+                    continue
+                results += redacted
+                stored.append((chunk, attempt, seconds, sum((row[-1] for row in redacted), Counter())))
+            if not results:
+                continue
+            try:
+                published = self._write(results)
+            except Exception:
+                logger.exception("Storing redacted feedback failed")
+                for chunk, attempt, _, _ in stored:
+                    self._retry(chunk, attempt)
+                continue
+            for chunk, _, seconds, redactions in stored:
+                METRICS.observe_redacted(len(chunk), seconds, redactions)
+            for callback in self._listeners:
+                try:
+                    callback(published)
+                except Exception:
+                    logger.exception("Redaction listener failed")
+            for chunk, _, _, _ in stored:
+                self._finished(len(chunk))
+
+    def _write(self, results):
+        now = time.time()
+        ids = [row[0] for row in results]
+        placeholders = ", ".join("?" * len(ids))
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            known = {row[0] for row in self._conn.execute(
+                f"SELECT feedback_id FROM feedback_redacted WHERE feedback_id IN ({placeholders})", ids
+            )}
+            self._conn.executemany(
+                "INSERT INTO feedback_redacted (feedback_id, version, title, details, impact, redactions, "
+                "redacted_at) VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (feedback_id) DO UPDATE SET "
+                "version = excluded.version, title = excluded.title, details = excluded.details, "
+                "impact = excluded.impact, redactions = excluded.redactions, redacted_at = excluded.redacted_at",
+                [(feedback_id, VERSION, title, details, impact, sum(counts.values()), now)
+                 for feedback_id, title, details, impact, counts in results],
+            )
+            new = [feedback_id for feedback_id in ids if feedback_id not in known]
+            published = [dict(row) for row in self._conn.execute(
+                f"{PUBLIC_SELECT} WHERE f.id IN ({', '.join('?' * len(new))}) ORDER BY f.id", new
+            )] if new else []
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return published
+
+    def close(self):
+        self.flush()
+        self._pool.shutdown()
+
+
+# Synthetic submissions for the bench command: (template, kinds of the
+# personal details it holds)
+BENCH_TEMPLATES = [
+    ("My name is {name} and I live at {address}, {postcode}. The housing algorithm ranked me far too low.",
+     ["name", "address", "postcode"]),
+    ("Please call me on {phone} about my application, my BSN is {bsn}.", ["phone", "bsn"]),
+    ("The parking fine was sent to {email} but I was not the driver. Refund to {iban} please.",
+     ["email", "iban"]),
+    ("{name} from the neighborhood team told us the cameras only record plates.", ["name"]),
+    ("I have been waiting for social housing for three years as a single parent, while couples I know "
+     "got a home much faster. Is the algorithm biased?", []),
+]
+
+
+def bench_rows(count, seed=0):
+    # (title, details, {kind: value}) with valid BSNs and IBANs
+    rng = random.Random(seed)
+    first, last = sorted(FIRST_NAMES), sorted(SURNAMES | {f"de {name}" for name in INFIX_SURNAMES})
+
+    def bsn():
+        while True:
+            digits = [rng.randrange(10) for _ in range(8)]
+            check = sum(d * w for d, w in zip(digits, (9, 8, 7, 6, 5, 4, 3, 2))) % 11
+            if check < 10 and any(digits):
+                return "".join(map(str, digits + [check]))
+
+    def iban():
+        account = "".join(str(rng.randrange(10)) for _ in range(10))
+        check = 98 - int("".join(str(int(ch, 36)) for ch in f"ABNA{account}NL00")) % 97
+        return f"NL{check:02d}ABNA{account}"
+
+    makers = {
+        "name": lambda: f"{rng.choice(first)} {rng.choice(last)}",
+        "address": lambda: f"{rng.choice(STREETS[:6] + ['Kalverstraat', 'Herengracht', 'Sarphatistraat'])} "
+                           f"{rng.randrange(1, 400)}",
+        "postcode": lambda: f"{rng.randrange(1011, 1109)} {''.join(rng.choices('ABCEGHJKLMNPRTVWXZ', k=2))}",
+        "phone": lambda: f"06-{rng.randrange(10 ** 8):08d}",
+        "bsn": bsn,
+        "email": lambda: f"{rng.choice(first).lower()}.{rng.randrange(1000)}@example.nl",
+        "iban": iban,
+    }
+    for _ in range(count):
+        template, kinds = rng.choice(BENCH_TEMPLATES)
+        values = {kind: makers[kind]() for kind in kinds}
+        yield "Feedback", template.format(**values), values
+
+
+def bench(records, workers=None, chunk_size=CHUNK_SIZE, seed=0):
+    # Inserts a burst of public submissions into a throwaway database, then
+    # times the backfill through the pool until every row is stored
+    from feedback_store import SCHEMA as FEEDBACK_SCHEMA
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        conn = connect(path)
+        conn.executescript(FEEDBACK_SCHEMA)
+        rows = list(bench_rows(records, seed))
+        conn.execute("BEGIN")
+        conn.executemany("INSERT INTO feedback (created_at, kind, title, details, public) VALUES (?, ?, ?, ?, 1)",
+                         [(time.time(), "concern", title, details) for title, details, _ in rows])
+        conn.execute("COMMIT")
+
+        redactor = Redactor(path, workers=workers, chunk_size=chunk_size)
+        start = time.perf_counter()
+        redactor.backfill()
+        redactor.flush()
+        seconds = time.perf_counter() - start
+        redactor.close()
+
+        missed = Counter()
+        for (_, _, values), (details,) in zip(rows, conn.execute(
+                "SELECT details FROM feedback_redacted ORDER BY feedback_id")):
+            missed.update(kind for kind, value in values.items() if value in details)
+        conn.close()
+    return {
+        "records": records,
+        "seconds": seconds,
+        "workers": redactor.workers,
+        "expected": Counter(kind for _, _, values in rows for kind in values),
+        "missed": missed,
+        "metrics": METRICS.snapshot(),
+    }
+
+
+def print_bench(result):
+    print(f"Redacted {result['records']:,} submissions with {result['workers']} workers in "
+          f"{result['seconds']:.2f} s, {result['records'] / max(result['seconds'], 1e-9):,.0f} rows/s "
+          f"({result['metrics']['worker_seconds']:.2f} s in workers)\n")
+    print(f"{'kind':<10}{'planted':>10}{'redacted':>10}{'missed':>8}")
+    for kind in PLACEHOLDERS:
+        print(f"{kind:<10}{result['expected'].get(kind, 0):>10,}"
+              f"{result['metrics']['redactions'].get(kind, 0):>10,}{result['missed'].get(kind, 0):>8,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    backfill = commands.add_parser("backfill", help="redact public feedback without a current redacted copy")
+    backfill.add_argument("--db", help="database path (default: the app's database)")
+    backfill.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    run = commands.add_parser("bench", help="time the pipeline on a burst of synthetic submissions")
+    run.add_argument("--records", type=int, default=100000, help="synthetic submissions")
+    run.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    run.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="rows per worker task")
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        print_bench(bench(args.records, args.workers, args.chunk_size))
+        return 0
+    redactor = Redactor(args.db, workers=args.workers)
+    start = time.perf_counter()
+    submitted = redactor.backfill()
+    redactor.flush()
+    redactor.close()
+    seconds = time.perf_counter() - start
+    stats = METRICS.snapshot()
+    print(f"Redacted {stats['redacted']:,} of {submitted:,} rows in {seconds:.2f} s "
+          f"({stats['failed']:,} failed)")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+# Tabs on the Understand page, in display order
+DOMAINS = ["Neighborhood", "City Services", "Mobility"]
+RISK_LEVELS = ["Low Risk", "Medium Risk", "High Risk"]
+
+FACETS = ("category", "risk", "neighborhood", "domain")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class Algorithm:
+    slug: str
+    name: str
+    description: str
+    category: str
+    risk: str
+    neighborhood: str
+    domain: str
+    # Slug of the detail page, if the system has one
+    page: Optional[str] = None
+
+
+# Systems currently listed on the platform
+SEED_ALGORITHMS = [
+    Algorithm("crowd-monitoring", "Crowd Monitoring System",
+              "AI that analyzes crowd density in public spaces to prevent overcrowding.",
+              "Public Safety", "Medium Risk", "Centrum", "Neighborhood"),
+    Algorithm("parking-enforcement", "Parking Enforcement AI",
+              "System that identifies parking violations using camera footage.",
+              "Mobility", "Low Risk", "Citywide", "Mobility"),
+    Algorithm("housing-allocation", "Social Housing Allocation",
+              "Algorithm that helps distribute social housing based on need and waiting time.",
+              "Housing", "High Risk", "Citywide", "City Services", page="housing-allocation"),
+    Algorithm("tourist-flow", "Tourist Flow Prediction",
+              "System that forecasts tourist movements to manage city resources.",
+              "Tourism", "Medium Risk", "Centrum", "Mobility"),
+    Algorithm("benefit-fraud", "Benefit Fraud Detection",
+              "AI that identifies potential fraud in social benefit applications.",
+              "Social Affairs", "High Risk", "Citywide", "City Services"),
+    Algorithm("waste-collection", "Waste Collection Optimization",
+              "AI that plans efficient routes for waste collection vehicles.",
+              "Waste Management", "Low Risk", "Citywide", "City Services"),
+]
+
+
+class AlgorithmRegistry:
+    # In-memory registry with an inverted index over the searchable text and
+    # one posting set per facet value, so every query is a set intersection.
+
+    def __init__(self, algorithms=()):
+        self._items = []
+        self._by_slug = {}
+        self._terms = defaultdict(set)
+        self._sorted_terms = []
+        self._facets = {facet: defaultdict(set) for facet in FACETS}
+        for algorithm in algorithms:
+            self.add(algorithm)
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, algorithm):
+        if algorithm.slug in self._by_slug:
+            raise ValueError(f"Algorithm {algorithm.slug!r} is already registered")
+        doc_id = len(self._items)
+        self._items.append(algorithm)
+        self._by_slug[algorithm.slug] = doc_id
+
+        text = " ".join([algorithm.name, algorithm.description, algorithm.category,
+                         algorithm.neighborhood])
+        for term in set(tokenize(text)):
+            if term not in self._terms:
+                self._sorted_terms.insert(bisect_left(self._sorted_terms, term), term)
+            self._terms[term].add(doc_id)
+        for facet in FACETS:
+            self._facets[facet][getattr(algorithm, facet)].add(doc_id)
+        return doc_id
+
+    def get(self, slug):
+        doc_id = self._by_slug.get(slug)
+        return None if doc_id is None else self._items[doc_id]
+
+    def facet_values(self, facet):
+        return sorted(value for value, ids in self._facets[facet].items() if ids)
+
+    def _prefix_ids(self, prefix):
+        # Union of the postings of every term starting with prefix
+        ids = set()
+        i = bisect_left(self._sorted_terms, prefix)
+        while i < len(self._sorted_terms) and self._sorted_terms[i].startswith(prefix):
+            ids |= self._terms[self._sorted_terms[i]]
+            i += 1
+        return ids
+
+    def search_ids(self, query="", **facets):
+        # Facet arguments take a single value or a collection of accepted values
+        candidates = []
+        terms = tokenize(query)
+        for i, term in enumerate(terms):
+            # The last word is treated as a prefix so results update while typing
+            candidates.append(self._prefix_ids(term) if i == len(terms) - 1
+                              else self._terms.get(term, set()))
+        for facet, wanted in facets.items():
+            if not wanted:
+                continue
+            if isinstance(wanted, str):
+                wanted = [wanted]
+            index = self._facets[facet]
+            candidates.append(set().union(*(index.get(value, ()) for value in wanted)))
+
+        if not candidates:
+            return tuple(range(len(self._items)))
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for ids in candidates[1:]:
+            result &= ids
+            if not result:
+                break
+        return tuple(sorted(result))
+
+    def search(self, query="", **facets):
+        return [self._items[doc_id] for doc_id in self.search_ids(query, **facets)]
+
+    def by_ids(self, ids):
+        return [self._items[doc_id] for doc_id in ids]
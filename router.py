@@ -0,0 +1,59 @@
+import importlib
+from collections import namedtuple
+
+import streamlit as st
+
+from i18n import DEFAULT_LOCALE
+
+Route = namedtuple("Route", "title module function")
+
+# Pages by their ?page= slug, in sidebar order. A page's module is imported
+# the first time the page is shown, so startup doesn't grow with the number
+# of pages.
+ROUTES = {
+    "home": Route("Home", "views.home", "home_page"),
+    "understand": Route("Understand", "views.understand", "understand_page"),
+    "housing-allocation": Route("Housing Allocation", "views.housing_allocation", "housing_allocation_page"),
+    "question": Route("Question", "views.question", "question_page"),
+    "influence": Route("Influence", "views.influence", "influence_page"),
+}
+DEFAULT_PAGE = "home"
+
+# Query parameters that only apply to the page they were opened on, like
+# ?consultation= on the Influence page. Navigating drops them, so going back
+# to that page from the sidebar shows the page itself.
+PAGE_PARAMS = ("consultation",)
+
+
+def current_page():
+    # The page is kept in the session; a new session starts on the page
+    # from the URL, so links like ?page=housing-allocation open that page
+    page = st.session_state.get("page")
+    if page not in ROUTES:
+        page = st.query_params.get("page", DEFAULT_PAGE)
+        page = st.session_state.page = page if page in ROUTES else DEFAULT_PAGE
+    return page
+
+
+def go(page):
+    # Used as a widget callback, so the page changes before the rerun
+    st.session_state.page = page
+    for param in PAGE_PARAMS:
+        if param in st.query_params:
+            del st.query_params[param]
+    st.query_params["page"] = page
+
+
+def keep_language(lang):
+    # Mirrors the language into the URL, so copied links and reloads keep it
+    if st.query_params.get("lang", DEFAULT_LOCALE) == lang:
+        return
+    if lang == DEFAULT_LOCALE:
+        del st.query_params["lang"]
+    else:
+        st.query_params["lang"] = lang
+
+
+def render(page):
+    route = ROUTES[page]
+    getattr(importlib.import_module(route.module), route.function)()
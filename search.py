@@ -0,0 +1,193 @@
+import re
+import threading
+import unicodedata
+from array import array
+
+import numpy as np
+
+_WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+STOPWORDS = {
+    "en": frozenset("""
+        a about after all also am an and any are as at be because been but by can could did do
+        does for from had has have he her him his how i if in into is it its just me more my no
+        not of on or our she so some than that the their them then there these they this to too
+        us was we were what when where which who why will with would you your
+    """.split()),
+    "nl": frozenset("""
+        aan al als bij dan dat de deze die dit door een en er had heb hebben heeft het hier hij
+        hoe ik in is je kan maar me met mijn na naar niet nog nu of om omdat ons onze ook op over
+        te toch tot u uit van veel voor want was wat we wel werd wie wij worden wordt zal ze zich
+        zij zijn zo zou
+    """.split()),
+}
+ALL_STOPWORDS = STOPWORDS["en"] | STOPWORDS["nl"]
+
+_VOWELS = set("aeiouy")
+
+
+def _fold(text):
+    # Lowercase and strip accents so "één" and "een" match
+    text = text.lower()
+    if text.isascii():
+        return text
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def stem_en(word):
+    # Light English stemmer: the plural, -ed/-ing and -ly rules of Porter's
+    # first steps, which cover most of the variation in short feedback texts.
+    if len(word) <= 3:
+        return word
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ies"):
+        word = word[:-3] + "i"
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    for suffix in ("ingly", "edly", "ing", "ed", "ly"):
+        if word.endswith(suffix) and any(ch in _VOWELS for ch in word[:-len(suffix)]):
+            word = word[:-len(suffix)]
+            if len(word) > 2 and word[-1] == word[-2] and word[-1] not in "lsz":
+                word = word[:-1]
+            break
+    if word.endswith("y") and len(word) > 3:
+        word = word[:-1] + "i"
+    elif word.endswith("e") and len(word) > 4 and not word.endswith("ee"):
+        word = word[:-1]
+    return word
+
+
+def stem_nl(word):
+    # Light Dutch stemmer after the Snowball rules: -heden/-heid, plural -en
+    # and -s, final -e, then undouble the final consonant.
+    if len(word) <= 3:
+        return word
+    if word.endswith("heden"):
+        return word[:-5] + "heid"
+    for suffix in ("ende", "en", "se", "s", "e"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            stem = word[:-len(suffix)]
+            if suffix in ("s", "se") and stem[-1] in _VOWELS | {"j"}:
+                continue
+            word = stem
+            break
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in _VOWELS:
+        word = word[:-1]
+    if word.endswith("heid"):
+        word = word[:-4]
+    return word
+
+
+STEMMERS = {"en": stem_en, "nl": stem_nl}
+
+
+def detect_language(words):
+    nl = sum(word in STOPWORDS["nl"] for word in words)
+    en = sum(word in STOPWORDS["en"] for word in words)
+    return "nl" if nl > en else "en"
+
+
+def analyze(text, language=None):
+    words = _WORD_RE.findall(_fold(text))
+    stem = STEMMERS[language or detect_language(words)]
+    return [stem(word) for word in words if word not in ALL_STOPWORDS]
+
+
+def analyze_query(text):
+    # Queries are short and often lack stopwords to detect the language, so
+    # each word is looked up under both its English and Dutch stem.
+    words = [word for word in _WORD_RE.findall(_fold(text)) if word not in ALL_STOPWORDS]
+    return [{stem(word) for stem in STEMMERS.values()} for word in words]
+
+
+class SearchIndex:
+    # BM25 over an append-only inverted index. Postings are typed arrays so
+    # adding a document is a handful of appends and scoring a term is one
+    # vectorized numpy pass over its posting list. Filter fields are stored
+    # as integer codes, one array per field.
+
+    def __init__(self, fields=(), k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._postings = {}
+        self._doc_len = array("I")
+        self._total_len = 0
+        self._keys = array("q")
+        self._fields = {name: array("i") for name in fields}
+        self._codes = {name: {} for name in fields}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key, text, **fields):
+        terms = {}
+        for term in analyze(text):
+            terms[term] = terms.get(term, 0) + 1
+        with self._lock:
+            doc = len(self._keys)
+            self._keys.append(key)
+            self._doc_len.append(sum(terms.values()))
+            self._total_len += self._doc_len[-1]
+            for term, tf in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("I"), array("H"))
+                postings[0].append(doc)
+                postings[1].append(min(tf, 0xFFFF))
+            for name, column in self._fields.items():
+                codes = self._codes[name]
+                column.append(codes.setdefault(fields.get(name), len(codes)))
+        return doc
+
+    def search(self, query, limit=20, after=None, **filters):
+        # Returns (key, score) pairs, best first and equal scores by key.
+        # Each filter keeps only the documents whose field equals the given
+        # value. after, the (key, score) of the last hit on the previous
+        # page, continues the ranking below it.
+        words = analyze_query(query)
+        if not words:
+            return []
+        with self._lock:
+            n_docs = len(self._keys)
+            if not n_docs:
+                return []
+            avg_len = self._total_len / n_docs
+            doc_len = np.frombuffer(self._doc_len, dtype=np.uint32)
+            scores = np.zeros(n_docs)
+            words = [[self._postings[term] for term in stems if term in self._postings]
+                     for stems in words]
+            words = [terms for terms in words if terms]
+            # Words in more than half of all documents barely change the
+            # ranking but dominate the cost, so they only count on their own.
+            # A word's stems are judged together so that a rare alternative
+            # stem doesn't stand in for a common word.
+            rare = [terms for terms in words if sum(len(p[0]) for p in terms) * 2 <= n_docs]
+            for postings in [p for terms in rare or words for p in terms]:
+                docs = np.frombuffer(postings[0], dtype=np.uint32)
+                tf = np.frombuffer(postings[1], dtype=np.uint16).astype(np.float64)
+                idf = np.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+                norm = self.k1 * (1 - self.b + self.b * doc_len[docs] / avg_len)
+                scores[docs] += idf * tf * (self.k1 + 1) / (tf + norm)
+            for name, value in filters.items():
+                code = self._codes[name].get(value)
+                if code is None:
+                    return []
+                scores[np.frombuffer(self._fields[name], dtype=np.int32) != code] = 0
+
+            # Equal scores are ordered by key, so the ranking is a total
+            # order that pages can continue from. All documents tied at the
+            # cutoff are kept until the sort.
+            hits = np.flatnonzero(scores)
+            keys = np.frombuffer(self._keys, dtype=np.int64)
+            if after is not None:
+                last_key, last_score = after
+                hits = hits[(scores[hits] < last_score)
+                            | (scores[hits] == last_score) & (keys[hits] > last_key)]
+            if len(hits) > limit:
+                cutoff = np.partition(scores[hits], -limit)[-limit]
+                hits = hits[scores[hits] >= cutoff]
+            hits = hits[np.lexsort((keys[hits], -scores[hits]))][:limit]
+            return [(self._keys[doc], float(scores[doc])) for doc in hits]
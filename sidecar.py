@@ -0,0 +1,64 @@
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Local HTTP endpoint that runs next to the Streamlit server for things a
+# browser session shouldn't do, like serving metrics to a scraper.
+ROUTES = {}
+
+
+def route(path):
+    # Handlers take the parsed query string and return (status, content type,
+    # body), where body is bytes or an iterable of byte chunks that is
+    # streamed with chunked transfer encoding.
+    def register(handler):
+        ROUTES[path] = handler
+        return handler
+    return register
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        handler = ROUTES.get(url.path)
+        if handler is None:
+            self.send_error(404)
+            return
+        try:
+            status, content_type, body = handler(parse_qs(url.query))
+        except ValueError as exc:
+            self.send_error(400, str(exc))
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if isinstance(body, bytes):
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in body:
+            if chunk:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+def start(port, host="127.0.0.1"):
+    try:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    except OSError as exc:
+        # Another app process on this host already serves the endpoint
+        logger.warning("Sidecar not started on %s:%s: %s", host, port, exc)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="sidecar", daemon=True).start()
+    return server
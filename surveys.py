@@ -0,0 +1,231 @@
+"""Surveys on the Influence page. Answers are autosaved as drafts while
+people fill in a survey: changes are kept in memory per question, debounced
+and written in batches as upserts of the changed answers only. Completing a
+survey updates running tallies in the same transaction, so live results are
+a read of the tally table, never a pass over all responses.
+
+    python surveys.py results safety-cameras
+"""
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import namedtuple
+
+from db import BufferedWriter, LocalConnection
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS survey_drafts (
+    survey TEXT NOT NULL,
+    draft TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (survey, draft, question)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS survey_responses (
+    id INTEGER PRIMARY KEY,
+    survey TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    answers TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS survey_tallies (
+    survey TEXT NOT NULL,
+    question TEXT NOT NULL,
+    option TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (survey, question, option)
+) WITHOUT ROWID;
+"""
+
+Question = namedtuple("Question", "key kind prompt options")
+Survey = namedtuple("Survey", "title questions")
+
+# Question kinds: "choice" (one option), "multi" (any number of options),
+# "scale" (1 to 5) and "text" (free text, only counted)
+SCALE = ["1", "2", "3", "4", "5"]
+
+SURVEYS = {
+    "safety-cameras": Survey("Neighborhood Safety Cameras", [
+        Question("neighborhood", "choice", "Which district do you live in?", [
+            "Centrum", "Noord", "Oost", "Zuid", "West", "Nieuw-West", "Zuidoost", "Outside Amsterdam",
+        ]),
+        Question("feel-safe", "scale", "How safe do you feel in your neighborhood at night? (1 = not at all, 5 = very)",
+                 SCALE),
+        Question("support", "choice", "Would you support AI-powered safety cameras in your street?", [
+            "Yes", "Only with strict conditions", "No", "Not sure",
+        ]),
+        Question("concerns", "multi", "What concerns you about safety cameras?", [
+            "Privacy", "Misidentification", "Data retention", "Function creep", "Cost", "No concerns",
+        ]),
+        Question("conditions", "multi", "Which safeguards would you require?", [
+            "No facial recognition", "Images deleted within 24 hours", "Independent oversight",
+            "Public register of cameras", "Signs in the street",
+        ]),
+        Question("trust", "scale", "How much do you trust the city to use camera data responsibly? (1 = not at all, 5 = fully)",
+                 SCALE),
+        Question("comments", "text", "Anything else you want the city to know?", []),
+    ]),
+}
+
+# A text answer is tallied as answered, its content is kept in the response only
+ANSWERED = "answered"
+
+
+def _options(question, answer):
+    # Tally options an answer counts towards
+    if answer in (None, "", []):
+        return []
+    if question.kind == "text":
+        return [ANSWERED]
+    if question.kind == "multi":
+        return [option for option in answer if option in question.options]
+    return [answer] if answer in question.options else []
+
+
+class SurveyStore(BufferedWriter):
+    # Drafts, responses and tallies. save() only records the latest answer
+    # per (draft, question) in memory; a background thread writes drafts
+    # that have been quiet for `debounce` seconds, as one executemany of the
+    # changed questions. Tallies are updated when a response is completed.
+
+    def __init__(self, path=None, debounce=2.0):
+        super().__init__(path, debounce / 2)
+        self._reader = LocalConnection(path)
+        self._lock = threading.Lock()
+        # (survey, draft) -> {question: answer}, and when it last changed
+        self._pending = {}
+        self._changed = {}
+        self._conn.executescript(SCHEMA)
+        self._debounce = debounce
+        self._start("survey-flusher")
+
+    def draft(self, survey, draft):
+        answers = {row["question"]: json.loads(row["answer"]) for row in self._reader().execute(
+            "SELECT question, answer FROM survey_drafts WHERE survey = ? AND draft = ?", (survey, draft)
+        )}
+        with self._lock:
+            answers.update(self._pending.get((survey, draft), {}))
+        return {question: answer for question, answer in answers.items() if answer is not None}
+
+    def save(self, survey, draft, question, answer):
+        # None clears the answer
+        with self._lock:
+            self._pending.setdefault((survey, draft), {})[question] = answer
+            self._changed[survey, draft] = time.monotonic()
+
+    def flush(self, force=False):
+        # Writes drafts that are quiet for the debounce interval, or all of
+        # them with force=True. Returns the number of answers written.
+        now = time.monotonic()
+        with self._flush_lock:
+            with self._lock:
+                ready = [key for key, changed in self._changed.items() if force or now - changed >= self._debounce]
+                batch = {key: self._pending.pop(key) for key in ready}
+                for key in ready:
+                    del self._changed[key]
+            if not batch:
+                return 0
+            wall = time.time()
+            upserts = [(survey, draft, question, json.dumps(answer), wall)
+                       for (survey, draft), answers in batch.items()
+                       for question, answer in answers.items() if answer is not None]
+            deletes = [(survey, draft, question)
+                       for (survey, draft), answers in batch.items()
+                       for question, answer in answers.items() if answer is None]
+
+            def put_back():
+                # Back under any newer changes, which win
+                with self._lock:
+                    for key, answers in batch.items():
+                        self._pending[key] = {**answers, **self._pending.get(key, {})}
+                        self._changed.setdefault(key, now)
+            with self._transaction(put_back) as conn:
+                conn.executemany(
+                    "INSERT INTO survey_drafts (survey, draft, question, answer, updated_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (survey, draft, question) DO UPDATE SET answer = excluded.answer, "
+                    "updated_at = excluded.updated_at",
+                    upserts,
+                )
+                conn.executemany(
+                    "DELETE FROM survey_drafts WHERE survey = ? AND draft = ? AND question = ?", deletes
+                )
+            return len(upserts) + len(deletes)
+
+    def complete(self, survey, draft, answers):
+        # Stores the response, adds it to the tallies and drops the draft,
+        # in one transaction. Returns the response id.
+        questions = SURVEYS[survey].questions
+        answers = {question.key: answers[question.key] for question in questions
+                   if answers.get(question.key) not in (None, "", [])}
+        tallies = [(survey, question.key, option) for question in questions
+                   for option in _options(question, answers.get(question.key))]
+        # Holding the flush lock keeps a flush that already took this draft
+        # from writing it back after it is deleted
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop((survey, draft), None)
+                self._changed.pop((survey, draft), None)
+            conn = self._reader()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                response_id = conn.execute(
+                    "INSERT INTO survey_responses (survey, completed_at, answers) VALUES (?, ?, ?)",
+                    (survey, time.time(), json.dumps(answers)),
+                ).lastrowid
+                conn.executemany(
+                    "INSERT INTO survey_tallies (survey, question, option, count) VALUES (?, ?, ?, 1) "
+                    "ON CONFLICT (survey, question, option) DO UPDATE SET count = count + 1",
+                    tallies + [(survey, "", "completed")],
+                )
+                conn.execute("DELETE FROM survey_drafts WHERE survey = ? AND draft = ?", (survey, draft))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return response_id
+
+    def tallies(self, survey):
+        # ({question: {option: count}}, completed responses), options in the
+        # order of the survey definition
+        counts = {(row["question"], row["option"]): row["count"] for row in self._reader().execute(
+            "SELECT question, option, count FROM survey_tallies WHERE survey = ?", (survey,)
+        )}
+        results = {}
+        for question in SURVEYS[survey].questions:
+            options = question.options if question.kind != "text" else [ANSWERED]
+            results[question.key] = {option: counts.get((question.key, option), 0) for option in options}
+        return results, counts.get(("", "completed"), 0)
+
+    def close(self):
+        super().close()
+        # Drafts that weren't quiet long enough for the last flush
+        self.flush(force=True)
+
+
+def print_results(store, survey):
+    results, completed = store.tallies(survey)
+    print(f"{SURVEYS[survey].title}, completed responses: {completed}")
+    for question in SURVEYS[survey].questions:
+        print(f"\n{question.prompt}")
+        for option, count in results[question.key].items():
+            share = count / completed if completed else 0
+            print(f"  {option:<34}{count:>7}  {share:>6.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    results = commands.add_parser("results", help="print the live tallies of a survey")
+    results.add_argument("survey", choices=sorted(SURVEYS))
+    results.add_argument("--db", help="database path (default: the app's database)")
+    args = parser.parse_args()
+
+    store = SurveyStore(args.db)
+    print_results(store, args.survey)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+import pytest
+
+import dedup
+from db import connect
+from dedup import DuplicateIndex
+from feedback_store import SCHEMA
+
+ORIGINAL = ("The parking cameras in De Pijp fine people who are loading their car for a few minutes, "
+            "which is unfair to residents without a driveway")
+REWORDED = ("Parking cameras in De Pijp are fining residents loading their car for just a few minutes. "
+            "Unfair to residents without a driveway!")
+OTHER = "Waste collection routes skip our street on Thursdays since the new planning system started"
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(str(tmp_path / "dedup.db"))
+    conn.executescript(SCHEMA)
+    dedup.install(conn)
+    conn.executemany("INSERT INTO feedback (id, created_at, kind, title, details) VALUES (?, 0, 'concern', '', '')",
+                     [(i,) for i in range(1, 5)])
+    yield conn
+    conn.close()
+
+
+def _indexed(conn):
+    return conn.execute("SELECT COUNT(*) FROM feedback_signatures").fetchone()[0]
+
+
+def test_copies_are_matched_to_the_first_copy(conn):
+    index = DuplicateIndex()
+    assert index.check(conn, 1, ORIGINAL) == (None, None)
+    duplicate_of, similarity = index.check(conn, 2, REWORDED)
+    assert duplicate_of == 1
+    assert similarity >= index.threshold
+    assert index.check(conn, 3, ORIGINAL.upper()) == (1, 1.0)
+    # Only first copies are indexed
+    assert _indexed(conn) == 1
+
+
+def test_unrelated_feedback_is_not_a_copy(conn):
+    index = DuplicateIndex()
+    index.check(conn, 1, ORIGINAL)
+    assert index.check(conn, 2, OTHER) == (None, None)
+    assert _indexed(conn) == 2
+
+
+def test_text_without_terms_is_not_indexed(conn):
+    index = DuplicateIndex()
+    assert index.signature("the and of") is None
+    assert index.check(conn, 1, "the and of") == (None, None)
+    assert _indexed(conn) == 0
+
+
+def test_the_index_is_rolled_back_with_the_transaction(conn):
+    index = DuplicateIndex()
+    conn.execute("BEGIN")
+    index.check(conn, 1, ORIGINAL)
+    conn.execute("ROLLBACK")
+    assert index.check(conn, 2, ORIGINAL) == (None, None)
+
+
+def test_the_index_outlives_the_process(tmp_path, conn):
+    DuplicateIndex().check(conn, 1, ORIGINAL)
+    other = connect(str(tmp_path / "dedup.db"))
+    assert DuplicateIndex().check(other, 2, REWORDED)[0] == 1
@@ -0,0 +1,91 @@
+import calendar
+import sys
+import time
+
+import pytest
+
+import impact
+from db import connect
+from feedback_store import SCHEMA, FeedbackStore
+
+JUNE_2030 = calendar.timegm((2030, 6, 1, 12, 0, 0))
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(str(tmp_path / "impact.db"))
+    conn.executescript(SCHEMA)
+    impact.install(conn)
+    yield conn
+    conn.close()
+
+
+def _submit(conn, system, email=None, created_at=JUNE_2030):
+    conn.execute("BEGIN")
+    cur = conn.execute("INSERT INTO feedback (created_at, kind, system, title, details, email) "
+                       "VALUES (?, 'concern', ?, 't', 'd', ?)", (created_at, system, email))
+    impact.record(conn, [{"id": cur.lastrowid, "created_at": created_at, "system": system, "email": email}])
+    conn.execute("COMMIT")
+    return cur.lastrowid
+
+
+def test_feedback_is_counted_per_year_and_system(conn):
+    _submit(conn, "housing-allocation", "a@example.nl")
+    _submit(conn, "housing-allocation", "A@example.nl ")
+    _submit(conn, "crowd-monitoring")
+    _submit(conn, None)
+
+    assert impact.summary(conn, "2030") == {"year": "2030", "participants": 3, "feedback": 4,
+                                            "changed": 0, "changed_percent": 0}
+    rollup = {(row["system"], row["neighborhood"]): row["feedback"] for row in conn.execute(
+        "SELECT * FROM impact_rollup WHERE year = '2030'")}
+    assert rollup == {("housing-allocation", "Citywide"): 2, ("crowd-monitoring", "Centrum"): 1, ("", ""): 1}
+
+
+def test_changes_are_counted_once(conn):
+    first = _submit(conn, "housing-allocation")
+    _submit(conn, "housing-allocation")
+    _submit(conn, "housing-allocation")
+
+    assert impact.mark_changed(conn, first) is True
+    assert impact.mark_changed(conn, first) is False
+    assert impact.summary(conn, "2030")["changed"] == 1
+    assert impact.summary(conn, "2030")["changed_percent"] == 33
+    with pytest.raises(ValueError):
+        impact.mark_changed(conn, 999)
+
+
+def test_history_is_added_once(conn):
+    impact.install(conn)
+    assert impact.summary(conn, "2022") == {"year": "2022", "participants": 1240, "feedback": 1000,
+                                            "changed": 760, "changed_percent": 76}
+
+
+def test_install_counts_feedback_written_before_the_rollups(tmp_path):
+    conn = connect(str(tmp_path / "impact.db"))
+    conn.executescript(SCHEMA)
+    for email in ("a@example.nl", "a@example.nl", "b@example.nl"):
+        conn.execute("INSERT INTO feedback (created_at, kind, system, title, details, email) "
+                     "VALUES (?, 'concern', 'tourist-flow', 't', 'd', ?)", (JUNE_2030, email))
+    impact.install(conn)
+    assert impact.summary(conn, "2030")["feedback"] == 3
+    assert impact.summary(conn, "2030")["participants"] == 2
+
+
+def test_seeded_feedback_stays_out_of_the_totals(tmp_path):
+    store = FeedbackStore(str(tmp_path / "feedback.db"), redact=False)
+    this_year = impact.summary(store._reader(), impact._year(time.time()))
+    assert (this_year["participants"], this_year["feedback"]) == (0, 0)
+    with pytest.raises(ValueError):
+        store.mark_changed(1)
+
+
+def test_changes_are_recorded_from_the_command_line(conn, tmp_path, monkeypatch, capsys):
+    feedback_id = _submit(conn, "waste-collection")
+    db = str(tmp_path / "impact.db")
+    monkeypatch.setattr(sys, "argv", ["impact.py", "--db", db, "changed", str(feedback_id)])
+    assert impact.main() == 0
+    assert capsys.readouterr().out == f"feedback {feedback_id}: recorded\n"
+    monkeypatch.setattr(sys, "argv", ["impact.py", "--db", db, "summary", "--year", "2030"])
+    assert impact.main() == 0
+    assert "1 led to changes (100%)" in capsys.readouterr().out
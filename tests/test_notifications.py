@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+import notifications
+from notifications import Notifier
+
+
+class RecordingTransport:
+    # Collects recipients; fail_after raises once, after that many messages
+    # of a batch went out
+
+    def __init__(self, delay=0.0, fail_after=None):
+        self.delay = delay
+        self.fail_after = fail_after
+        self.sent = []
+        self._lock = threading.Lock()
+
+    def send(self, sender, messages, done):
+        for i, (recipient, _) in enumerate(messages):
+            if self.fail_after is not None and i == self.fail_after:
+                self.fail_after = None
+                raise ConnectionError("connection dropped")
+            time.sleep(self.delay)
+            with self._lock:
+                self.sent.append(recipient)
+            done(recipient)
+
+
+def _subscribe(notifier, count):
+    for i in range(count):
+        notifier.subscribe(f"person{i}@example.nl", "news", confirmed=True)
+
+
+def _wait_done(notifier, notification_id, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if notifier._writer().execute("SELECT done_at FROM notifications WHERE id = ?",
+                                      (notification_id,)).fetchone()[0]:
+            return
+        time.sleep(0.02)
+    pytest.fail("notification not finished")
+
+
+def test_a_second_notifier_leaves_a_running_fan_out_alone(tmp_path):
+    path = str(tmp_path / "notify.db")
+    first = RecordingTransport(delay=0.01)
+    notifier = Notifier(path, transport=first, batch_size=5, concurrency=1, backoff=0)
+    _subscribe(notifier, 50)
+    future = notifier.publish("news", "Update", "Hello")
+    time.sleep(0.1)
+
+    second = RecordingTransport()
+    Notifier(path, transport=second, backoff=0)
+    assert future.result(timeout=10) == 50
+    time.sleep(0.2)
+    assert sorted(first.sent) == sorted(f"person{i}@example.nl" for i in range(50))
+    assert second.sent == []
+
+
+def test_a_failure_halfway_through_a_batch_only_retries_the_rest(tmp_path):
+    transport = RecordingTransport(fail_after=3)
+    notifier = Notifier(str(tmp_path / "notify.db"), transport=transport, batch_size=10, backoff=0)
+    _subscribe(notifier, 10)
+    assert notifier.publish("news", "Update", "Hello").result(timeout=10) == 10
+    assert len(transport.sent) == len(set(transport.sent)) == 10
+    assert notifier.stats["retries"] == 1
+
+
+def test_an_abandoned_notification_is_resumed_once(tmp_path):
+    path = str(tmp_path / "notify.db")
+    notifier = Notifier(path, transport=RecordingTransport(), resume=False)
+    _subscribe(notifier, 10)
+    conn = notifier._writer()
+    # Left behind by a notifier that stopped after its first message, and
+    # one that is still running
+    stale = time.time() - notifications.LEASE - 1
+    abandoned = conn.execute("INSERT INTO notifications (created_at, topic, subject, body, claimed_by, claimed_at) "
+                             "VALUES (?, 'news', 'Update', 'Hello', 'gone', ?)", (stale, stale)).lastrowid
+    conn.execute("INSERT INTO deliveries (notification_id, subscription_id, done_at) VALUES (?, 1, ?)",
+                 (abandoned, stale))
+    running = conn.execute("INSERT INTO notifications (created_at, topic, subject, body, claimed_by, claimed_at) "
+                           "VALUES (?, 'news', 'Other', 'Hello', 'alive', ?)", (stale, time.time())).lastrowid
+
+    transports = [RecordingTransport(), RecordingTransport()]
+    resumed = [Notifier(path, transport=transport) for transport in transports]
+    _wait_done(resumed[0], abandoned)
+    time.sleep(0.2)
+    sent = transports[0].sent + transports[1].sent
+    assert sorted(sent) == sorted(f"person{i}@example.nl" for i in range(1, 10))
+    assert conn.execute("SELECT claimed_by, done_at FROM notifications WHERE id = ?",
+                        (running,)).fetchone()[:] == ("alive", None)
+    assert conn.execute("SELECT COUNT(*) FROM deliveries").fetchone()[0] == 0
@@ -0,0 +1,75 @@
+import pytest
+
+from redaction import redact, valid_bsn, valid_iban
+
+
+@pytest.mark.parametrize("number, valid", [
+    ("111222333", True),
+    ("1112.22.333", True),
+    ("123456789", False),
+    ("000000000", False),
+    ("11122233", False),
+])
+def test_bsn_eleven_proof(number, valid):
+    assert valid_bsn(number) is valid
+
+
+@pytest.mark.parametrize("iban, valid", [
+    ("NL91ABNA0417164300", True),
+    ("NL91 ABNA 0417 1643 00", True),
+    ("NL91ABNA0417164301", False),
+    ("NL91ABNA04", False),
+])
+def test_iban_checksum(iban, valid):
+    assert valid_iban(iban) is valid
+
+
+@pytest.mark.parametrize("text, redacted", [
+    ("Mail me at anna.jansen@example.nl", "Mail me at [email]"),
+    ("Mijn BSN is 111222333", "Mijn BSN is [BSN]"),
+    ("IBAN NL91 ABNA 0417 1643 00", "IBAN [IBAN]"),
+    ("Bel 06-12345678", "Bel [phone]"),
+    ("Ik woon op Kinkerstraat 12-2 in 1053 AB", "Ik woon op [address] in [postcode]"),
+    ("Ik ben Henk de Vries", "Ik ben [name]"),
+    ("mevr. Yilmaz belde", "mevr. [name] belde"),
+    ("my name is Priyanka Ramaswamy", "my name is [name]"),
+    ("mijn naam is Anna Maria van der Berg", "mijn naam is [name]"),
+])
+def test_personal_details_are_redacted(text, redacted):
+    assert redact(text)[0] == redacted
+
+
+@pytest.mark.parametrize("text", [
+    # Numbers that fail their checksum
+    "Het kenmerk is 123456789",
+    "NL91ABNA0417164301 is geen rekening",
+    # Systems and dates after a name cue
+    "The system is called Social Housing Allocation",
+    "Is this AI named Crowd Monitoring fair?",
+    "It is called Smart Camera Grid Assistant",
+    "The letter came on Jan 5",
+    "Op 5 jan. 2024 ging het mis",
+    # Names that are also everyday words
+    "The form is a joke",
+    "Joke of a system, to be frank",
+    "Iris scans at the station are creepy",
+])
+def test_ordinary_text_is_left_alone(text):
+    assert redact(text) == (text, {})
+
+
+def test_submitter_name_and_email_are_redacted_anywhere():
+    text, counts = redact("Sanne here (sanne@example.nl), ask for sanne", name="Sanne Kuipers",
+                          email="sanne@example.nl")
+    assert text == "[name] here ([email]), ask for [name]"
+    assert counts == {"name": 2, "email": 1}
+
+
+def test_everyday_words_in_the_submitters_name_only_count_capitalized():
+    assert redact("To be frank, Frank here", name="Frank Visser")[0] == "To be frank, [name] here"
+    assert redact("groeten, sanne", name="Sanne Kuipers")[0] == "groeten, [name]"
+
+
+def test_everyday_word_names_still_count_after_a_cue():
+    assert redact("my name is Joke")[0] == "my name is [name]"
+    assert redact("mevr. Iris de Vries belde")[0] == "mevr. [name] belde"
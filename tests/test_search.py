@@ -0,0 +1,54 @@
+import time
+
+from feedback_store import FeedbackStore
+from search import SearchIndex
+
+
+def _pages(search, size):
+    # Follows the cursors to the end; returns the pages of keys
+    pages, after = [], None
+    while True:
+        hits = search(limit=size + 1, after=after)
+        pages.append([key for key, _ in hits[:size]])
+        if len(hits) <= size:
+            return pages
+        after = hits[size - 1]
+
+
+def test_pages_continue_the_ranking_across_ties():
+    index = SearchIndex(fields=("kind",))
+    for key in range(100, 0, -1):
+        index.add(key, "parking camera privacy" if key % 3 else "parking camera privacy privacy", kind="concern")
+    pages = _pages(lambda **page: index.search("privacy", **page), 7)
+    keys = [key for page in pages for key in page]
+    assert keys == [key for key, _ in index.search("privacy", limit=1000)]
+    assert sorted(keys) == list(range(1, 101))
+    assert all(len(page) == 7 for page in pages[:-1])
+
+
+def test_filters_apply_to_every_page():
+    index = SearchIndex(fields=("kind",))
+    for key in range(1, 31):
+        index.add(key, "housing waiting list", kind="question" if key % 2 else "concern")
+    pages = _pages(lambda **page: index.search("housing", kind="question", **page), 4)
+    assert sorted(key for page in pages for key in page) == list(range(1, 31, 2))
+
+
+def test_unranked_search_pages_newest_first(tmp_path):
+    store = FeedbackStore(str(tmp_path / "feedback.db"), seed=False, redact=False)
+    conn = store._reader()
+    now = time.time()
+    for i in range(25):
+        # Several rows share a timestamp, so the id breaks the tie
+        conn.execute("INSERT INTO feedback (id, created_at, kind, title, details, public) "
+                     "VALUES (?, ?, 'concern', 'Parking', 'camera fines', 1)", (i + 1, now + i // 3))
+        conn.execute("INSERT INTO feedback_redacted (feedback_id, version, title, details, redactions, "
+                     "redacted_at) VALUES (?, 1, 'Parking', 'camera fines', 0, ?)", (i + 1, now))
+    ids, before = [], None
+    while True:
+        rows = store.search_public("camera", limit=10, before=before)
+        ids += [row["id"] for row in rows]
+        if len(rows) < 10:
+            break
+        before = (rows[-1]["created_at"], rows[-1]["id"])
+    assert ids == list(range(25, 0, -1))
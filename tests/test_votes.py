@@ -0,0 +1,35 @@
+import threading
+
+from votes import VoteCounter
+
+
+def test_counts_never_include_a_flushed_vote_twice(tmp_path):
+    counter = VoteCounter(str(tmp_path / "votes.db"), flush_interval=0.001)
+    stop = threading.Event()
+    seen = []
+
+    def read():
+        while not stop.is_set():
+            seen.append(counter.counts([1])[1])
+    reader = threading.Thread(target=read)
+    reader.start()
+    for voter in range(2000):
+        counter.vote(1, f"voter{voter}")
+    counter.close()
+    stop.set()
+    reader.join()
+
+    assert counter.counts([1]) == {1: 2000}
+    assert max(seen) <= 2000
+    assert seen == sorted(seen)
+
+
+def test_a_voter_counts_once(tmp_path):
+    counter = VoteCounter(str(tmp_path / "votes.db"))
+    assert counter.vote(1, "voter") is True
+    assert counter.vote(1, "voter") is False
+    counter.flush()
+    counter.vote(1, "voter")
+    counter.flush()
+    assert counter.counts([1, 2]) == {1: 1, 2: 0}
+    counter.close()
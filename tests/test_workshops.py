@@ -0,0 +1,75 @@
+import threading
+
+from workshops import WorkshopBookings
+
+
+def _burst(count, target):
+    # Runs target(i) on count threads released at the same moment
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(i):
+        barrier.wait()
+        results[i] = target(i)
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_last_seats_go_to_exactly_as_many_registrations(tmp_path):
+    bookings = WorkshopBookings(str(tmp_path / "workshops.db"), workshops={"ethics": ("Ethics", 20, 15)})
+    results = _burst(300, lambda i: bookings.register("ethics", f"person{i}@example.nl"))
+
+    assert all(created for _, created in results)
+    statuses = [booking.status for booking, _ in results]
+    assert statuses.count("confirmed") == 5
+    assert statuses.count("waitlisted") == 295
+    assert sorted(booking.position for booking, _ in results if booking.status == "waitlisted") \
+        == list(range(1, 296))
+    assert bookings.seats_left(["ethics"]) == {"ethics": 0}
+
+
+def test_registering_twice_at_once_takes_one_seat(tmp_path):
+    bookings = WorkshopBookings(str(tmp_path / "workshops.db"), workshops={"ethics": ("Ethics", 20, 15)})
+    results = _burst(50, lambda i: bookings.register("ethics", "Same@Example.nl"))
+
+    assert sum(created for _, created in results) == 1
+    assert len({booking.id for booking, _ in results}) == 1
+    assert bookings.seats_left(["ethics"]) == {"ethics": 4}
+
+
+def test_cancelled_seat_goes_to_the_first_on_the_waitlist(tmp_path):
+    bookings = WorkshopBookings(str(tmp_path / "workshops.db"), workshops={"ethics": ("Ethics", 1, 0)})
+    seated, _ = bookings.register("ethics", "first@example.nl")
+    waiting, _ = bookings.register("ethics", "second@example.nl")
+    third, _ = bookings.register("ethics", "third@example.nl")
+
+    cancelled, promoted = bookings.cancel(seated.token)
+    assert cancelled.id == seated.id
+    assert promoted.id == waiting.id
+    assert bookings.booking(waiting.token).status == "confirmed"
+    assert bookings.booking(third.token).position == 1
+    assert bookings.seats_left(["ethics"]) == {"ethics": 0}
+    assert bookings.cancel(seated.token) == (None, None)
+
+
+def test_registering_while_the_existing_booking_is_cancelled(tmp_path, monkeypatch):
+    bookings = WorkshopBookings(str(tmp_path / "workshops.db"), workshops={"ethics": ("Ethics", 20, 15)})
+    first, _ = bookings.register("ethics", "person@example.nl")
+    active = bookings._active
+
+    def cancelled_meanwhile(conn, workshop, email):
+        # The booking that blocked the insert is cancelled before it is read
+        monkeypatch.setattr(bookings, "_active", active)
+        bookings.cancel(first.token)
+        return active(conn, workshop, email)
+    monkeypatch.setattr(bookings, "_active", cancelled_meanwhile)
+
+    booking, created = bookings.register("ethics", "person@example.nl")
+    assert created
+    assert booking.id != first.id
+    assert booking.status == "confirmed"
+    assert bookings.seats_left(["ethics"]) == {"ethics": 4}
@@ -0,0 +1,118 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+DIMENSIONS = [
+    "Bias Testing",
+    "Citizen Consultation",
+    "Human Oversight",
+    "Transparency",
+    "Impact Assessment",
+    "Data Protection",
+]
+
+# Shown when an audit record has no note of its own
+DEFAULT_DESCRIPTIONS = {
+    "Bias Testing": "Regular testing for bias against protected groups",
+    "Citizen Consultation": "Consultation with the people affected by the system",
+    "Human Oversight": "People review the decisions the system supports",
+    "Transparency": "Public documentation of how the system works",
+    "Impact Assessment": "Regular assessment of social impact",
+    "Data Protection": "Measures protecting the personal data the system uses",
+}
+
+MAX_SCORE = 5
+AUDIT_COLUMNS = ["algorithm", "dimension", "score", "audited_on", "auditor", "note"]
+
+# Bar colors by percentage, highest threshold first
+COLOR_THRESHOLDS = [(80, "#22c55e"), (60, "#f59e0b"), (40, "#f97316")]
+LOW_SCORE_COLOR = "#ef4444"
+
+
+def _seed(algorithm, audited_on, auditor, scores, notes=None):
+    notes = notes or {}
+    return [(algorithm, dimension, score, audited_on, auditor, notes.get(dimension))
+            for dimension, score in zip(DIMENSIONS, scores)]
+
+
+SEED_AUDITS = (
+    _seed("housing-allocation", "2023-03-01", "University of Amsterdam - AI Ethics Lab", [3, 2, 4, 3, 4, 5], {
+        "Citizen Consultation": "Limited consultation with housing applicants",
+        "Human Oversight": "Housing officers review all decisions",
+        "Transparency": "Algorithm details published but complex",
+        "Data Protection": "Strong data protection measures in place",
+    })
+    + _seed("crowd-monitoring", "2022-09-01", "Amsterdam Privacy Coalition", [3, 4, 4, 4, 3, 5], {
+        "Data Protection": "Anonymous counting instead of facial recognition",
+    })
+    + _seed("parking-enforcement", "2023-01-15", "Municipal Audit Office", [4, 3, 4, 4, 4, 4], {
+        "Data Protection": "Images deleted after processing unless a violation is detected",
+    })
+    + _seed("tourist-flow", "2022-11-01", "Municipal Audit Office", [3, 2, 3, 3, 3, 4])
+    + _seed("benefit-fraud", "2023-02-01", "Amsterdam Digital Rights Coalition", [2, 1, 4, 2, 3, 4], {
+        "Bias Testing": "Bias testing started after concerns about profiling",
+        "Citizen Consultation": "No consultation with benefit recipients so far",
+    })
+    + _seed("waste-collection", "2022-06-01", "Municipal Audit Office", [4, 4, 3, 5, 4, 5], {
+        "Citizen Consultation": "App redesigned after accessibility testing with residents",
+    })
+)
+
+
+def compute_indicators(audits):
+    # Latest audit per (algorithm, dimension) plus the derived bar width and
+    # color, computed in one vectorized pass over the given records
+    latest = (audits.sort_values("audited_on", kind="stable")
+              .groupby(["algorithm", "dimension"], sort=False).tail(1))
+    percent = (latest["score"].clip(0, MAX_SCORE) * 100 // MAX_SCORE).astype(int)
+    color = np.select([percent >= bound for bound, _ in COLOR_THRESHOLDS],
+                      [c for _, c in COLOR_THRESHOLDS], default=LOW_SCORE_COLOR)
+    description = latest["note"].fillna(latest["dimension"].map(DEFAULT_DESCRIPTIONS))
+    return latest.assign(percent=percent, color=color, description=description)
+
+
+class TrustIndicators:
+    # Holds the audit records for every registered algorithm. New records
+    # only mark their own algorithms as stale, and the next read recomputes
+    # those algorithms alone. Each algorithm's version changes whenever its
+    # indicators do, so rendered output can be cached on (algorithm, version).
+
+    def __init__(self, records=SEED_AUDITS):
+        self._lock = threading.Lock()
+        self._audits = pd.DataFrame(list(records), columns=AUDIT_COLUMNS)
+        self._pending = []
+        self._stale = set(self._audits["algorithm"])
+        self._indicators = compute_indicators(self._audits.iloc[:0])
+        self._versions = dict.fromkeys(self._stale, 0)
+
+    def add_audits(self, records):
+        records = list(records)
+        with self._lock:
+            self._pending.extend(records)
+            for record in records:
+                self._stale.add(record[0])
+                self._versions[record[0]] = self._versions.get(record[0], 0) + 1
+
+    def version(self, algorithm):
+        return self._versions.get(algorithm, 0)
+
+    def _refresh(self):
+        if not self._stale:
+            return
+        if self._pending:
+            self._audits = pd.concat([self._audits, pd.DataFrame(self._pending, columns=AUDIT_COLUMNS)],
+                                     ignore_index=True)
+            self._pending = []
+        stale = self._audits["algorithm"].isin(self._stale)
+        keep = self._indicators[~self._indicators["algorithm"].isin(self._stale)]
+        self._indicators = pd.concat([keep, compute_indicators(self._audits[stale])], ignore_index=True)
+        self._stale.clear()
+
+    def indicators(self, algorithm):
+        with self._lock:
+            self._refresh()
+            rows = self._indicators[self._indicators["algorithm"] == algorithm]
+        order = {dimension: i for i, dimension in enumerate(DIMENSIONS)}
+        rows = rows.sort_values("dimension", key=lambda column: column.map(order))
+        return rows[["dimension", "score", "percent", "color", "description", "audited_on", "auditor"]].to_dict("records")
@@ -0,0 +1,64 @@
+import os
+import time
+
+import streamlit as st
+
+from fragments import FragmentCache
+from i18n import DEFAULT_LOCALE, catalog, translate_html
+from registry import SEED_ALGORITHMS, AlgorithmRegistry
+
+# Rendering helpers and shared resources for app.py and the pages in views/
+
+# Static sections are rendered once per language and served from memory
+@st.cache_resource(show_spinner=False)
+def get_fragment_cache():
+    return FragmentCache(enabled=os.environ.get("AIANDME_FRAGMENT_CACHE", "1") != "0", translate=translate_html)
+
+def current_locale():
+    return st.session_state.get("lang", DEFAULT_LOCALE)
+
+def t(text):
+    return catalog(current_locale()).gettext(text)
+
+def time_ago(timestamp):
+    seconds = max(0, time.time() - timestamp)
+    for unit, size in (("week", 7 * 86400), ("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = int(seconds // size)
+            return t(f"{{count}} {unit}{'s' if count > 1 else ''} ago").format(count=count)
+    return t("just now")
+
+def static_markdown(source):
+    fragment = get_fragment_cache().get(source, current_locale())
+    st.markdown(fragment.html, unsafe_allow_html=True)
+
+def static_template(source, **values):
+    # Static section with a few live values: the minified template is cached
+    # like any other section and only the substitution runs on each rerun
+    fragment = get_fragment_cache().get(source, current_locale())
+    st.markdown(fragment.html.format(**values), unsafe_allow_html=True)
+
+def sticky_index(key, labels, current):
+    # Start index for a widget with translated options. Streamlit makes the
+    # index part of the widget's identity, so it may only change along with
+    # the language; a new language then starts at the current choice.
+    lang = current_locale()
+    if st.session_state.get(f"{key}.lang") != lang:
+        st.session_state[f"{key}.lang"] = lang
+        st.session_state[f"{key}.index"] = labels.index(current) if current in labels else 0
+    return st.session_state[f"{key}.index"]
+
+def lazy_tabs(labels, key):
+    # Tab bar that only renders the selected tab. st.tabs would build and send
+    # every tab on each rerun even though only one is visible. Returns the
+    # English label whatever the language.
+    options = {t(label): label for label in labels}
+    index = sticky_index(key, labels, st.session_state.get(f"{key}.label"))
+    choice = options[st.radio("Tabs", list(options), index=index, horizontal=True,
+                              label_visibility="collapsed", key=key)]
+    st.session_state[f"{key}.label"] = choice
+    return choice
+
+@st.cache_resource(show_spinner=False)
+def get_registry():
+    return AlgorithmRegistry(SEED_ALGORITHMS)
@@ -0,0 +1,80 @@
+from html import escape
+
+import streamlit as st
+
+from consultation import DOCUMENTS, ConsultationStore
+from fragments import minify
+from i18n import translate_html
+from ui import current_locale, t, time_ago
+
+@st.cache_resource(show_spinner=False)
+def get_consultation_store():
+    return ConsultationStore()
+
+def select_paragraph(document, paragraph):
+    # Clicking the open paragraph's button again closes it
+    key = f"consultation.{document}.open"
+    st.session_state[key] = None if st.session_state.get(key) == paragraph else paragraph
+
+def comment_thread(comments):
+    # Comments arrive in thread order, so indenting by depth is enough to
+    # draw the threads
+    return "".join(f"""
+            <div style="margin-left: {1.5 * comment.depth}rem; padding: 0.75rem 0 0.75rem 1rem; border-left: 2px solid {'#dc2626' if comment.depth == 0 else '#e5e7eb'};">
+                <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                    <span style="font-weight: 500;">{escape(comment.author or t("Anonymous"))} <span style="font-size: 0.75rem; color: #6b7280;">#{comment.id}</span></span>
+                    <span style="font-size: 0.75rem; color: #6b7280;">{time_ago(comment.created_at)}</span>
+                </div>
+                <p style="font-size: 0.875rem;">{escape(comment.body)}</p>
+            </div>""" for comment in comments)
+
+def comment_panel(document, paragraph):
+    comments = get_consultation_store().comments(document, paragraph)
+    if comments:
+        st.markdown(minify(f"""
+        <div style="margin-bottom: 1rem;">{comment_thread(comments)}
+        </div>
+        """), unsafe_allow_html=True)
+    else:
+        st.caption(t("No comments on this paragraph yet. Be the first."))
+
+    with st.form(f"comment.{document}.{paragraph}", clear_on_submit=True):
+        targets = {t("New comment on this paragraph"): None}
+        targets.update((f"#{c.id} {c.author or t('Anonymous')}: {c.body[:60]}", c.id) for c in comments)
+        parent = targets[st.selectbox(t("Reply to"), list(targets))]
+        body = st.text_area(t("Your comment"))
+        name = st.text_input(t("Name (optional)"), placeholder=t("Shown with your comment"))
+        submitted = st.form_submit_button(t("Post comment"), type="primary")
+
+    if submitted:
+        try:
+            get_consultation_store().add(document, paragraph, body, name, parent=parent)
+        except ValueError as exc:
+            st.error(t(str(exc)))
+            return
+        st.rerun()
+
+def consultation_page(document):
+    doc = DOCUMENTS[document]
+    st.markdown(translate_html(minify(f"""
+    <a href="?page=influence" target="_self" style="color: #6b7280; font-size: 0.875rem;">← {t("Back to Influence")}</a>
+    <h1 style="font-size: 1.875rem; font-weight: 700; margin: 0.5rem 0;">{escape(t(doc.title))}</h1>
+    <p style="color: #6b7280; margin-bottom: 0.5rem;">{escape(t(doc.summary))}</p>
+    <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 1.5rem;">{t("Closes {date}").format(date=t(doc.closes))} · {t("Open a paragraph's comments with the 💬 button next to it.")}</p>
+    """), current_locale()), unsafe_allow_html=True)
+
+    # Counts are kept per paragraph as comments are posted, and only the
+    # open paragraph's comments are loaded
+    counts = get_consultation_store().counts(document)
+    selected = st.session_state.get(f"consultation.{document}.open")
+    for paragraph, text in enumerate(doc.paragraphs):
+        col1, col2 = st.columns([8, 1])
+        with col1:
+            st.markdown(f'<p id="p{paragraph}" style="margin-bottom: 0.5rem;">{escape(t(text))}</p>',
+                        unsafe_allow_html=True)
+        with col2:
+            st.button(f"💬 {counts[paragraph]}", key=f"consultation.{document}.{paragraph}",
+                      type="primary" if paragraph == selected else "secondary",
+                      on_click=select_paragraph, args=(document, paragraph))
+        if paragraph == selected:
+            comment_panel(document, paragraph)
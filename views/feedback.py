@@ -0,0 +1,109 @@
+import functools
+from html import escape
+
+import streamlit as st
+
+from feedback_store import FeedbackStore
+from notifications import Notifier, clean_email, feedback_topic
+from ui import get_registry, static_markdown, t
+
+# Form labels mapped to the values that are stored
+FEEDBACK_TYPES = {
+    "⚠️ Report a concern": "concern",
+    "💬 Ask a question": "question",
+    "👍 Make a suggestion": "suggestion",
+}
+CONCERN_TOPICS = {
+    "Select a concern...": None,
+    "Fairness or discrimination": "fairness",
+    "Privacy or data protection": "privacy",
+    "Lack of transparency or explanation": "transparency",
+    "Accuracy of decisions": "accuracy",
+    "Other concern": "other",
+}
+
+@st.cache_resource(show_spinner=False)
+def get_feedback_store():
+    return FeedbackStore()
+
+@st.cache_resource(show_spinner=False)
+def get_notifier():
+    return Notifier()
+
+def feedback_received(notifier, email, title, future):
+    # Runs on the feedback writer thread once the submission is stored; the
+    # submitter is subscribed to status updates on their feedback, with this
+    # first one as the confirmation
+    if future.exception() is None:
+        topic = feedback_topic(future.result())
+        notifier.subscribe(email, topic, confirmed=True)
+        notifier.publish(topic, "We received your feedback",
+                         f"Thank you for your feedback \"{title}\". It has been passed on to the responsible "
+                         "department, and you'll receive a response within 10 working days.")
+
+
+def feedback_form(key, system=None):
+    # Shared by the Question page and the feedback tab of a system page. When
+    # the system is known the form asks about the concern instead of a title.
+    registry = get_registry()
+    algorithm = registry.get(system) if system else None
+    if algorithm:
+        intro = t("Tell us what you think about the {system} system").format(system=t(algorithm.name))
+    else:
+        intro = t("Tell us what you think about any AI system in Amsterdam")
+    
+    with st.form(key, clear_on_submit=True):
+        st.markdown(f"""
+        <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem;">{t("Share Your Feedback")}</h2>
+        <p style="color: #6b7280; margin-bottom: 1.5rem;">{escape(intro)}</p>
+        """, unsafe_allow_html=True)
+        
+        types = {t(label): kind for label, kind in FEEDBACK_TYPES.items()}
+        kind = types[st.radio(t("Type of Feedback"), list(types))]
+        
+        if algorithm:
+            topics = {t(label): topic for label, topic in CONCERN_TOPICS.items()}
+            topic_label = st.selectbox(t("What are you concerned about?"), list(topics))
+            topic = topics[topic_label]
+            details = st.text_area(t("Describe your concern"), placeholder=t("Please provide details..."), height=150)
+            impact = st.text_area(t("How has this affected you personally? (optional)"), placeholder=t("Share your experience..."))
+            title = topic_label if topic else details.strip().split("\n")[0][:80]
+        else:
+            systems = {t("Select a system..."): None}
+            systems.update((t(a.name), a.slug) for a in registry.search())
+            systems[t("Other system")] = "other"
+            system = systems[st.selectbox(t("Which AI system?"), list(systems))]
+            title = st.text_input(t("Title"), placeholder=t("Brief summary of your feedback"))
+            details = st.text_area(t("Details"), placeholder=t("Please provide details..."), height=150)
+            topic, impact = None, ""
+        
+        static_markdown("""
+        <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 1rem;">Contact Information (optional)</h3>
+        <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 1rem;">
+            If you'd like us to follow up with you about your feedback, please provide your contact information.
+        </p>
+        """)
+        col1, col2 = st.columns(2)
+        with col1:
+            name = st.text_input(t("Name"), placeholder=t("Your name"))
+        with col2:
+            email = st.text_input(t("Email"), placeholder=t("Your email"))
+        public = st.checkbox(t("I'm comfortable with my feedback (without personal details) being shared publicly"))
+        
+        submitted = st.form_submit_button(t("Submit Feedback"), type="primary", use_container_width=True)
+    
+    if submitted:
+        if not details.strip() or not title.strip():
+            st.error(t("Please describe your feedback before submitting."))
+            return
+        if email.strip():
+            try:
+                email = clean_email(email)
+            except ValueError:
+                st.error(t("Please enter a valid email address, or leave it empty."))
+                return
+        future = get_feedback_store().submit(kind, title, details, system=system, topic=topic, impact=impact,
+                                             name=name, email=email, public=public)
+        if email.strip():
+            future.add_done_callback(functools.partial(feedback_received, get_notifier(), email, title.strip()))
+        st.success(t("Thank you! Your feedback has been received and will be reviewed by the responsible department."))
@@ -0,0 +1,114 @@
+import streamlit as st
+
+from metrics import profiled
+from ui import static_markdown
+
+@profiled("home")
+def home_page():
+    # Hero Section
+    static_markdown("""
+    <div class="hero">
+        <h1>AI & Me: Understand, Question, Influence</h1>
+        <p>A civic platform empowering Amsterdam citizens to understand how AI is used in their city, question how it might affect them, and influence how it evolves.</p>
+        <div>
+            <a class="primary-button" href="?page=understand" target="_self">Explore AI Systems</a>
+            <a class="outline-button" href="#about">Learn More</a>
+        </div>
+    </div>
+    """)
+    
+    # Three Pillars Section
+    static_markdown('<h2 class="section-title" id="about">Your Rights in the AI City</h2>')
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        static_markdown("""
+        <div class="card pillar-card">
+            <div class="icon icon-red">👁️</div>
+            <h3>Understand</h3>
+            <p>Discover how AI systems are used in Amsterdam with clear, jargon-free explanations.</p>
+            <a class="pillar-card-button" href="?page=understand" target="_self">
+                <span>Explore</span>
+                <span>→</span>
+            </a>
+        </div>
+        """)
+        
+    with col2:
+        static_markdown("""
+        <div class="card pillar-card">
+            <div class="icon icon-red">💬</div>
+            <h3>Question</h3>
+            <p>Ask questions, report concerns, and share your experiences with AI systems.</p>
+            <a class="pillar-card-button" href="?page=question" target="_self">
+                <span>Explore</span>
+                <span>→</span>
+            </a>
+        </div>
+        """)
+        
+    with col3:
+        static_markdown("""
+        <div class="card pillar-card">
+            <div class="icon icon-red">🗳️</div>
+            <h3>Influence</h3>
+            <p>Provide feedback and participate in the co-design of future AI systems.</p>
+            <a class="pillar-card-button" href="?page=influence" target="_self">
+                <span>Explore</span>
+                <span>→</span>
+            </a>
+        </div>
+        """)
+    
+    # Concerns Section
+    static_markdown("""
+    <div class="bg-muted">
+        <h2 class="section-title">Addressing Your Concerns</h2>
+        <div class="container">
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        static_markdown("""
+        <div class="card concern-card">
+            <h3>I feel powerless to influence how AI is used.</h3>
+            <p>Our feedback modules give you a direct voice in AI governance.</p>
+        </div>
+        """)
+        
+        static_markdown("""
+        <div class="card concern-card">
+            <h3>I worry AI reinforces social inequality.</h3>
+            <p>View our trust indicators showing bias testing and human rights impact.</p>
+        </div>
+        """)
+        
+    with col2:
+        static_markdown("""
+        <div class="card concern-card">
+            <h3>I am concerned AI is used without my knowledge.</h3>
+            <p>Explore our transparent registry of all AI systems in Amsterdam.</p>
+        </div>
+        """)
+        
+        static_markdown("""
+        <div class="card concern-card">
+            <h3>I'm afraid of being watched or profiled.</h3>
+            <p>Learn exactly what data is used and how your privacy is protected.</p>
+        </div>
+        """)
+    
+    static_markdown("</div></div>")
+    
+    # CTA Section
+    static_markdown("""
+    <div style="text-align: center; padding: 4rem 0;">
+        <h2 style="font-size: 1.875rem; font-weight: 700; margin-bottom: 1.5rem;">Join the Conversation Today</h2>
+        <p style="font-size: 1.125rem; margin-bottom: 2rem; max-width: 42rem; margin-left: auto; margin-right: auto;">
+            Your voice matters in shaping how AI is used in Amsterdam. Start exploring, asking questions, and sharing your perspective.
+        </p>
+        <a class="primary-button" style="background-color: #dc2626; color: white;" href="?page=understand" target="_self">Get Started</a>
+    </div>
+    """)
@@ -0,0 +1,403 @@
+from html import escape
+
+import streamlit as st
+
+from bias_audit import (CALIBRATION_TOLERANCE, DISPARATE_IMPACT_THRESHOLD, EQUAL_OPPORTUNITY_TOLERANCE,
+                        BiasAudits)
+from eligibility import (CIRCUMSTANCES, HOUSING_SITUATIONS, INCOME_STEP, MAX_HOUSEHOLD, MAX_INCOME,
+                         MAX_WAITING_YEARS, ScoringTable)
+from fragments import minify
+from i18n import translate_html
+from metrics import profiled
+from ratings import ANSWERS, QUESTIONS, WINDOW_DAYS, RatingStore
+from trust import MAX_SCORE, TrustIndicators
+from ui import current_locale, lazy_tabs, static_markdown, t
+from views.feedback import feedback_form
+
+@st.cache_resource(show_spinner=False)
+def get_trust_indicators():
+    return TrustIndicators()
+
+def trust_indicators_card(algorithm):
+    return _trust_indicators_card(algorithm, get_trust_indicators().version(algorithm), current_locale())
+
+@st.cache_data(show_spinner=False)
+def _trust_indicators_card(algorithm, version, lang):
+    # Cached per indicator version, so the HTML is only rebuilt after new audits
+    indicators = "".join(f"""
+                <div class="trust-indicator">
+                    <div class="trust-indicator-header">
+                        <span style="font-weight: 500;">{escape(row["dimension"])}</span>
+                        <span style="font-size: 0.875rem; font-weight: 500;">{row["score"]}/{MAX_SCORE}</span>
+                    </div>
+                    <div class="trust-indicator-bar">
+                        <div class="trust-indicator-fill" style="width: {row["percent"]}%; background-color: {row["color"]};"></div>
+                    </div>
+                    <p class="trust-indicator-description">{escape(row["description"])}</p>
+                </div>""" for row in get_trust_indicators().indicators(algorithm))
+    return translate_html(minify(f"""
+        <div class="card">
+            <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Trust Indicators</h2>
+            <p style="margin-bottom: 1.5rem;">
+                These indicators show how this AI system was developed, tested, and monitored to ensure it's
+                trustworthy and fair.
+            </p>
+            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1.5rem;">{indicators}
+            </div>
+            <div style="margin-top: 2rem;">
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">Independent Audits</h3>
+                <div style="display: flex; flex-direction: column; gap: 1rem;">
+                    <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div>
+                                <p style="font-weight: 500;">University of Amsterdam - AI Ethics Lab</p>
+                                <p style="font-size: 0.875rem; color: #6b7280;">Last audit: March 2023</p>
+                            </div>
+                            <span class="badge badge-secondary">External</span>
+                        </div>
+                        <p style="margin-top: 0.5rem; font-size: 0.875rem;">
+                            Found potential bias against single-parent households. Recommended adjustments were implemented
+                            in May 2023.
+                        </p>
+                    </div>
+                    
+                    <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div>
+                                <p style="font-weight: 500;">Amsterdam Digital Rights Coalition</p>
+                                <p style="font-size: 0.875rem; color: #6b7280;">Last review: November 2022</p>
+                            </div>
+                            <span class="badge badge-secondary">Civil Society</span>
+                        </div>
+                        <p style="margin-top: 0.5rem; font-size: 0.875rem;">
+                            Raised concerns about transparency and accessibility of the appeals process. Improvements in
+                            progress.
+                        </p>
+                    </div>
+                </div>
+            </div>
+        </div>
+        """), lang)
+
+@st.cache_resource(show_spinner=False)
+def get_bias_audits():
+    return BiasAudits()
+
+def bias_audit_card():
+    # The default audit run is computed by the first visitor after a deploy
+    # and read from the audit cache after that
+    run = get_bias_audits().run()["run"]
+    return _bias_audit_card(run, current_locale())
+
+@st.cache_data(show_spinner=False)
+def _bias_audit_card(run, lang):
+    result = get_bias_audits().cached(run)
+    flagged = "color: #dc2626; font-weight: 600;"
+    
+    def cell(value, flag):
+        return f'<td style="padding: 0.5rem; text-align: right;{flagged if flag else ""}">{value}</td>'
+    
+    rows = "".join(f"""
+                    <tr style="border-top: 1px solid #e5e7eb;">
+                        <td style="padding: 0.5rem;">{escape(t(row["group"]))}</td>
+                        {cell(f"{row['selection_rate']:.1%}", False)}
+                        {cell(f"{row['disparate_impact']:.2f}", row["below_four_fifths"])}
+                        {cell("–" if row["equal_opportunity_gap"] is None else f"{row['equal_opportunity_gap']:+.1%}", row["opportunity_gap"])}
+                        {cell(f"{row['calibration_error']:.3f}", row["miscalibrated"])}
+                    </tr>""" for row in result["groups"])
+    intro = t("Fairness metrics over {records} allocation records, per household type. Households "
+              "are compared with {reference}, the group offered a home most often.").format(
+        records=f"{result['records']:,}", reference=t(result["reference"]))
+    notes = t("Values in red fail a check: a disparate impact below {impact} (the four-fifths rule), an equal "
+              "opportunity gap of more than {gap:.0%} in how often households in urgent need get an offer, or a "
+              "calibration error above {calibration}.").format(
+        impact=DISPARATE_IMPACT_THRESHOLD, gap=EQUAL_OPPORTUNITY_TOLERANCE, calibration=CALIBRATION_TOLERANCE)
+    return minify(f"""
+        <div class="card">
+            <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 0.5rem;">{t("Bias Audit")}</h2>
+            <p style="margin-bottom: 1.5rem;">{escape(intro)}</p>
+            <table style="width: 100%; border-collapse: collapse; font-size: 0.875rem;">
+                <thead>
+                    <tr style="color: #6b7280;">
+                        <th style="padding: 0.5rem; text-align: left;">{t("Household type")}</th>
+                        <th style="padding: 0.5rem; text-align: right;">{t("Offered a home")}</th>
+                        <th style="padding: 0.5rem; text-align: right;">{t("Disparate impact")}</th>
+                        <th style="padding: 0.5rem; text-align: right;">{t("Equal opportunity gap")}</th>
+                        <th style="padding: 0.5rem; text-align: right;">{t("Calibration error")}</th>
+                    </tr>
+                </thead>
+                <tbody>{rows}
+                </tbody>
+            </table>
+            <p style="margin-top: 1rem; font-size: 0.875rem; color: #6b7280;">{escape(notes)}</p>
+        </div>
+        """)
+
+@st.cache_resource(show_spinner=False)
+def get_rating_store():
+    return RatingStore()
+
+def explanation_rating(algorithm):
+    # One set of ratings per algorithm per browser session
+    rated = st.session_state.setdefault("rated", set())
+    with st.form(f"ratings.{algorithm}", clear_on_submit=True):
+        static_markdown("""
+        <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 1rem;">Was this explanation helpful?</h3>
+        <p style="color: #6b7280; font-size: 0.875rem; margin-bottom: 1.5rem;">
+            Your feedback helps us improve how we explain AI systems.
+        </p>
+        """)
+        options = {t(answer.capitalize()): answer for answer in ANSWERS}
+        answers = {question: st.radio(t(label), list(options), index=None, horizontal=True)
+                   for question, label in QUESTIONS.items()}
+        submitted = st.form_submit_button(t("Submit Ratings"), type="primary", use_container_width=True,
+                                          disabled=algorithm in rated)
+    
+    if submitted:
+        answers = {question: options[answer] for question, answer in answers.items() if answer}
+        if not answers:
+            st.error(t("Please answer at least one question before submitting."))
+            return
+        get_rating_store().rate(algorithm, answers)
+        rated.add(algorithm)
+    
+    if algorithm in rated:
+        # Read from the in-memory histograms, no query
+        histogram = get_rating_store().histogram(algorithm)["clarity"]
+        ratings = sum(histogram.values())
+        st.success(t("Thank you for rating this explanation. In the last {days} days, {count} people rated it "
+                     "and {percent}% found it clear.").format(
+            days=WINDOW_DAYS, count=ratings, percent=round(100 * histogram["yes"] / ratings) if ratings else 0))
+
+@st.cache_resource(show_spinner=False)
+def get_scoring_table():
+    return ScoringTable()
+
+def score_calculator():
+    static_markdown("""
+    <div class="card">
+        <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 0.5rem;">How would my application be scored?</h2>
+        <p style="color: #6b7280;">
+            Try the scoring rules the system uses with your own situation. This is an indication only, and
+            nothing you enter here is stored or sent to the Housing Department.
+        </p>
+    </div>
+    """)
+    
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        years = st.slider(t("Years on the waiting list"), 0, MAX_WAITING_YEARS, 3)
+        situations = {t(label): label for label in HOUSING_SITUATIONS}
+        situation = situations[st.selectbox(t("Current housing situation"), list(situations))]
+        household = st.slider(t("People in your household"), 1, MAX_HOUSEHOLD, 1)
+    with col2:
+        income = st.slider(t("Gross yearly household income (€)"), 0, MAX_INCOME, 30000, step=INCOME_STEP)
+        st.caption(t("Special circumstances"))
+        circumstances = [label for label in CIRCUMSTANCES if st.checkbox(t(label))]
+    
+    result = get_scoring_table().score(years, situation, household, income, circumstances)
+    maxima = get_scoring_table().maxima
+    if not result["eligible"]:
+        st.warning(t("With this income you are above the social housing income limit of €{limit:,} for your "
+                     "household, so you could not register.").format(limit=result["income_limit"]))
+    
+    factors = "".join(f"""
+            <div class="trust-indicator">
+                <div class="trust-indicator-header">
+                    <span style="font-weight: 500;">{escape(t(factor))}</span>
+                    <span style="font-size: 0.875rem; font-weight: 500;">{points}/{maxima[factor]}</span>
+                </div>
+                <div class="trust-indicator-bar">
+                    <div class="trust-indicator-fill" style="width: {100 * points // maxima[factor]}%; background-color: #dc2626;"></div>
+                </div>
+            </div>""" for factor, points in result["breakdown"].items())
+    st.markdown(minify(f"""
+    <div class="card" style="margin-top: 1rem;">
+        <div style="display: flex; justify-content: space-between; align-items: baseline; margin-bottom: 1rem;">
+            <h3 style="font-size: 1.25rem; font-weight: 600;">{t("Your priority score")}</h3>
+            <span style="font-size: 2rem; font-weight: 700; color: #dc2626;">{result["score"]}</span>
+        </div>
+        <p style="margin-bottom: 1.5rem;">{escape(t("Higher than {percent}% of applicants on the waiting list").format(percent=result["percentile"]))}</p>{factors}
+    </div>
+    """), unsafe_allow_html=True)
+
+@profiled("housing_allocation")
+def housing_allocation_page():
+    static_markdown("""
+    <div style="margin-bottom: 1rem;">
+        <span class="badge badge-secondary">Housing</span>
+        <span class="badge badge-red">High Risk</span>
+    </div>
+    <h1 style="font-size: 1.875rem; font-weight: 700; margin-bottom: 0.5rem;">Social Housing Allocation System</h1>
+    <p style="color: #6b7280; font-size: 1.125rem; margin-bottom: 1.5rem;">
+        An algorithm that helps distribute social housing based on need and waiting time.
+    </p>
+    """)
+    
+    # Tabs
+    tab = lazy_tabs(["Explanation", "Check Your Score", "Trust Indicators", "Your Rights", "Give Feedback"], key="housing_tab")
+    
+    if tab == "Explanation":
+        # Explanation tab
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            static_markdown("""
+            <div class="card">
+                <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem;">What is this system for?</h2>
+                <p style="margin-bottom: 1rem;">
+                    The Social Housing Allocation System helps the city distribute limited social housing units to
+                    those who need them most. Amsterdam faces a housing shortage, and this system aims to make the
+                    allocation process fair and transparent.
+                </p>
+
+                <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem; margin-top: 2rem;">How does it affect me?</h2>
+                <p style="margin-bottom: 1rem;">
+                    If you apply for social housing in Amsterdam, this system will analyze your application to
+                    determine your position on the waiting list. It considers factors like:
+                </p>
+                <ul style="list-style-type: disc; padding-left: 1.5rem; margin-bottom: 1rem;">
+                    <li>How long you've been waiting</li>
+                    <li>Your current housing situation</li>
+                    <li>Your household composition (family size, etc.)</li>
+                    <li>Your income level</li>
+                    <li>Special circumstances (medical needs, etc.)</li>
+                </ul>
+                <p>
+                    The system then assigns a priority score that determines when you might receive a housing offer.
+                    Higher scores mean higher priority.
+                </p>
+
+                <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem; margin-top: 2rem;">What kind of data does it use?</h2>
+                <p style="margin-bottom: 1rem;">The system uses data from your housing application, including:</p>
+                <ul style="list-style-type: disc; padding-left: 1.5rem; margin-bottom: 1rem;">
+                    <li>Personal information (age, household composition)</li>
+                    <li>Financial information (income, assets, debt situation)</li>
+                    <li>Current housing details (address, type of housing, rental amount)</li>
+                    <li>Special circumstances (health issues, social needs)</li>
+                    <li>Registration date and history</li>
+                </ul>
+                <p style="color: #6b7280; font-size: 0.875rem;">
+                    Note: All data is processed in accordance with GDPR and local privacy regulations.
+                </p>
+            </div>
+            """)
+            
+            # Explainability Rating
+            explanation_rating("housing-allocation")
+            
+        with col2:
+            static_markdown("""
+            <div class="card">
+                <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 1rem;">Quick Summary</h3>
+                <div style="margin-bottom: 1rem;">
+                    <div style="display: flex; gap: 0.75rem; margin-bottom: 1rem;">
+                        <div style="color: #dc2626; margin-top: 0.125rem;">👥</div>
+                        <div>
+                            <p style="font-weight: 500;">Who uses it</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">Housing Department, Social Affairs</p>
+                        </div>
+                    </div>
+                    <div style="display: flex; gap: 0.75rem; margin-bottom: 1rem;">
+                        <div style="color: #dc2626; margin-top: 0.125rem;">💾</div>
+                        <div>
+                            <p style="font-weight: 500;">Data retention</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">7 years after application</p>
+                        </div>
+                    </div>
+                    <div style="display: flex; gap: 0.75rem;">
+                        <div style="color: #dc2626; margin-top: 0.125rem;">🛡️</div>
+                        <div>
+                            <p style="font-weight: 500;">Human oversight</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">Final decisions reviewed by housing officers</p>
+                        </div>
+                    </div>
+                </div>
+                
+                <div style="border-top: 1px solid #e5e7eb; margin: 1.5rem 0;"></div>
+                
+                <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 1rem;">Related Systems</h3>
+                <ul style="list-style-type: none; padding: 0;">
+                    <li style="margin-bottom: 0.5rem;">
+                        <a href="#" style="color: #dc2626; text-decoration: none; display: flex; align-items: center;">
+                            Housing Fraud Detection
+                        </a>
+                    </li>
+                    <li>
+                        <a href="#" style="color: #dc2626; text-decoration: none; display: flex; align-items: center;">
+                            Neighborhood Development Planning
+                        </a>
+                    </li>
+                </ul>
+            </div>
+            """)
+    
+    if tab == "Check Your Score":
+        # Self-check calculator
+        score_calculator()
+        
+    if tab == "Trust Indicators":
+        # Trust Indicators tab
+        st.markdown(trust_indicators_card("housing-allocation"), unsafe_allow_html=True)
+        st.markdown(bias_audit_card(), unsafe_allow_html=True)
+        
+    if tab == "Your Rights":
+        # Your Rights tab
+        static_markdown("""
+        <div class="card">
+            <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Your Rights</h2>
+            <p style="margin-bottom: 1.5rem;">
+                As a citizen affected by this AI system, you have specific rights under GDPR and local regulations:
+            </p>
+
+            <div style="display: flex; flex-direction: column; gap: 1.5rem;">
+                <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                    <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 0.5rem;">Right to Explanation</h3>
+                    <p>
+                        You can request a specific explanation of how a decision about your housing application was made.
+                        The Housing Department must provide this in clear, non-technical language.
+                    </p>
+                    <button style="margin-top: 1rem; background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem; font-weight: 500;">
+                        Request an Explanation
+                    </button>
+                </div>
+
+                <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                    <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 0.5rem;">Right to Object</h3>
+                    <p>
+                        If you believe the system has made an unfair decision, you can object and request human review. A
+                        housing officer will manually review your case.
+                    </p>
+                    <button style="margin-top: 1rem; background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem; font-weight: 500;">
+                        File an Objection
+                    </button>
+                </div>
+
+                <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                    <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 0.5rem;">Right to Access Your Data</h3>
+                    <p>
+                        You can request all personal data used by the system in your case. This includes all factors
+                        considered in your priority score calculation.
+                    </p>
+                    <button style="margin-top: 1rem; background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem; font-weight: 500;">
+                        Request Your Data
+                    </button>
+                </div>
+
+                <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                    <h3 style="font-size: 1.125rem; font-weight: 600; margin-bottom: 0.5rem;">Right to Correction</h3>
+                    <p>
+                        If you find incorrect information in your data, you have the right to have it corrected. This may
+                        affect your priority score.
+                    </p>
+                    <button style="margin-top: 1rem; background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem; font-weight: 500;">
+                        Request a Correction
+                    </button>
+                </div>
+            </div>
+        </div>
+        """)
+        
+    if tab == "Give Feedback":
+        # Give Feedback tab
+        feedback_form("housing_feedback", system="housing-allocation")
@@ -0,0 +1,486 @@
+from html import escape
+
+import streamlit as st
+
+from consultation import DOCUMENTS
+from metrics import profiled
+from notifications import booking_topic
+from ui import lazy_tabs, static_markdown, static_template, t
+from views.consultation import consultation_page
+from views.feedback import get_feedback_store, get_notifier
+from views.survey import survey_section
+from workshops import SEED_WORKSHOPS, WorkshopBookings
+
+@st.cache_resource(show_spinner=False)
+def get_workshop_bookings():
+    return WorkshopBookings()
+
+def availability(seats):
+    if seats > 0:
+        return t("Only {seats} spots left").format(seats=seats)
+    return t("Fully booked, waitlist open")
+
+def booking_status(booking):
+    title = t(SEED_WORKSHOPS[booking.workshop][0])
+    if booking.status == "confirmed":
+        return t("You're registered for {workshop}.").format(workshop=title)
+    return t("{workshop} is fully booked. You're number {position} on the waitlist, and we'll email you if a "
+             "seat opens up.").format(workshop=title, position=booking.position)
+
+def workshop_registration(slug):
+    # Bookings made in this browser session can be cancelled here; the
+    # confirmation email has a cancellation code for later
+    bookings = st.session_state.setdefault("bookings", {})
+    booking = bookings.get(slug)
+    if booking is not None:
+        # Reread, since the waitlist moves and the booking may be cancelled
+        booking = bookings[slug] = get_workshop_bookings().booking(booking.token)
+    if booking is not None and booking.status != "cancelled":
+        st.info(booking_status(booking))
+        if st.button(t("Cancel registration"), key=f"cancel.{slug}", use_container_width=True):
+            cancel_booking(booking.token)
+        return
+    
+    with st.form(f"register.{slug}", clear_on_submit=True):
+        email = st.text_input(t("Email"), placeholder=t("Your email"), label_visibility="collapsed")
+        submitted = st.form_submit_button(t("Register"), type="primary", use_container_width=True)
+    
+    if submitted:
+        try:
+            booking, created = get_workshop_bookings().register(slug, email)
+        except ValueError as exc:
+            st.error(t(str(exc)))
+            return
+        if created:
+            notifier = get_notifier()
+            topic = booking_topic(booking.id)
+            notifier.subscribe(booking.email, topic, confirmed=True)
+            title = SEED_WORKSHOPS[slug][0]
+            if booking.status == "confirmed":
+                status = f"You're registered for {title}."
+            else:
+                status = (f"{title} is fully booked. You're number {booking.position} on the waitlist, and "
+                          "we'll email you if a seat opens up.")
+            notifier.publish(topic, f"Your registration: {title}",
+                             f"{status}\n\nCan't make it? Cancel on the Influence page with the code "
+                             f"{booking.token}, so someone on the waitlist can take your seat.")
+        bookings[slug] = booking
+        st.rerun()
+
+def cancel_booking(token):
+    cancelled, promoted = get_workshop_bookings().cancel(token)
+    if cancelled is None:
+        st.error(t("No active registration was found for this code."))
+        return
+    bookings = st.session_state.setdefault("bookings", {})
+    bookings.pop(cancelled.workshop, None)
+    if promoted is not None:
+        title = SEED_WORKSHOPS[promoted.workshop][0]
+        get_notifier().publish(booking_topic(promoted.id), f"A seat opened up: {title}",
+                               f"Good news: a seat opened up and you're now registered for {title}.")
+    st.session_state["cancelled"] = cancelled.workshop
+    st.rerun()
+
+def cancel_form():
+    with st.expander(t("Can't make it? Cancel a registration")):
+        with st.form("cancel_booking", clear_on_submit=True):
+            code = st.text_input(t("Cancellation code from your confirmation email"))
+            submitted = st.form_submit_button(t("Cancel registration"), use_container_width=True)
+        if submitted and code.strip():
+            cancel_booking(code)
+    if "cancelled" in st.session_state:
+        workshop = st.session_state.pop("cancelled")
+        st.success(t("Your registration for {workshop} is cancelled.").format(
+            workshop=t(SEED_WORKSHOPS[workshop][0])))
+
+def stay_informed_form():
+    with st.form("stay_informed", clear_on_submit=True):
+        static_markdown("""
+        <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">Stay Informed</h3>
+        <p style="margin-bottom: 1rem;">
+            Sign up to receive notifications about new participation opportunities that match your interests.
+        </p>
+        """)
+        email = st.text_input(t("Email"), placeholder=t("Your email"), label_visibility="collapsed")
+        submitted = st.form_submit_button(t("Subscribe"), type="primary", use_container_width=True)
+    
+    if submitted:
+        try:
+            get_notifier().subscribe(email)
+        except ValueError as exc:
+            st.error(t(str(exc)))
+            return
+        st.success(t("Almost done: we've sent you an email with a link to confirm your subscription."))
+
+
+@profiled("influence")
+def influence_page():
+    # ?consultation=<document> opens a consultation document for comments
+    document = st.query_params.get("consultation")
+    if document in DOCUMENTS:
+        consultation_page(document)
+        return
+    
+    static_markdown("""
+    <h1 style="font-size: 1.875rem; font-weight: 700; margin-bottom: 0.5rem;">Influence AI in Amsterdam</h1>
+    <p style="color: #6b7280; font-size: 1.125rem; margin-bottom: 1.5rem;">
+        Participate in the co-design of AI systems and help shape the future of technology in your city.
+    </p>
+    """)
+    
+    # Tabs
+    tab = lazy_tabs(["Participate", "Your Impact", "Policy Input"], key="influence_tab")
+    
+    if tab == "Participate":
+        # Participate tab
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            static_markdown("""
+            <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Upcoming Opportunities</h2>
+            """)
+            seats = get_workshop_bookings().seats_left(list(SEED_WORKSHOPS))
+            
+            static_template("""
+            <div class="card">
+                <div style="margin-bottom: 0.75rem;">
+                    <span class="badge badge-secondary">Co-Design Workshop</span>
+                    <span class="badge badge-red">{availability}</span>
+                </div>
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 0.5rem;">Traffic Management AI</h3>
+                <p style="color: #6b7280; margin-bottom: 1rem;">
+                    Help design a new AI system that will manage traffic flow in the city center. We want to hear from residents, commuters, and business owners.
+                </p>
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;">
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">📅</span>
+                        <span style="font-size: 0.875rem;">June 15, 2023</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">🕔</span>
+                        <span style="font-size: 0.875rem;">18:00 - 20:00</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">📍</span>
+                        <span style="font-size: 0.875rem;">Public Library Amsterdam</span>
+                    </div>
+                </div>
+            </div>
+            """, availability=escape(availability(seats["traffic-management"])))
+            workshop_registration("traffic-management")
+            
+            static_template("""
+            <div class="card" style="margin-top: 1.5rem;">
+                <div style="margin-bottom: 0.75rem;">
+                    <span class="badge badge-secondary">Citizen Panel</span>
+                    <span class="badge badge-red">{availability}</span>
+                </div>
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 0.5rem;">AI Ethics Guidelines Review</h3>
+                <p style="color: #6b7280; margin-bottom: 1rem;">
+                    Join a diverse panel of citizens to review and provide feedback on Amsterdam's AI ethics guidelines. No technical knowledge required.
+                </p>
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;">
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">📅</span>
+                        <span style="font-size: 0.875rem;">June 22, 2023</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">🕔</span>
+                        <span style="font-size: 0.875rem;">13:00 - 16:00</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">📍</span>
+                        <span style="font-size: 0.875rem;">Pakhuis de Zwijger</span>
+                    </div>
+                </div>
+            </div>
+            """, availability=escape(availability(seats["ethics-guidelines"])))
+            workshop_registration("ethics-guidelines")
+            cancel_form()
+            
+            static_markdown("""
+            <div class="card" style="margin-top: 1.5rem;">
+                <div style="margin-bottom: 0.75rem;">
+                    <span class="badge badge-secondary">Online Survey</span>
+                </div>
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 0.5rem;">Neighborhood Safety Cameras</h3>
+                <p style="color: #6b7280; margin-bottom: 1rem;">
+                    Share your opinions on the proposed AI-powered safety camera system for residential neighborhoods. Survey takes approximately 15 minutes.
+                </p>
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem; margin-bottom: 1.5rem;">
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">📅</span>
+                        <span style="font-size: 0.875rem;">Open until July 5, 2023</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">🕔</span>
+                        <span style="font-size: 0.875rem;">Complete anytime</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="color: #6b7280;">📍</span>
+                        <span style="font-size: 0.875rem;">Online</span>
+                    </div>
+                </div>
+            </div>
+            """)
+            survey_section("safety-cameras")
+            
+        with col2:
+            static_markdown("""
+            <div class="card">
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">Why Participate?</h3>
+                <p style="margin-bottom: 1rem;">
+                    Your participation helps ensure AI systems in Amsterdam reflect the needs and values of all citizens.
+                </p>
+                <div style="margin-bottom: 0.75rem;">
+                    <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.75rem;">
+                        <span style="color: #dc2626; margin-top: 0.125rem;">👥</span>
+                        <div>
+                            <p style="font-weight: 500;">Diverse perspectives</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">
+                                We need input from people of all backgrounds and experiences
+                            </p>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.75rem;">
+                        <span style="color: #dc2626; margin-top: 0.125rem;">🗳️</span>
+                        <div>
+                            <p style="font-weight: 500;">Real influence</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">
+                                Your input directly shapes how systems are designed and implemented
+                            </p>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                        <span style="color: #dc2626; margin-top: 0.125rem;">📅</span>
+                        <div>
+                            <p style="font-weight: 500;">Early involvement</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">
+                                Participate before systems are finalized, when changes are easier to make
+                            </p>
+                        </div>
+                    </div>
+                </div>
+                <div style="padding-top: 1rem; border-top: 1px solid #e5e7eb;">
+                    <p style="font-size: 0.875rem; font-weight: 500;">Compensation for your time</p>
+                    <p style="font-size: 0.875rem; color: #6b7280; margin-top: 0.25rem;">
+                        Participants in workshops, panels, and testing sessions receive a €50 voucher for local businesses or VVV bonnen.
+                    </p>
+                </div>
+            </div>
+            """)
+            stay_informed_form()
+    
+    if tab == "Your Impact":
+        # Your Impact tab
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            static_markdown("""
+            <div class="card">
+                <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Citizen Impact Stories</h2>
+                <div style="display: flex; flex-direction: column; gap: 1.5rem;">
+                    <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                        <div style="display: flex; align-items: flex-start; gap: 1rem;">
+                            <div style="width: 3rem; height: 3rem; border-radius: 9999px; background-color: #e5e7eb; flex-shrink: 0;"></div>
+                            <div>
+                                <h3 style="font-weight: 500;">Accessibility Improvements</h3>
+                                <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Fatima K., De Pijp resident</p>
+                                <p style="font-size: 0.875rem;">
+                                    "I participated in testing the waste collection app and pointed out it wasn't accessible for
+                                    screen readers. The team redesigned the interface, and now it works for everyone. It shows
+                                    they really listened to feedback."
+                                </p>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                        <div style="display: flex; align-items: flex-start; gap: 1rem;">
+                            <div style="width: 3rem; height: 3rem; border-radius: 9999px; background-color: #e5e7eb; flex-shrink: 0;"></div>
+                            <div>
+                                <h3 style="font-weight: 500;">Privacy Protections Added</h3>
+                                <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Jan V., Oost resident</p>
+                                <p style="font-size: 0.875rem;">
+                                    "During a citizen panel on crowd monitoring, I raised concerns about facial recognition. The
+                                    final system now uses anonymous counting instead, which still achieves the goal without
+                                    compromising privacy."
+                                </p>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div style="padding: 1rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                        <div style="display: flex; align-items: flex-start; gap: 1rem;">
+                            <div style="width: 3rem; height: 3rem; border-radius: 9999px; background-color: #e5e7eb; flex-shrink: 0;"></div>
+                            <div>
+                                <h3 style="font-weight: 500;">Multilingual Support Added</h3>
+                                <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Sophia L., Nieuw-West resident</p>
+                                <p style="font-size: 0.875rem;">
+                                    "I suggested that the city services chatbot needed to support more languages. Now it works
+                                    in Dutch, English, Arabic, and Turkish, making it accessible to more residents."
+                                </p>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+            """)
+            
+        with col2:
+            static_template("""
+            <div class="card">
+                <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Changes Made Based on Citizen Input</h2>
+                <div style="display: flex; flex-direction: column; gap: 1.5rem;">
+                    <div>
+                        <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">Parking Enforcement AI</h3>
+                        <div style="display: flex; flex-direction: column; gap: 0.5rem;">
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                                <span class="badge badge-secondary" style="margin-top: 0.125rem;">Before</span>
+                                <p style="font-size: 0.875rem;">System stored all vehicle images for 30 days</p>
+                            </div>
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                                <span class="badge badge-green" style="margin-top: 0.125rem;">After</span>
+                                <p style="font-size: 0.875rem;">
+                                    Images deleted immediately after processing unless violation detected
+                                </p>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div>
+                        <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">Social Housing Allocation</h3>
+                        <div style="display: flex; flex-direction: column; gap: 0.5rem;">
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                                <span class="badge badge-secondary" style="margin-top: 0.125rem;">Before</span>
+                                <p style="font-size: 0.875rem;">Complex algorithm with limited explanation</p>
+                            </div>
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                                <span class="badge badge-green" style="margin-top: 0.125rem;">After</span>
+                                <p style="font-size: 0.875rem;">Simplified scoring system with detailed personalized explanations</p>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div>
+                        <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">Crowd Monitoring</h3>
+                        <div style="display: flex; flex-direction: column; gap: 0.5rem;">
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                                <span class="badge badge-secondary" style="margin-top: 0.125rem;">Before</span>
+                                <p style="font-size: 0.875rem;">No public information about system locations</p>
+                            </div>
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem;">
+                                <span class="badge badge-green" style="margin-top: 0.125rem;">After</span>
+                                <p style="font-size: 0.875rem;">
+                                    Interactive map showing all monitoring locations and public dashboard
+                                </p>
+                            </div>
+                        </div>
+                    </div>
+                    
+                    <div style="padding-top: 1rem; border-top: 1px solid #e5e7eb;">
+                        <h3 style="font-weight: 500; margin-bottom: 0.5rem;">Impact by Numbers</h3>
+                        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+                            <div style="padding: 0.75rem; background-color: #f3f4f6; border-radius: 0.5rem; text-align: center;">
+                                <p style="font-size: 1.5rem; font-weight: 700; color: #dc2626;">{participants:,}</p>
+                                <p style="font-size: 0.75rem; color: #6b7280;">Citizens participated in {year}</p>
+                            </div>
+                            <div style="padding: 0.75rem; background-color: #f3f4f6; border-radius: 0.5rem; text-align: center;">
+                                <p style="font-size: 1.5rem; font-weight: 700; color: #dc2626;">{changed_percent}%</p>
+                                <p style="font-size: 0.75rem; color: #6b7280;">Of feedback led to changes</p>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+            """, **get_feedback_store().impact())
+    
+    if tab == "Policy Input":
+        # Policy Input tab
+        static_markdown("""
+        <div class="card">
+            <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Help Shape AI Policy in Amsterdam</h2>
+            <p style="margin-bottom: 1.5rem;">
+                Amsterdam is developing policies to govern the use of AI in the city. Your input helps ensure these
+                policies reflect citizen values and concerns.
+            </p>
+
+            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 2rem; margin-bottom: 2rem;">
+                <div style="padding: 1.5rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                    <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">Current Consultations</h3>
+                    <div style="display: flex; flex-direction: column; gap: 1rem;">
+                        <div>
+                            <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.25rem;">
+                                <h4 style="font-weight: 500;">Draft AI Ethics Framework</h4>
+                                <span class="badge badge-secondary">Open</span>
+                            </div>
+                            <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Closes July 15, 2023</p>
+                            <p style="font-size: 0.875rem; margin-bottom: 0.75rem;">
+                                Review and comment on the proposed ethical guidelines for all AI systems used by the city.
+                            </p>
+                            <a href="?page=influence&amp;consultation=ethics-framework" target="_self" style="display: inline-block; background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem; text-decoration: none;">Participate</a>
+                        </div>
+
+                        <div>
+                            <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.25rem;">
+                                <h4 style="font-weight: 500;">AI Transparency Requirements</h4>
+                                <span class="badge badge-secondary">Open</span>
+                            </div>
+                            <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Closes August 3, 2023</p>
+                            <p style="font-size: 0.875rem; margin-bottom: 0.75rem;">
+                                Help define what information about AI systems should be publicly available.
+                            </p>
+                            <button style="background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem;">
+                                Participate
+                            </button>
+                        </div>
+                    </div>
+                </div>
+
+                <div style="padding: 1.5rem; border: 1px solid #e5e7eb; border-radius: 0.5rem;">
+                    <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">Policy Impact</h3>
+                    <div style="display: flex; flex-direction: column; gap: 1rem;">
+                        <div>
+                            <h4 style="font-weight: 500; margin-bottom: 0.25rem;">AI Procurement Guidelines</h4>
+                            <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Consultation closed: March 2023</p>
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.25rem;">
+                                <span class="badge badge-green" style="margin-top: 0.125rem;">Implemented</span>
+                                <p style="font-size: 0.875rem;">
+                                    Citizen input led to stronger requirements for explainability and bias testing.
+                                </p>
+                            </div>
+                            <a href="#" style="font-size: 0.875rem; color: #dc2626; text-decoration: none;">View Results</a>
+                        </div>
+
+                        <div>
+                            <h4 style="font-weight: 500; margin-bottom: 0.25rem;">Facial Recognition Limitations</h4>
+                            <p style="font-size: 0.875rem; color: #6b7280; margin-bottom: 0.5rem;">Consultation closed: November 2022</p>
+                            <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.25rem;">
+                                <span class="badge badge-yellow" style="margin-top: 0.125rem;">In Progress</span>
+                                <p style="font-size: 0.875rem;">
+                                    Policy being finalized based on strong citizen concerns about privacy.
+                                </p>
+                            </div>
+                            <a href="#" style="font-size: 0.875rem; color: #dc2626; text-decoration: none;">View Results</a>
+                        </div>
+                    </div>
+                </div>
+            </div>
+
+            <div style="background-color: #f3f4f6; padding: 1.5rem; border-radius: 0.5rem;">
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">Join the Citizen AI Advisory Board</h3>
+                <p style="margin-bottom: 1rem;">
+                    We're recruiting citizens to serve on Amsterdam's AI Advisory Board. Members meet quarterly to
+                    review AI initiatives and provide ongoing input on policy and implementation.
+                </p>
+                <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1rem;">
+                    <span style="color: #6b7280;">🕔</span>
+                    <span style="font-size: 0.875rem; color: #6b7280;">Applications close June 30, 2023</span>
+                </div>
+                <button style="background-color: #dc2626; color: white; padding: 0.75rem 1rem; border: none; border-radius: 0.375rem; font-weight: 500; display: flex; align-items: center; gap: 0.25rem;">
+                    <span>Learn More & Apply</span>
+                    <span>→</span>
+                </button>
+            </div>
+        </div>
+        """)
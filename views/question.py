@@ -0,0 +1,286 @@
+import threading
+from html import escape
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from metrics import profiled
+from search import SearchIndex
+from ui import get_registry, lazy_tabs, static_markdown, t, time_ago
+from views.feedback import feedback_form, get_feedback_store
+from votes import VoteCounter
+
+@st.cache_resource(show_spinner=False)
+def get_vote_counter():
+    return VoteCounter()
+
+def vote(feedback_id):
+    # One vote per feedback per browser session
+    if get_vote_counter().vote(feedback_id, get_script_run_ctx().session_id):
+        st.session_state.setdefault("voted", set()).add(feedback_id)
+
+
+FEEDBACK_BADGES = {"concern": "Concern", "question": "Question", "suggestion": "Suggestion"}
+FEEDBACK_BADGE_COLORS = {"concern": "badge-red", "question": "badge-blue", "suggestion": "badge-green"}
+FEEDBACK_PER_PAGE = 20
+OFFICIAL_BADGE = '''
+                            <span class="badge" style="font-size: 0.75rem; padding: 0.125rem 0.375rem;">{}</span>'''
+
+@st.cache_resource(show_spinner=False)
+def get_feedback_index():
+    # Returns the index and an event that is set once it is built. The index
+    # is built in a background thread, so no session waits for it, and the
+    # redactor's writer thread adds new public feedback as it is published.
+    # Rows published while the index is built can arrive both ways, so each
+    # id is only added once.
+    store = get_feedback_store()
+    index = SearchIndex(fields=("kind", "system"))
+    ready = threading.Event()
+    indexed = set()
+    lock = threading.Lock()
+    
+    def add(row):
+        with lock:
+            if row["id"] in indexed:
+                return
+            indexed.add(row["id"])
+        index.add(row["id"], f"{row['title']}\n{row['details']}", kind=row["kind"], system=row["system"])
+    
+    def build():
+        for row in store.iter_public(store.last_id()):
+            add(row)
+        ready.set()
+    
+    store.add_publish_listener(lambda rows: [add(row) for row in rows])
+    threading.Thread(target=build, name="feedback-index", daemon=True).start()
+    return index, ready
+
+def feedback_card(row, responses, first=False):
+    algorithm = get_registry().get(row["system"]) if row["system"] else None
+    replies = "".join(f"""
+                <div style="padding-left: 1rem; border-left: 2px solid #e5e7eb;{' margin-bottom: 1rem;' if i < len(responses) - 1 else ''}">
+                    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.25rem;">
+                        <div style="display: flex; align-items: center; gap: 0.5rem;">
+                            <span style="font-weight: 500;">{escape(response["author"])}</span>{OFFICIAL_BADGE.format(t("Official")) if response["official"] else ""}
+                        </div>
+                        <span style="font-size: 0.75rem; color: #6b7280;">{time_ago(response["created_at"])}</span>
+                    </div>
+                    <p style="font-size: 0.875rem;">
+                        {escape(response["body"])}
+                    </p>
+                </div>""" for i, response in enumerate(responses))
+    # Near-duplicates are folded into the first copy
+    similar = ""
+    if row["copies"]:
+        count = row["copies"]
+        similar = " · " + t(f"{{count}} similar submission{'s' if count > 1 else ''}").format(count=count)
+    if replies:
+        replies = f"""
+            <div style="margin-top: 1.5rem; padding-top: 1.5rem; border-top: 1px solid #e5e7eb;">
+                <h4 style="font-weight: 500; margin-bottom: 1rem;">{t("Responses")}</h4>{replies}
+            </div>"""
+    return f"""
+        <div class="card"{'' if first else ' style="margin-top: 1.5rem;"'}>
+            <div style="margin-bottom: 0.75rem;">
+                <span class="badge {FEEDBACK_BADGE_COLORS[row["kind"]]}">{t(FEEDBACK_BADGES[row["kind"]])}</span>
+                <span class="badge badge-secondary">{escape(t(algorithm.name if algorithm else "Other system"))}</span>
+            </div>
+            <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 0.5rem;">{escape(row["title"])}</h3>
+            <p style="color: #6b7280; margin-bottom: 1rem;">
+                {escape(row["details"])}
+            </p>
+            <p style="font-size: 0.75rem; color: #6b7280; margin-bottom: 1.5rem;">{t("Posted {time}").format(time=time_ago(row["created_at"]))}{similar}</p>{replies}
+            <div style="display: flex; justify-content: flex-end; align-items: center; margin-top: 1.5rem;">
+                <button style="background-color: transparent; border: 1px solid #e5e7eb; color: #111827; padding: 0.375rem 0.75rem; border-radius: 0.375rem; font-size: 0.875rem; display: flex; align-items: center; gap: 0.25rem;">
+                    <span>💬</span>
+                    <span>{t("Respond")}</span>
+                </button>
+            </div>
+        </div>
+        """
+
+def feedback_page(store, query, filters):
+    # The session keeps a stack of page cursors, each the position of the
+    # last row on the page before: its id in the feed, its (created_at, id)
+    # in an unranked search, its (id, score) in a ranked one. Changing the
+    # search or filters starts again from the first page, and so does the
+    # index becoming ready: until then searches go to the database, unranked.
+    index, ready = get_feedback_index()
+    ranked = ready.is_set()
+    view = (query, tuple(sorted(filters.items())), ranked)
+    if st.session_state.get("feedback_view") != view:
+        st.session_state.feedback_view = view
+        st.session_state.feedback_cursors = [None]
+    cursor = st.session_state.feedback_cursors[-1]
+    if query:
+        if not ranked:
+            rows = store.search_public(query, limit=FEEDBACK_PER_PAGE + 1, before=cursor, **filters)
+            next_cursor = None
+            if len(rows) > FEEDBACK_PER_PAGE:
+                last = rows[FEEDBACK_PER_PAGE - 1]
+                next_cursor = (last["created_at"], last["id"])
+            return rows[:FEEDBACK_PER_PAGE], next_cursor
+        hits = index.search(query, limit=FEEDBACK_PER_PAGE + 1, after=cursor, **filters)
+        next_cursor = hits[FEEDBACK_PER_PAGE - 1] if len(hits) > FEEDBACK_PER_PAGE else None
+        return store.published([feedback_id for feedback_id, _ in hits[:FEEDBACK_PER_PAGE]]), next_cursor
+    rows = store.public_feedback(limit=FEEDBACK_PER_PAGE + 1, before=cursor, **filters)
+    next_cursor = rows[FEEDBACK_PER_PAGE - 1]["id"] if len(rows) > FEEDBACK_PER_PAGE else None
+    return rows[:FEEDBACK_PER_PAGE], next_cursor
+
+@profiled("question")
+def question_page():
+    static_markdown("""
+    <h1 style="font-size: 1.875rem; font-weight: 700; margin-bottom: 0.5rem;">Question AI in Amsterdam</h1>
+    <p style="color: #6b7280; font-size: 1.125rem; margin-bottom: 1.5rem;">
+        Ask questions, report concerns, and share your experiences with AI systems in the city.
+    </p>
+    """)
+    
+    # Tabs
+    tab = lazy_tabs(["Public Feedback", "Submit Feedback", "FAQ"], key="question_tab")
+    
+    if tab == "Public Feedback":
+        # Public Feedback tab
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            query = st.text_input(t("Search feedback"), placeholder=t("Search feedback..."), label_visibility="collapsed")
+        with col2:
+            if st.button(t("🔍 Filter"), key="feedback_filter"):
+                st.session_state.show_feedback_filters = not st.session_state.get("show_feedback_filters", False)
+        
+        filters = {}
+        if st.session_state.get("show_feedback_filters"):
+            col1, col2 = st.columns(2)
+            with col1:
+                kinds = {t("All types"): None, **{t(label): kind for kind, label in FEEDBACK_BADGES.items()}}
+                filters["kind"] = kinds[st.selectbox(t("Type"), list(kinds))]
+            with col2:
+                systems = {t("All systems"): None}
+                systems.update((t(a.name), a.slug) for a in get_registry().search())
+                filters["system"] = systems[st.selectbox(t("System"), list(systems))]
+            filters = {name: value for name, value in filters.items() if value}
+        
+        # Feedback cards, one page per rerun
+        store = get_feedback_store()
+        feedback, next_cursor = feedback_page(store, query.strip(), filters)
+        
+        if not feedback:
+            st.info(t("No feedback matches your search.") if query.strip() else t("No public feedback yet."))
+        responses = store.responses([row["id"] for row in feedback])
+        votes = get_vote_counter().counts([row["id"] for row in feedback])
+        voted = st.session_state.get("voted", set())
+        for i, row in enumerate(feedback):
+            st.markdown(feedback_card(row, responses[row["id"]], first=i == 0), unsafe_allow_html=True)
+            st.button(f"👍 {t('Me too')} · {votes[row['id']]}", key=f"vote_{row['id']}", disabled=row["id"] in voted,
+                      on_click=vote, args=(row["id"],))
+        
+        cursors = st.session_state.feedback_cursors
+        if len(cursors) > 1 or next_cursor is not None:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button(t("← Newer"), key="feedback_newer", disabled=len(cursors) == 1, on_click=cursors.pop)
+            with col2:
+                st.button(t("Older →"), key="feedback_older", disabled=next_cursor is None,
+                          on_click=cursors.append, args=(next_cursor,))
+    
+    if tab == "Submit Feedback":
+        # Submit Feedback tab
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            feedback_form("question_feedback")
+            
+        with col2:
+            static_markdown("""
+            <div class="card">
+                <h3 style="font-size: 1.25rem; font-weight: 600; margin-bottom: 1rem;">About Your Feedback</h3>
+                <p style="margin-bottom: 1rem;">
+                    Your feedback is valuable in making AI systems in Amsterdam more transparent, fair, and accountable.
+                </p>
+                <div style="margin-bottom: 0.5rem;">
+                    <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.5rem;">
+                        <span style="color: #ef4444; margin-top: 0.125rem;">⚠️</span>
+                        <div>
+                            <p style="font-weight: 500;">Report concerns</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">
+                                If you believe an AI system is causing harm or discrimination
+                            </p>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.5rem;">
+                        <span style="color: #3b82f6; margin-top: 0.125rem;">💬</span>
+                        <div>
+                            <p style="font-weight: 500;">Ask questions</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">
+                                If you want to understand how a system works or affects you
+                            </p>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: flex-start; gap: 0.5rem; margin-bottom: 0.5rem;">
+                        <span style="color: #22c55e; margin-top: 0.125rem;">👍</span>
+                        <div>
+                            <p style="font-weight: 500;">Make suggestions</p>
+                            <p style="font-size: 0.875rem; color: #6b7280;">
+                                If you have ideas for improving AI systems in the city
+                            </p>
+                        </div>
+                    </div>
+                </div>
+                <div style="padding-top: 1rem; border-top: 1px solid #e5e7eb;">
+                    <p style="font-size: 0.875rem; font-weight: 500;">What happens next?</p>
+                    <ul style="font-size: 0.875rem; color: #6b7280; list-style-type: disc; padding-left: 1.25rem; margin-top: 0.5rem;">
+                        <li>Your feedback is reviewed by the responsible department</li>
+                        <li>You'll receive a response within 10 working days</li>
+                        <li>With your permission, feedback may be published anonymously</li>
+                        <li>Feedback is used to improve AI systems and policies</li>
+                    </ul>
+                </div>
+            </div>
+            """)
+    
+    if tab == "FAQ":
+        # FAQ tab
+        static_markdown("""
+        <div class="card">
+            <h2 style="font-size: 1.5rem; font-weight: 600; margin-bottom: 1.5rem;">Frequently Asked Questions</h2>
+            <div style="display: flex; flex-direction: column; gap: 1.5rem;">
+                <div>
+                    <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">How is my feedback used?</h3>
+                    <p style="color: #6b7280;">
+                        Your feedback is reviewed by the department responsible for the AI system. It helps identify
+                        issues, improve explanations, and shape future development. Feedback may lead to system audits,
+                        policy changes, or improvements to user interfaces.
+                    </p>
+                </div>
+                <div>
+                    <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">Is my feedback anonymous?</h3>
+                    <p style="color: #6b7280;">
+                        By default, your personal information is kept private. Only if you explicitly consent will your
+                        feedback (without personal details) be shared publicly. You can always submit feedback completely
+                        anonymously.
+                    </p>
+                </div>
+                <div>
+                    <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">How quickly will I get a response?</h3>
+                    <p style="color: #6b7280;">
+                        We aim to respond to all feedback within 10 working days. Complex issues may take longer to
+                        investigate, but you'll receive regular updates on progress.
+                    </p>
+                </div>
+                <div>
+                    <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">What if I'm not satisfied with the response?</h3>
+                    <p style="color: #6b7280;">
+                        If you're not satisfied with the response to your feedback, you can escalate your concern to the
+                        Digital Rights Office. They provide independent oversight of AI systems in Amsterdam.
+                    </p>
+                </div>
+                <div>
+                    <h3 style="font-size: 1.125rem; font-weight: 500; margin-bottom: 0.5rem;">Can I report technical issues with this platform?</h3>
+                    <p style="color: #6b7280;">
+                        Yes, if you encounter any technical issues with the AI & Me platform itself, please use the
+                        "Report a Technical Issue" option in the feedback form or email support@aiandme.amsterdam.nl.
+                    </p>
+                </div>
+            </div>
+        </div>
+        """)
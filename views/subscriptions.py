@@ -0,0 +1,20 @@
+import streamlit as st
+
+from ui import t
+from views.feedback import get_notifier
+
+def email_links():
+    # ?confirm=<token> and ?unsubscribe=<token>, opened from a notification
+    # email. The parameter is dropped from the URL once handled, so the
+    # page's own links and reloads don't carry it along.
+    for action in ("confirm", "unsubscribe"):
+        token = st.query_params.get(action)
+        if token is None:
+            continue
+        del st.query_params[action]
+        if action == "unsubscribe" and get_notifier().unsubscribe(token):
+            st.success(t("You're unsubscribed and won't receive these emails anymore."))
+        elif action == "confirm" and get_notifier().confirm(token):
+            st.success(t("Your subscription is confirmed. We'll email you about new participation opportunities."))
+        else:
+            st.warning(t("This link is no longer valid. Please check that you opened the full link from the email."))
@@ -0,0 +1,104 @@
+import secrets
+from html import escape
+
+import streamlit as st
+
+from fragments import minify
+from surveys import SURVEYS, SurveyStore
+from ui import t
+
+@st.cache_resource(show_spinner=False)
+def get_survey_store():
+    return SurveyStore()
+
+def draft_id():
+    # The draft id is kept in the session, so a dropped connection, which
+    # reconnects to the same session, or leaving the page and coming back
+    # picks up the autosaved answers. It is never put in the URL: anyone
+    # with the id could read and overwrite the draft.
+    if "survey_draft" not in st.session_state:
+        st.session_state.survey_draft = secrets.token_urlsafe(12)
+    return st.session_state.survey_draft
+
+def autosave(survey, question):
+    # Widget callback: only the changed answer goes to the store, which
+    # batches it with the other changes of the next few seconds
+    answer = st.session_state[f"survey.{survey}.{question}"]
+    get_survey_store().save(survey, draft_id(), question, answer if answer not in ("", []) else None)
+
+def survey_widget(survey, question, value):
+    key = f"survey.{survey}.{question.key}"
+    if key not in st.session_state and value is not None:
+        st.session_state[key] = value
+    # Options stay in English, so answers and tallies don't depend on the language
+    options = {"key": key, "on_change": autosave, "args": (survey, question.key)}
+    if question.kind == "choice":
+        st.radio(t(question.prompt), question.options, index=None, format_func=t, **options)
+    elif question.kind == "scale":
+        st.radio(t(question.prompt), question.options, index=None, horizontal=True, **options)
+    elif question.kind == "multi":
+        st.multiselect(t(question.prompt), question.options, format_func=t, placeholder=t("Choose options"),
+                       **options)
+    else:
+        st.text_area(t(question.prompt), **options)
+
+def survey_results(survey):
+    # Live tallies, kept up to date as responses are completed
+    results, completed = get_survey_store().tallies(survey)
+    bars = []
+    for question in SURVEYS[survey].questions:
+        if question.kind == "text":
+            continue
+        rows = "".join(f"""
+                <div class="trust-indicator">
+                    <div class="trust-indicator-header">
+                        <span style="font-size: 0.875rem;">{escape(t(option))}</span>
+                        <span style="font-size: 0.875rem; font-weight: 500;">{100 * count // max(completed, 1)}%</span>
+                    </div>
+                    <div class="trust-indicator-bar">
+                        <div class="trust-indicator-fill" style="width: {100 * count // max(completed, 1)}%; background-color: #dc2626;"></div>
+                    </div>
+                </div>""" for option, count in results[question.key].items())
+        bars.append(f"""
+            <h4 style="font-weight: 600; margin: 1.5rem 0 0.75rem;">{escape(t(question.prompt))}</h4>{rows}""")
+    st.markdown(minify(f"""
+        <div class="card" style="margin-top: 1rem;">
+            <h3 style="font-size: 1.25rem; font-weight: 600;">{t("Results so far")}</h3>
+            <p style="color: #6b7280;">{t("Completed responses: {count}").format(count=completed)}</p>{"".join(bars)}
+        </div>
+        """), unsafe_allow_html=True)
+
+def survey_section(survey):
+    completed = st.session_state.setdefault("surveys_completed", set())
+    if survey in completed:
+        st.success(t("Thank you for completing the survey!"))
+        survey_results(survey)
+        return
+    if not st.session_state.get(f"survey.{survey}.open"):
+        if st.button(t("Take Survey"), key=f"survey.{survey}.start", type="primary", use_container_width=True):
+            st.session_state[f"survey.{survey}.open"] = True
+            st.rerun()
+        return
+
+    # The saved draft seeds widgets that have no state yet: on the first
+    # run, and after the page was left (Streamlit drops the state of widgets
+    # that aren't shown)
+    keys = [f"survey.{survey}.{question.key}" for question in SURVEYS[survey].questions]
+    draft = {} if all(key in st.session_state for key in keys) else get_survey_store().draft(survey, draft_id())
+    with st.container(border=True):
+        st.caption(t("Your answers are saved as you go, so you can come back to this page later."))
+        for question in SURVEYS[survey].questions:
+            survey_widget(survey, question, draft.get(question.key))
+        submitted = st.button(t("Submit survey"), key=f"survey.{survey}.submit", type="primary",
+                              use_container_width=True)
+
+    if submitted:
+        answers = {question.key: st.session_state.get(f"survey.{survey}.{question.key}")
+                   for question in SURVEYS[survey].questions}
+        if not any(answers.values()):
+            st.error(t("Please answer at least one question before submitting."))
+            return
+        get_survey_store().complete(survey, draft_id(), answers)
+        completed.add(survey)
+        del st.session_state.survey_draft
+        st.rerun()
@@ -0,0 +1,93 @@
+from html import escape
+
+import streamlit as st
+
+from i18n import translate_html
+from metrics import profiled
+from registry import DOMAINS, RISK_LEVELS
+from ui import current_locale, get_registry, lazy_tabs, static_markdown, t
+
+RISK_BADGES = {"Low Risk": "badge-green", "Medium Risk": "badge-yellow", "High Risk": "badge-red"}
+CARDS_PER_PAGE = 30
+
+
+def algorithm_card(algorithm):
+    link = f' href="?page={algorithm.page}" target="_self"' if algorithm.page else ""
+    return f"""
+    <div class="card algorithm-card">
+        <div class="algorithm-card-header">
+            <span class="badge badge-secondary">{escape(algorithm.category)}</span>
+            <span class="badge {RISK_BADGES.get(algorithm.risk, 'badge-secondary')}">{escape(algorithm.risk)}</span>
+        </div>
+        <h3>{escape(algorithm.name)}</h3>
+        <p>{escape(algorithm.description)}</p>
+        <a class="algorithm-card-button"{link}>
+            <span>Learn More</span>
+            <span>→</span>
+        </a>
+    </div>
+    """
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def algorithm_columns(ids, lang, columns=3):
+    # Cards are laid out row by row, so each column gets every n-th result
+    cards = [algorithm_card(algorithm) for algorithm in get_registry().by_ids(ids)]
+    return [translate_html("".join(cards[i::columns]), lang) for i in range(columns)]
+
+@profiled("understand")
+def understand_page():
+    static_markdown("""
+    <h1 style="font-size: 1.875rem; font-weight: 700; margin-bottom: 0.5rem;">Understand AI in Amsterdam</h1>
+    <p style="color: #6b7280; font-size: 1.125rem; margin-bottom: 1.5rem;">
+        Explore AI systems used in the city with clear, human-centered explanations.
+    </p>
+    """)
+    
+    registry = get_registry()
+    
+    # Search and filter
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        query = st.text_input(t("Search AI systems"), placeholder=t("Search AI systems..."), label_visibility="collapsed")
+    with col2:
+        if st.button(t("🔍 Filter")):
+            st.session_state.show_algorithm_filters = not st.session_state.get("show_algorithm_filters", False)
+    
+    filters = {}
+    if st.session_state.get("show_algorithm_filters"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            filters["category"] = st.multiselect(t("Category"), registry.facet_values("category"))
+        with col2:
+            filters["risk"] = st.multiselect(t("Risk level"), [risk for risk in RISK_LEVELS if risk in registry.facet_values("risk")])
+        with col3:
+            filters["neighborhood"] = st.multiselect(t("Neighborhood"), registry.facet_values("neighborhood"))
+    
+    # Tabs
+    tab = lazy_tabs(["All Systems"] + DOMAINS, key="understand_tab")
+    if tab != "All Systems":
+        filters["domain"] = tab
+    
+    ids = registry.search_ids(query, **filters)
+    # "Show more" applies to one search: a new query, filter or tab starts
+    # again from the first cards
+    view = (query, tab, tuple((name, tuple(value) if isinstance(value, list) else value)
+                              for name, value in sorted(filters.items())))
+    if st.session_state.get("algorithm_view") != view:
+        st.session_state.algorithm_view = view
+        st.session_state.algorithm_limit = CARDS_PER_PAGE
+    limit = st.session_state.algorithm_limit
+    
+    if not ids:
+        st.info(t("No AI systems match your search."))
+        return
+    
+    for col, cards in zip(st.columns(3), algorithm_columns(ids[:limit], current_locale())):
+        with col:
+            st.markdown(cards, unsafe_allow_html=True)
+    
+    if len(ids) > limit:
+        st.caption(t("Showing {shown} of {total} systems").format(shown=limit, total=len(ids)))
+        if st.button(t("Show more")):
+            st.session_state.algorithm_limit = limit + CARDS_PER_PAGE
+            st.rerun()
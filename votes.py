@@ -0,0 +1,108 @@
+import threading
+from collections import Counter
+
+from db import BufferedWriter, LocalConnection
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS votes_seen (
+    feedback_id INTEGER NOT NULL,
+    voter TEXT NOT NULL,
+    PRIMARY KEY (feedback_id, voter)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS vote_counts (
+    feedback_id INTEGER PRIMARY KEY,
+    votes INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class _Shard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.seen = set()
+
+
+class VoteCounter(BufferedWriter):
+    # "Me too" votes. A vote only touches one in-memory shard, picked by the
+    # voter, so simultaneous votes on the same feedback don't contend on one
+    # lock or one database row. A background thread moves the shards'
+    # pending votes into the database every flush_interval seconds, one
+    # transaction and one counter update per feedback id. Votes on their way
+    # from the shards to the database are in _flushing; _pending_lock keeps
+    # counts() from seeing them both there and in the database, or in
+    # neither.
+
+    def __init__(self, path=None, shards=16, flush_interval=1.0):
+        super().__init__(path, flush_interval)
+        self._shards = [_Shard() for _ in range(shards)]
+        self._flushing = Counter()
+        self._pending_lock = threading.Lock()
+        self._reader = LocalConnection(path)
+        self._conn.executescript(SCHEMA)
+        self._start("vote-flusher")
+
+    def vote(self, feedback_id, voter):
+        # Returns False if this voter's vote is still pending; votes that
+        # were already flushed are dropped by the votes_seen primary key
+        shard = self._shards[hash(voter) % len(self._shards)]
+        with shard.lock:
+            if (feedback_id, voter) in shard.seen:
+                return False
+            shard.seen.add((feedback_id, voter))
+            shard.counts[feedback_id] += 1
+        return True
+
+    def counts(self, feedback_ids):
+        result = dict.fromkeys(feedback_ids, 0)
+        if not result:
+            return result
+        with self._pending_lock:
+            rows = self._reader().execute(
+                f"SELECT feedback_id, votes FROM vote_counts "
+                f"WHERE feedback_id IN ({', '.join('?' * len(result))})", list(result),
+            ).fetchall()
+            for feedback_id, votes in rows:
+                result[feedback_id] = votes
+            # Votes that haven't reached the database yet
+            for pending in [self._flushing] + [shard.counts for shard in self._shards]:
+                for feedback_id in result:
+                    result[feedback_id] += pending.get(feedback_id, 0)
+        return result
+
+    def flush(self):
+        with self._flush_lock:
+            votes = set()
+            with self._pending_lock:
+                for shard in self._shards:
+                    with shard.lock:
+                        self._flushing.update(shard.counts)
+                        votes |= shard.seen
+                        shard.counts = Counter()
+                        shard.seen = set()
+            if not votes:
+                return 0
+            added = Counter()
+
+            def put_back():
+                with self._shards[0].lock:
+                    self._shards[0].counts.update(self._flushing)
+                    self._shards[0].seen |= votes
+
+            # Committing and emptying _flushing is one step for counts()
+            with self._pending_lock:
+                try:
+                    with self._transaction(put_back) as conn:
+                        for feedback_id, voter in votes:
+                            added[feedback_id] += conn.execute(
+                                "INSERT OR IGNORE INTO votes_seen (feedback_id, voter) VALUES (?, ?)",
+                                (feedback_id, voter),
+                            ).rowcount
+                        conn.executemany(
+                            "INSERT INTO vote_counts (feedback_id, votes) VALUES (?, ?) "
+                            "ON CONFLICT (feedback_id) DO UPDATE SET votes = votes + excluded.votes",
+                            [(feedback_id, count) for feedback_id, count in added.items() if count],
+                        )
+                finally:
+                    self._flushing = Counter()
+            return sum(added.values())
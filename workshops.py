@@ -0,0 +1,161 @@
+import secrets
+import sqlite3
+import time
+from collections import namedtuple
+
+from db import LocalConnection
+from notifications import clean_email
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workshops (
+    slug TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    capacity INTEGER NOT NULL,
+    booked INTEGER NOT NULL DEFAULT 0 CHECK (booked <= capacity)
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    id INTEGER PRIMARY KEY,
+    workshop TEXT NOT NULL REFERENCES workshops(slug),
+    email TEXT NOT NULL,
+    status TEXT NOT NULL CHECK (status IN ('confirmed', 'waitlisted', 'cancelled')),
+    token TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS bookings_active ON bookings(workshop, email) WHERE status != 'cancelled';
+CREATE INDEX IF NOT EXISTS bookings_waitlist ON bookings(workshop, status, id);
+"""
+
+# slug -> (title, capacity, seats already taken before bookings moved online)
+SEED_WORKSHOPS = {
+    "traffic-management": ("Traffic Management AI", 30, 18),
+    "ethics-guidelines": ("AI Ethics Guidelines Review", 20, 12),
+}
+
+Booking = namedtuple("Booking", "id workshop email status token position")
+
+
+class WorkshopBookings:
+    # Seat bookings with a waitlist. A seat is claimed with one conditional
+    # UPDATE of the workshop's counter (booked < capacity), so there is no
+    # count-then-insert window and no lock in Python: SQLite serializes the
+    # writes, and of a burst of registrations for the last seat exactly one
+    # UPDATE matches. Everyone else is waitlisted in the same transaction.
+    # A cancelled seat passes to the first person on the waitlist, or goes
+    # back to the counter when the waitlist is empty.
+
+    def __init__(self, path=None, workshops=SEED_WORKSHOPS):
+        # One connection per thread; sessions register from their own threads
+        self._conn = LocalConnection(path)
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        conn.executemany(
+            "INSERT OR IGNORE INTO workshops (slug, title, capacity, booked) VALUES (?, ?, ?, ?)",
+            [(slug, title, capacity, booked) for slug, (title, capacity, booked) in workshops.items()],
+        )
+
+    def seats_left(self, workshops):
+        rows = self._conn().execute(
+            f"SELECT slug, capacity - booked FROM workshops WHERE slug IN ({', '.join('?' * len(workshops))})",
+            list(workshops),
+        ).fetchall()
+        return dict(rows)
+
+    def _position(self, conn, workshop, booking_id):
+        # Place on the waitlist, counting from 1
+        return conn.execute(
+            "SELECT COUNT(*) FROM bookings WHERE workshop = ? AND status = 'waitlisted' AND id <= ?",
+            (workshop, booking_id),
+        ).fetchone()[0]
+
+    def _booking(self, conn, row):
+        position = self._position(conn, row["workshop"], row["id"]) if row["status"] == "waitlisted" else None
+        return Booking(row["id"], row["workshop"], row["email"], row["status"], row["token"], position)
+
+    def register(self, workshop, email):
+        # Returns (booking, created). Registering twice returns the existing
+        # booking instead of taking a second seat.
+        email = clean_email(email)
+        while True:
+            result = self._register(workshop, email)
+            if result is not None:
+                return result
+
+    def _active(self, conn, workshop, email):
+        return conn.execute(
+            "SELECT * FROM bookings WHERE workshop = ? AND email = ? AND status != 'cancelled'", (workshop, email)
+        ).fetchone()
+
+    def _register(self, workshop, email):
+        # One attempt; None when an existing booking was cancelled between
+        # the attempt and looking it up, and the attempt can be made again
+        conn = self._conn()
+        now = time.time()
+        # BEGIN IMMEDIATE takes the write lock up front, so the transaction
+        # never has to upgrade a read lock and fail with SQLITE_BUSY
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            claimed = conn.execute(
+                "UPDATE workshops SET booked = booked + 1 WHERE slug = ? AND booked < capacity", (workshop,)
+            ).rowcount
+            if not claimed and not conn.execute("SELECT 1 FROM workshops WHERE slug = ?", (workshop,)).fetchone():
+                raise ValueError(f"Unknown workshop {workshop!r}")
+            booking_id = conn.execute(
+                "INSERT INTO bookings (workshop, email, status, token, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (workshop, email, "confirmed" if claimed else "waitlisted", secrets.token_urlsafe(12), now, now),
+            ).lastrowid
+            row = conn.execute("SELECT * FROM bookings WHERE id = ?", (booking_id,)).fetchone()
+            booking = self._booking(conn, row)
+            conn.execute("COMMIT")
+            return booking, True
+        except sqlite3.IntegrityError:
+            # Already registered: the partial unique index rejected the
+            # insert, and the rollback gives back the seat claimed above
+            conn.execute("ROLLBACK")
+            row = self._active(conn, workshop, email)
+            return (self._booking(conn, row), False) if row else None
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def booking(self, token):
+        conn = self._conn()
+        row = conn.execute("SELECT * FROM bookings WHERE token = ?", (token.strip(),)).fetchone()
+        return self._booking(conn, row) if row else None
+
+    def cancel(self, token):
+        # Returns (cancelled booking, promoted booking); either can be None.
+        # The promoted booking is the waitlisted one that got the seat.
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Reading before writing is safe here: the write lock is held
+            row = conn.execute("SELECT * FROM bookings WHERE token = ? AND status != 'cancelled'",
+                               (token.strip(),)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None, None
+            conn.execute("UPDATE bookings SET status = 'cancelled', updated_at = ? WHERE id = ?", (now, row["id"]))
+            cancelled = Booking(row["id"], row["workshop"], row["email"], "cancelled", row["token"], None)
+            promoted = None
+            if row["status"] == "confirmed":
+                # The seat goes to the longest-waiting person, without
+                # passing through the counter
+                waiting = conn.execute(
+                    "SELECT * FROM bookings WHERE workshop = ? AND status = 'waitlisted' ORDER BY id LIMIT 1",
+                    (row["workshop"],),
+                ).fetchone()
+                if waiting is None:
+                    conn.execute("UPDATE workshops SET booked = booked - 1 WHERE slug = ?", (row["workshop"],))
+                else:
+                    conn.execute("UPDATE bookings SET status = 'confirmed', updated_at = ? WHERE id = ?",
+                                 (now, waiting["id"]))
+                    promoted = Booking(waiting["id"], waiting["workshop"], waiting["email"], "confirmed",
+                                       waiting["token"], None)
+            conn.execute("COMMIT")
+            return cancelled, promoted
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise